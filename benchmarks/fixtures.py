@@ -0,0 +1,103 @@
+import json
+from io import BytesIO
+
+from PIL import Image, ImageDraw
+
+# ----------------------------------------------------
+# 💡 벤치마크용 PokeAPI 응답 픽스처
+# ----------------------------------------------------
+# 실제 PokeAPI 응답과 같은 구조(필드 이름/URL 형식)의 pokemon, pokemon-species,
+# evolution-chain 응답과 스프라이트 PNG를 결정적으로 생성합니다.
+# URL은 공식 주소(pokeapi.co, raw.githubusercontent.com) 그대로이며,
+# pokeapi_client의 미러 모드 URL 변환을 통해 스텁 서버로 연결됩니다.
+
+API_ROOT = "https://pokeapi.co/api/v2"
+SPRITE_ROOT = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon"
+SPRITE_HOST = "https://raw.githubusercontent.com"
+
+OFFICIAL_ARTWORK_SIZE = 475
+FRONT_DEFAULT_SIZE = 96
+
+
+def _mirror_path(url):
+    """공식 URL을 스텁 서버(미러와 동일한 경로 체계) 경로로 바꿉니다."""
+    if url.startswith("https://pokeapi.co"):
+        return url[len("https://pokeapi.co"):]
+    return "/sprites" + url[len(SPRITE_HOST):]
+
+
+def make_sprite_png(size, seed):
+    """공식 일러스트와 비슷한 크기/투명 배경을 가진 PNG 바이트를 만듭니다."""
+    image = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    for i in range(12):
+        color = ((seed * 37 + i * 53) % 256, (seed * 91 + i * 17) % 256, (seed * 13 + i * 71) % 256, 255)
+        inset = size * i // 30
+        draw.ellipse((inset, inset + size * i // 80, size - inset - size * i // 60, size - inset),
+                     fill=color, outline=(0, 0, 0, 255))
+    buffer = BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def build_fixtures(chain_count=60, distinct_sprites=8):
+    """
+    스텁 서버가 응답할 {경로: (상태, Content-Type, 본문)} 딕셔너리와 포켓몬 ID 목록을 반환합니다.
+
+    진화 체인 c는 포켓몬 3c-2 → 3c-1 → 3c 로 구성되며, 5의 배수 체인은 진화가 없는
+    단일 포켓몬, 17의 배수 ID는 전설 포켓몬으로 만들어 generate_cache의 필터 경로도 거칩니다.
+    """
+    responses = {}
+    pokemon_ids = []
+
+    def add_json(url, payload):
+        responses[_mirror_path(url)] = (200, "application/json", json.dumps(payload).encode("utf-8"))
+
+    artwork = [make_sprite_png(OFFICIAL_ARTWORK_SIZE, seed) for seed in range(distinct_sprites)]
+    fronts = [make_sprite_png(FRONT_DEFAULT_SIZE, seed) for seed in range(distinct_sprites)]
+
+    chain_urls = [f"{API_ROOT}/evolution-chain/{c}/" for c in range(1, chain_count + 1)]
+    add_json(f"{API_ROOT}/evolution-chain/?limit=1000", {
+        "count": chain_count,
+        "results": [{"url": url} for url in chain_urls],
+    })
+
+    for c, chain_url in enumerate(chain_urls, start=1):
+        ids = [3 * c - 2] if c % 5 == 0 else [3 * c - 2, 3 * c - 1, 3 * c]
+        pokemon_ids.extend(ids)
+
+        node = None
+        for pokemon_id in reversed(ids):
+            node = {
+                "species": {"name": f"mon-{pokemon_id}", "url": f"{API_ROOT}/pokemon-species/{pokemon_id}/"},
+                "evolves_to": [node] if node else [],
+            }
+        add_json(chain_url, {"id": c, "chain": node})
+
+        for pokemon_id in ids:
+            add_json(f"{API_ROOT}/pokemon-species/{pokemon_id}/", {
+                "id": pokemon_id,
+                "name": f"mon-{pokemon_id}",
+                "is_legendary": pokemon_id % 17 == 0,
+                "is_mythical": False,
+                "names": [
+                    {"language": {"name": "en"}, "name": f"Mon {pokemon_id}"},
+                    {"language": {"name": "ko"}, "name": f"포켓몬{pokemon_id}"},
+                ],
+                "evolution_chain": {"url": chain_url},
+            })
+            front_url = f"{SPRITE_ROOT}/{pokemon_id}.png"
+            artwork_url = f"{SPRITE_ROOT}/other/official-artwork/{pokemon_id}.png"
+            add_json(f"{API_ROOT}/pokemon/{pokemon_id}/", {
+                "id": pokemon_id,
+                "name": f"mon-{pokemon_id}",
+                "species": {"name": f"mon-{pokemon_id}", "url": f"{API_ROOT}/pokemon-species/{pokemon_id}/"},
+                "sprites": {
+                    "front_default": front_url,
+                    "other": {"official-artwork": {"front_default": artwork_url}},
+                },
+            })
+            responses[_mirror_path(front_url)] = (200, "image/png", fronts[pokemon_id % distinct_sprites])
+            responses[_mirror_path(artwork_url)] = (200, "image/png", artwork[pokemon_id % distinct_sprites])
+
+    return responses, pokemon_ids
@@ -0,0 +1,269 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from io import BytesIO
+
+from PIL import Image
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import pokeapi_client
+from todomon_core import TodomonCore, PokemonDataService, ProfileRepository, Task
+from benchmarks.fixtures import build_fixtures, make_sprite_png, OFFICIAL_ARTWORK_SIZE
+from benchmarks.stub_server import StubServer
+
+# ----------------------------------------------------
+# 💡 헤드리스 벤치마크 스위트
+# ----------------------------------------------------
+#   python -m benchmarks.run_benchmarks                 # 전체 실행, bench_results/ 에 JSON 저장
+#   python -m benchmarks.run_benchmarks --quick         # 작은 규모로 빠르게 실행
+#   python -m benchmarks.run_benchmarks --compare a.json b.json
+#
+# 네트워크 없이 로컬 스텁 서버(benchmarks/stub_server.py)를 대상으로 실행됩니다.
+
+RESULTS_DIR = os.path.join(REPO_ROOT, "bench_results")
+TASK_COUNTS = (10, 100, 1000, 10000, 100000)
+QUICK_TASK_COUNTS = (10, 100, 1000)
+
+
+def _percentiles(samples_ms):
+    ordered = sorted(samples_ms)
+
+    def pick(p):
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p / 100))], 3)
+
+    return {
+        "count": len(ordered),
+        "p50_ms": pick(50),
+        "p99_ms": pick(99),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+# ------------------- 개별 벤치마크 -------------------
+
+def bench_generate_cache(chain_count):
+    import generate_cache
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        generate_cache.generate_base_ids_cache()
+        elapsed = time.perf_counter() - start
+    with open("base_ids.json", "r", encoding="utf-8") as f:
+        base_ids = json.load(f)
+    return {
+        "chains": chain_count,
+        "base_ids": len(base_ids),
+        "elapsed_s": round(elapsed, 3),
+        "chains_per_s": round(chain_count / elapsed, 1),
+    }
+
+
+def bench_fetch_pokemon_data(pokemon_ids):
+    service = PokemonDataService()
+    samples = []
+    failures = 0
+    with contextlib.redirect_stdout(io.StringIO()):
+        for pokemon_id in pokemon_ids:
+            start = time.perf_counter()
+            result = service.fetch_pokemon(pokemon_id)
+            samples.append((time.perf_counter() - start) * 1000)
+            failures += result is None
+    return {**_percentiles(samples), "failures": failures}
+
+
+def _make_core(task_count, repository):
+    core = TodomonCore(repository=repository)
+    core.username = f"bench_{task_count}"
+    # 이전 실행의 파일이 남아 있으면 다른 인스턴스의 변경으로 병합되므로 지우고 시작합니다.
+    if os.path.exists(repository.path_for(core.username)):
+        os.remove(repository.path_for(core.username))
+    core.xp.load(40, 2)
+    core.tasks.add_many(
+        Task(
+            f"벤치마크 태스크 {i}",
+            is_recurring=i % 4 == 0,
+            due_date="2099-12-31" if i % 5 == 0 else "",
+            is_completed=i % 3 == 0,
+        )
+        for i in range(task_count)
+    )
+    return core
+
+
+def bench_user_data(task_counts, repeats):
+    repository = ProfileRepository("user_data")
+    results = []
+    for task_count in task_counts:
+        core = _make_core(task_count, repository)
+        save_samples, load_samples = [], []
+        for repeat in range(repeats):
+            core.xp.load(40 + repeat % 2, 2)  # 내용이 같으면 저장을 건너뛰므로 매번 바꿔서 실제 쓰기를 측정
+            start = time.perf_counter()
+            core.save()
+            save_samples.append((time.perf_counter() - start) * 1000)
+
+            start = time.perf_counter()
+            TodomonCore(repository=repository).load(core.username)
+            load_samples.append((time.perf_counter() - start) * 1000)
+        results.append({
+            "tasks": task_count,
+            "save_ms": round(statistics.median(save_samples), 3),
+            "load_ms": round(statistics.median(load_samples), 3),
+            "file_bytes": os.path.getsize(repository.path_for(core.username)),
+        })
+    return results
+
+
+def bench_sprite_resize(iterations, target_size=(190, 190)):
+    png = make_sprite_png(OFFICIAL_ARTWORK_SIZE, seed=1)
+    decode_samples, resize_samples = [], []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        image = Image.open(BytesIO(png)).convert("RGBA")
+        decode_samples.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        image.resize(target_size, Image.Resampling.LANCZOS)
+        resize_samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "source_px": OFFICIAL_ARTWORK_SIZE,
+        "target_px": target_size[0],
+        "png_bytes": len(png),
+        "decode": _percentiles(decode_samples),
+        "resize": _percentiles(resize_samples),
+    }
+
+
+# ------------------- 실행 / 비교 -------------------
+
+def run(args):
+    chain_count = 15 if args.quick else args.chains
+    task_counts = QUICK_TASK_COUNTS if args.quick else TASK_COUNTS
+    fetch_count = 10 if args.quick else args.fetches
+
+    print("픽스처 생성 중...")
+    responses, pokemon_ids = build_fixtures(chain_count)
+
+    results = {}
+    original_cwd = os.getcwd()
+    # 💡 작업 디렉터리(프로필, 캐시 파일)는 측정이 끝나면 지웁니다.
+    with tempfile.TemporaryDirectory(prefix="todomon-bench-") as workdir:
+        os.chdir(workdir)
+        try:
+            with StubServer(responses, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms) as stub:
+                pokeapi_client.API_BASE_URL = stub.base_url
+
+                print("generate_base_ids_cache 측정 중...")
+                results["generate_cache"] = bench_generate_cache(chain_count)
+
+                print("PokemonDataService.fetch_pokemon 측정 중...")
+                results["fetch_pokemon_data"] = bench_fetch_pokemon_data(pokemon_ids[:fetch_count])
+
+            print("save_user_data / load_user_data 측정 중...")
+            results["user_data"] = bench_user_data(task_counts, repeats=1 if args.quick else 3)
+
+            print("스프라이트 리사이즈 측정 중...")
+            results["sprite_resize"] = bench_sprite_resize(20 if args.quick else 100)
+        finally:
+            os.chdir(original_cwd)
+
+    report = {
+        "meta": {
+            "commit": _git_commit(),
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "quick": args.quick,
+        },
+        "results": results,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"{report['meta']['commit']}-{stamp}.json")
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    print(f"결과 저장: {output}")
+
+
+def _flatten(value, prefix=""):
+    """중첩된 결과를 {"a.b.c": 숫자} 형태로 펼칩니다. 리스트는 'tasks' 값을 키로 사용합니다."""
+    flat = {}
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flat.update(_flatten(item, f"{prefix}{key}."))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            label = item.get("tasks", index) if isinstance(item, dict) else index
+            flat.update(_flatten(item, f"{prefix}{label}."))
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        flat[prefix.rstrip(".")] = value
+    return flat
+
+
+def compare(old_path, new_path):
+    """두 결과 파일의 수치를 나란히 비교해 출력합니다."""
+    with open(old_path, "r", encoding="utf-8") as f:
+        old = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+    old_flat, new_flat = _flatten(old["results"]), _flatten(new["results"])
+
+    print(f"{'metric':<45}{old['meta']['commit']:>12}{new['meta']['commit']:>12}{'change':>10}")
+    for key in sorted(set(old_flat) | set(new_flat)):
+        before, after = old_flat.get(key), new_flat.get(key)
+        if before is None or after is None:
+            change = "-"
+        elif before == 0:
+            change = "n/a"
+        else:
+            change = f"{(after - before) / before * 100:+.1f}%"
+        print(f"{key:<45}{before if before is not None else '-':>12}{after if after is not None else '-':>12}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Todomon 헤드리스 벤치마크")
+    parser.add_argument("--quick", action="store_true", help="작은 규모로 빠르게 실행")
+    parser.add_argument("--chains", type=int, default=120, help="스텁 서버의 진화 체인 수")
+    parser.add_argument("--fetches", type=int, default=50, help="fetch_pokemon 측정 횟수")
+    parser.add_argument("--latency-ms", type=float, default=20, help="요청마다 주입할 지연(ms)")
+    parser.add_argument("--jitter-ms", type=float, default=5, help="주입 지연의 ± 편차(ms)")
+    parser.add_argument("--output", help="결과 JSON 경로 (기본: bench_results/<commit>-<시각>.json)")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="두 결과 파일을 비교")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args)
+
+
+if __name__ == "__main__":
+    main()
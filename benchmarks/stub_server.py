@@ -0,0 +1,65 @@
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pokeapi_mirror import MirrorCache
+
+# ----------------------------------------------------
+# 💡 오프라인 벤치마크용 PokeAPI 스텁 서버
+# ----------------------------------------------------
+# 픽스처 응답을 미러와 같은 경로(/api/v2/..., /sprites/...)로 제공하며,
+# 요청마다 latency_ms ± jitter_ms 만큼의 지연을 주입합니다.
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-Alive 지원 (실제 서버와 비슷한 연결 재사용)
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 Nagle 지연이 측정값에 섞이지 않도록
+
+    responses = {}
+    latency_ms = 0
+    jitter_ms = 0
+
+    def do_GET(self):
+        delay_ms = self.latency_ms + random.uniform(-self.jitter_ms, self.jitter_ms)
+        if delay_ms > 0:
+            time.sleep(delay_ms / 1000)
+
+        status, content_type, body = self.responses.get(
+            MirrorCache.normalize_path(self.path), (404, "text/plain", b"Not Found")
+        )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """백그라운드 스레드에서 실행되는 픽스처 서버. with 문으로 사용합니다."""
+
+    def __init__(self, responses, latency_ms=0, jitter_ms=0, host="127.0.0.1", port=0):
+        handler = type("BoundStubRequestHandler", (StubRequestHandler,), {
+            "responses": responses,
+            "latency_ms": latency_ms,
+            "jitter_ms": jitter_ms,
+        })
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,208 @@
+import datetime
+import heapq
+import os
+import time
+
+# ----------------------------------------------------
+# 💡 마감일 알림 엔진 (최소 힙 + 타이머 하나)
+# ----------------------------------------------------
+# DeadlineQueue: (알림 시각, task id, 세대, 리드 타임) 항목을 최소 힙으로 관리합니다.
+#   태스크가 바뀌면 세대를 올려 예전 항목을 무효화(지연 삭제)하므로 전체 목록을 다시 훑지 않습니다.
+# DeadlineNotifier: 힙 맨 앞(가장 가까운 알림)에 맞춰 root.after 타이머 하나만 걸어 두고,
+#   깨어나면 BATCH_WINDOW_S 안에 몰린 알림을 한 번에 묶어 보여줍니다.
+#
+# 마감 시각은 마감일 다음 날 0시(마감일이 끝나는 시각)이며, 리드 타임은
+# TODOMON_DEADLINE_LEAD_HOURS="24,1" 처럼 쉼표로 구분해 바꿀 수 있습니다.
+# 이미 지난 알림 시각은 예약하지 않습니다. (로그인할 때마다 같은 알림이 반복되지 않도록)
+
+DATE_FORMAT = "%Y-%m-%d"
+DEFAULT_LEAD_HOURS = "24,1"
+BATCH_WINDOW_S = 60          # 이 시간 안에 몰린 알림은 한 번에 묶어서 표시
+MAX_SLEEP_MS = 60 * 60 * 1000  # 시스템 절전/시계 변경에 대비해 최대 1시간마다 다시 확인
+
+
+def lead_times_from_env():
+    """환경 변수에서 리드 타임(시간) 목록을 읽습니다. 잘못된 값은 기본값으로 대체합니다."""
+    raw = os.environ.get("TODOMON_DEADLINE_LEAD_HOURS", DEFAULT_LEAD_HOURS)
+    try:
+        hours = sorted({float(value) for value in raw.split(",") if value.strip()}, reverse=True)
+    except ValueError:
+        print(f"[deadline] 잘못된 TODOMON_DEADLINE_LEAD_HOURS 값: {raw}")
+        hours = [float(value) for value in DEFAULT_LEAD_HOURS.split(",")]
+    return [datetime.timedelta(hours=value) for value in hours]
+
+
+def deadline_for(due_date):
+    """마감일 문자열의 마감 시각(다음 날 0시, epoch 초)을 반환합니다. 형식이 잘못되면 None."""
+    try:
+        day = datetime.datetime.strptime(due_date, DATE_FORMAT)
+    except ValueError:
+        return None
+    return (day + datetime.timedelta(days=1)).timestamp()
+
+
+class DeadlineAlert:
+    """울릴 시각이 된 알림 하나입니다."""
+
+    def __init__(self, task, lead):
+        self.task = task
+        self.lead = lead
+
+    def describe(self):
+        hours = self.lead.total_seconds() / 3600
+        return f"'{self.task.name}' (마감일 {self.task.due_date}, {hours:g}시간 전 알림)"
+
+
+class DeadlineQueue:
+    """마감 임박 알림 시각의 최소 힙입니다. (UI 없음)"""
+
+    def __init__(self, lead_times=None):
+        self.lead_times = lead_times if lead_times is not None else lead_times_from_env()
+        self._heap = []            # (fire_ts, task_id, generation, lead_index)
+        self._scheduled = {}       # task_id -> (generation, Task, 남은 항목 수)
+        self._generation = 0
+        self._live_entries = 0
+
+    def __len__(self):
+        return self._live_entries
+
+    def clear(self):
+        self._heap = []
+        self._scheduled = {}
+        self._live_entries = 0
+
+    def _entries_for(self, task, now):
+        if not task.due_date or task.is_completed:
+            return []
+        deadline = deadline_for(task.due_date)
+        if deadline is None:
+            return []
+        self._generation += 1
+        entries = []
+        for lead_index, lead in enumerate(self.lead_times):
+            fire_ts = deadline - lead.total_seconds()
+            if fire_ts > now:
+                entries.append((fire_ts, task.id, self._generation, lead_index))
+        if entries:
+            self._scheduled[task.id] = (self._generation, task, len(entries))
+            self._live_entries += len(entries)
+        return entries
+
+    def schedule(self, task, now=None):
+        """태스크 하나의 알림을 (다시) 예약합니다. 완료됐거나 마감일이 없으면 예약만 해제됩니다."""
+        self.unschedule(task.id)
+        for entry in self._entries_for(task, now or time.time()):
+            heapq.heappush(self._heap, entry)
+        self._compact_if_needed()
+
+    def schedule_many(self, tasks, now=None):
+        """여러 태스크를 한 번에 예약합니다. 항목을 모아 힙을 한 번만 재구성합니다."""
+        now = now or time.time()
+        for task in tasks:
+            self.unschedule(task.id)
+            self._heap.extend(self._entries_for(task, now))
+        heapq.heapify(self._heap)
+        self._compact_if_needed()
+
+    def unschedule(self, task_id):
+        """예약을 해제합니다. 힙 항목은 세대 불일치로 나중에 버려집니다."""
+        scheduled = self._scheduled.pop(task_id, None)
+        if scheduled is not None:
+            self._live_entries -= scheduled[2]
+
+    def _is_live(self, entry):
+        scheduled = self._scheduled.get(entry[1])
+        return scheduled is not None and scheduled[0] == entry[2]
+
+    def _compact_if_needed(self):
+        """무효 항목이 살아 있는 항목보다 많아지면 힙을 정리합니다."""
+        if len(self._heap) > 2 * self._live_entries + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def next_fire_time(self):
+        """가장 가까운 알림 시각(epoch 초). 없으면 None."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now=None, window=BATCH_WINDOW_S):
+        """
+        now + window 까지 울려야 할 알림을 모두 꺼내 반환합니다.
+        한 태스크의 여러 리드 타임이 함께 걸리면 (절전 후 깨어난 경우 등) 가장 임박한 것 하나만 남깁니다.
+        """
+        limit = (now or time.time()) + window
+        alerts = {}
+        while self._heap and self._heap[0][0] <= limit:
+            entry = heapq.heappop(self._heap)
+            if not self._is_live(entry):
+                continue
+            generation, task, remaining = self._scheduled[entry[1]]
+            if remaining > 1:
+                self._scheduled[entry[1]] = (generation, task, remaining - 1)
+            else:
+                del self._scheduled[entry[1]]
+            self._live_entries -= 1
+            alerts[task.id] = DeadlineAlert(task, self.lead_times[entry[3]])
+        return list(alerts.values())
+
+
+class DeadlineNotifier:
+    """DeadlineQueue의 가장 가까운 알림 시각에 맞춰 root.after 타이머 하나를 유지합니다."""
+
+    def __init__(self, root, on_alerts, lead_times=None):
+        self.root = root
+        self.on_alerts = on_alerts
+        self.queue = DeadlineQueue(lead_times)
+        self._after_id = None
+        self._armed_at = None
+
+    def rebuild(self, tasks):
+        """로그인 시 전체 태스크로 힙을 한 번에 구성합니다."""
+        self.queue.clear()
+        self.queue.schedule_many(tasks)
+        self._arm()
+
+    def update(self, tasks):
+        """추가/완료/초기화 등으로 바뀐 태스크들만 다시 예약합니다."""
+        if len(tasks) == 1:
+            self.queue.schedule(tasks[0])
+        else:
+            self.queue.schedule_many(tasks)
+        self._arm()
+
+    def remove(self, task_ids):
+        for task_id in task_ids:
+            self.queue.unschedule(task_id)
+        self._arm()
+
+    def clear(self):
+        self.queue.clear()
+        self._cancel()
+
+    def _cancel(self):
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+            self._armed_at = None
+
+    def _arm(self):
+        """가장 가까운 알림 시각으로 타이머를 (다시) 겁니다. 이미 같은 시각에 걸려 있으면 그대로 둡니다."""
+        fire_ts = self.queue.next_fire_time()
+        if fire_ts is None:
+            self._cancel()
+            return
+        if self._after_id and self._armed_at is not None and self._armed_at <= fire_ts:
+            return
+        self._cancel()
+        delay_ms = min(MAX_SLEEP_MS, max(0, int((fire_ts - time.time()) * 1000)))
+        self._armed_at = time.time() + delay_ms / 1000
+        self._after_id = self.root.after(delay_ms, self._fire)
+
+    def _fire(self):
+        self._after_id = None
+        self._armed_at = None
+        alerts = self.queue.pop_due()
+        if alerts:
+            self.on_alerts(alerts)
+        self._arm()
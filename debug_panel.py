@@ -0,0 +1,134 @@
+import tkinter as tk
+from tkinter import filedialog, messagebox
+
+from memory_report import MemoryTracer, collect_report, format_report
+from net_metrics import METRICS
+
+# ----------------------------------------------------
+# 💡 숨겨진 디버그 패널 (Ctrl+Shift+D, 프로파일러 토글: Ctrl+Shift+P)
+# ----------------------------------------------------
+
+REFRESH_INTERVAL_MS = 1000
+
+
+class DebugPanel:
+    """네트워크 계측, 메인 루프 지연 현황을 표시하고 프로파일러를 제어하는 개발자용 창입니다."""
+
+    def __init__(self, app):
+        self.app = app
+        self.window = None
+        self.text = None
+        self.profiler_button = None
+        self.refresh_after_id = None
+        self.memory_tracer = MemoryTracer()
+
+    def toggle(self, event=None):
+        if self.window is not None and self.window.winfo_exists():
+            self.close()
+        else:
+            self.open()
+
+    def open(self):
+        self.window = tk.Toplevel(self.app.root)
+        self.window.title("Todomon 디버그")
+        self.window.geometry("560x520")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        button_frame = tk.Frame(self.window)
+        button_frame.pack(side="bottom", fill="x", padx=5, pady=5)
+        tk.Button(button_frame, text="JSONL 내보내기", command=self.export_metrics).pack(side="left")
+        tk.Button(button_frame, text="초기화", command=self.reset_metrics).pack(side="left", padx=5)
+        tk.Button(button_frame, text="메모리 스냅샷", command=self.take_memory_snapshot).pack(side="left")
+        tk.Button(button_frame, text="추적 중지", command=self.stop_memory_tracing).pack(side="left", padx=5)
+        self.profiler_button = tk.Button(button_frame, command=self.toggle_profiler)
+        self.profiler_button.pack(side="right")
+
+        self.text = tk.Text(self.window, font=("Courier", 10), wrap="none")
+        self.text.pack(fill="both", expand=True, padx=5, pady=(5, 0))
+
+        self.refresh()
+
+    def close(self):
+        if self.refresh_after_id:
+            self.app.root.after_cancel(self.refresh_after_id)
+            self.refresh_after_id = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+    def build_report(self):
+        """패널에 표시할 전체 텍스트를 만듭니다."""
+        sections = [
+            "[네트워크]\n" + METRICS.format_summary(),
+            "[UI 이벤트 루프]\n" + self.app.watchdog.format_summary(),
+            "[이벤트]\n" + self.app.event_metrics.format_summary(),
+            "[웜 스타트]\n" + self.app.speculative_login.format_summary(),
+            "[스프라이트 캐시]\n" + self.app.sprite_cache.format_summary(),
+            "[메모리]\n" + format_report(collect_report(self.app)),
+            "[tracemalloc]\n" + self.memory_tracer.format_summary(),
+        ]
+        return "\n\n".join(sections)
+
+    def refresh(self):
+        """패널이 열려 있는 동안 1초마다 내용을 갱신합니다."""
+        if self.refresh_after_id:
+            self.app.root.after_cancel(self.refresh_after_id)
+            self.refresh_after_id = None
+        if self.window is None or not self.window.winfo_exists():
+            return
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        self.text.insert("1.0", self.build_report())
+        self.text.config(state=tk.DISABLED)
+        self.profiler_button.config(text="프로파일러 중지" if self.app.profiler.is_running else "프로파일러 시작")
+        self.refresh_after_id = self.app.root.after(REFRESH_INTERVAL_MS, self.refresh)
+
+    def export_metrics(self):
+        path = filedialog.asksaveasfilename(
+            parent=self.window,
+            defaultextension=".jsonl",
+            filetypes=[("JSON Lines", "*.jsonl")],
+            initialfile="todomon_metrics.jsonl",
+        )
+        if not path:
+            return
+        try:
+            count = METRICS.export_jsonl(path)
+            messagebox.showinfo("내보내기 완료", f"요청 기록 {count}건을 저장했습니다.", parent=self.window)
+        except OSError as e:
+            messagebox.showerror("내보내기 오류", f"계측 데이터 저장 중 오류 발생: {e}", parent=self.window)
+
+    def toggle_profiler(self, event=None):
+        """샘플링 프로파일러를 시작하거나, 중지하고 결과를 collapsed stack 파일로 저장합니다."""
+        profiler = self.app.profiler
+        if not profiler.is_running:
+            profiler.start()
+            print("[profiler] 샘플링 시작")
+        else:
+            profiler.stop()
+            parent = self.window if self.window is not None and self.window.winfo_exists() else self.app.root
+            path = filedialog.asksaveasfilename(
+                parent=parent,
+                defaultextension=".folded",
+                filetypes=[("Collapsed stacks", "*.folded"), ("Text", "*.txt")],
+                initialfile="todomon_profile.folded",
+            )
+            if path:
+                count = profiler.dump(path)
+                print(f"[profiler] 샘플 {count}개 저장: {path}")
+        if self.window is not None and self.window.winfo_exists():
+            self.profiler_button.config(text="프로파일러 중지" if profiler.is_running else "프로파일러 시작")
+
+    def take_memory_snapshot(self):
+        """tracemalloc 스냅샷을 찍고 직전 스냅샷 대비 증가분을 콘솔과 패널에 표시합니다."""
+        diff = self.memory_tracer.take_snapshot()
+        print("[memory] 스냅샷 저장" + "".join(f"\n  {line}" for line in diff))
+        self.refresh()
+
+    def stop_memory_tracing(self):
+        self.memory_tracer.stop()
+        self.refresh()
+
+    def reset_metrics(self):
+        METRICS.reset()
+        self.refresh()
@@ -0,0 +1,182 @@
+import collections
+
+# ----------------------------------------------------
+# 💡 도메인 이벤트 버스 (프레임 단위 일괄 전달)
+# ----------------------------------------------------
+# TodomonCore는 상태가 바뀔 때 UI를 직접 부르지 않고 이벤트(TasksAdded, XpChanged 등)를 발행합니다.
+# 구독자(경험치 바, 태스크 목록, 저장, 미리 받기, 계측)는 한 프레임 동안 쌓인 이벤트를
+# 목록으로 한 번에 받아 한 번만 그리거나 저장합니다.
+# scheduler가 없으면(헤드리스, 벤치마크) 발행 즉시 전달합니다.
+# 발행과 전달은 모두 메인 스레드에서 합니다. (워커 결과는 root.after로 넘어온 뒤 코어에 반영됨)
+
+
+class DomainEvent:
+    """모든 도메인 이벤트의 기반 클래스입니다."""
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in vars(self).items())
+        return f"{type(self).__name__}({fields})"
+
+
+class TasksAdded(DomainEvent):
+    """태스크가 추가됨 (한 개 또는 가져오기로 여러 개)."""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+
+class TasksCompleted(DomainEvent):
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+
+class TasksReset(DomainEvent):
+    """반복 태스크의 완료 상태가 해제됨."""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+
+class TasksUpdated(DomainEvent):
+    """다른 인스턴스가 태스크 내용(이름, 반복, 마감일)을 바꿈."""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+
+class TasksRemoved(DomainEvent):
+    """태스크가 삭제되거나 정리됨."""
+
+    def __init__(self, tasks):
+        self.tasks = list(tasks)
+
+
+class XpChanged(DomainEvent):
+    """경험치가 바뀜. outcomes는 단계를 넘어 포켓몬이 바뀐 내역(EvolutionOutcome 목록)입니다."""
+
+    def __init__(self, amount, outcomes):
+        self.amount = amount
+        self.outcomes = list(outcomes)
+
+    @property
+    def levels(self):
+        return len(self.outcomes)
+
+
+class PokemonLoaded(DomainEvent):
+    """현재 포켓몬의 이름(데이터)이 로드됨."""
+
+    def __init__(self, pokemon_id, name):
+        self.pokemon_id = pokemon_id
+        self.name = name
+
+
+class EvolutionMapLoaded(DomainEvent):
+    """현재 포켓몬의 진화 체인이 로드됨."""
+
+    def __init__(self, pokemon_id, evolution_map):
+        self.pokemon_id = pokemon_id
+        self.evolution_map = evolution_map
+
+    @property
+    def next_ids(self):
+        return self.evolution_map.get(self.pokemon_id, [])
+
+
+class PokemonChanged(DomainEvent):
+    """다른 인스턴스의 변경을 병합하면서 현재 포켓몬이 바뀜. (이 인스턴스의 진화는 XpChanged로 처리)"""
+
+    def __init__(self, previous_id, pokemon_id):
+        self.previous_id = previous_id
+        self.pokemon_id = pokemon_id
+
+
+class ProfileChanged(DomainEvent):
+    """프로필이 통째로 적용되거나(로그인) 초기화됨(로그아웃, username=None)."""
+
+    def __init__(self, username):
+        self.username = username
+
+
+TASK_EVENTS = (TasksAdded, TasksCompleted, TasksReset, TasksUpdated, TasksRemoved)
+PERSISTED_EVENTS = TASK_EVENTS + (XpChanged,)
+
+
+class EventBus:
+    """
+    이벤트를 모아 두었다가 프레임마다 구독자에게 한 번에 전달합니다.
+
+    Args:
+        scheduler: flush 함수를 받아 다음 프레임에 한 번 실행되도록 예약하는 함수.
+            (예: lambda flush: root.after(16, flush)) None이면 발행 즉시 전달합니다.
+    """
+
+    def __init__(self, scheduler=None):
+        self.scheduler = scheduler
+        self._subscribers = []    # [(이벤트 클래스 튜플, handler(이벤트 목록))]
+        self._pending = []
+        self._flush_scheduled = False
+
+    def subscribe(self, handler, *event_types):
+        """event_types(생략 시 모든 이벤트)를 한 프레임 단위 목록으로 받는 구독자를 등록합니다."""
+        self._subscribers.append((event_types or (DomainEvent,), handler))
+
+    def unsubscribe(self, handler):
+        self._subscribers = [item for item in self._subscribers if item[1] != handler]
+
+    def publish(self, event):
+        if not self._subscribers:
+            return
+        self._pending.append(event)
+        if self.scheduler is None:
+            self.flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.scheduler(self.flush)
+
+    def flush(self):
+        """쌓인 이벤트를 구독자별로 걸러 한 번씩 전달합니다. (예약 전에 직접 불러도 됩니다)"""
+        self._flush_scheduled = False
+        events, self._pending = self._pending, []
+        if not events:
+            return
+        for event_types, handler in list(self._subscribers):
+            matching = [event for event in events if isinstance(event, event_types)]
+            if not matching:
+                continue
+            try:
+                handler(matching)
+            except Exception as e:
+                # 💡 한 구독자의 오류가 다른 구독자(특히 저장)를 막지 않도록 합니다.
+                print(f"[event_bus] 구독자 처리 중 오류 발생 ({getattr(handler, '__name__', handler)}): {e}")
+
+    def discard_pending(self):
+        """아직 전달되지 않은 이벤트를 버립니다. (예약된 flush는 빈 목록으로 끝남)"""
+        self._pending = []
+
+
+class EventMetrics:
+    """이벤트 스트림 구독자: 종류별 발행 수와 프레임당 묶음 크기를 집계합니다. (디버그 패널)"""
+
+    def __init__(self, bus=None):
+        self.counts = collections.Counter()
+        self.batches = 0
+        self.max_batch = 0
+        self.total_events = 0
+        if bus is not None:
+            bus.subscribe(self.on_events)
+
+    def on_events(self, events):
+        self.batches += 1
+        self.total_events += len(events)
+        self.max_batch = max(self.max_batch, len(events))
+        self.counts.update(type(event).__name__ for event in events)
+
+    def format_summary(self):
+        if not self.batches:
+            return "이벤트 없음"
+        counts = "  ".join(f"{name} {count}" for name, count in self.counts.most_common())
+        return (
+            f"{self.total_events}건 / {self.batches}프레임 "
+            f"(평균 {self.total_events / self.batches:.1f}, 최대 {self.max_batch})\n{counts}"
+        )
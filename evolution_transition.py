@@ -0,0 +1,90 @@
+from PIL import Image, ImageChops, ImageColor
+
+from image_pipeline import DISPLAY_BACKGROUND
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 PIL로 프레임을 하나씩 합성합니다. (결과는 같음)
+    np = None
+
+# ----------------------------------------------------
+# 💡 진화 전환 애니메이션 프레임 (워커 스레드에서 미리 계산)
+# ----------------------------------------------------
+# 이전 포켓몬 -> 흰 실루엣 -> (번쩍임) -> 새 포켓몬 실루엣 -> 새 포켓몬 순서로 바뀌는 프레임을 만듭니다.
+# 표시용 이미지는 이미 배경(Ivory)에 합성된 RGB이므로, 배경색과 다른 픽셀을 실루엣 마스크로 씁니다.
+# numpy가 있으면 모든 프레임을 키 프레임 행렬과 가중치 행렬의 곱 한 번으로 계산합니다.
+
+TRANSITION_FRAMES = 30
+TRANSITION_FRAME_MS = 33
+SILHOUETTE_COLOR = (255, 255, 255)
+MASK_THRESHOLD = 24        # 배경색과 이 값 이상 다른 채널이 있으면 포켓몬 픽셀로 봅니다.
+
+# 구간 경계 (전체 진행률): 원본 -> 실루엣 | 실루엣 교차(번쩍임) | 실루엣 -> 새 원본
+_PHASES = (0.4, 0.6)
+
+
+def _frame_plan(frame_count):
+    """프레임마다 (구간, 구간 안 진행률)을 계산합니다."""
+    plan = []
+    for index in range(frame_count):
+        t = index / max(1, frame_count - 1)
+        if t < _PHASES[0]:
+            plan.append((0, t / _PHASES[0]))
+        elif t < _PHASES[1]:
+            plan.append((1, (t - _PHASES[0]) / (_PHASES[1] - _PHASES[0])))
+        else:
+            plan.append((2, (t - _PHASES[1]) / (1 - _PHASES[1])))
+    return plan
+
+
+def _build_numpy(old_image, new_image, frame_count, background):
+    bg = np.array(background, dtype=np.float32)
+    old = np.asarray(old_image, dtype=np.float32)
+    new = np.asarray(new_image, dtype=np.float32)
+    white = np.array(SILHOUETTE_COLOR, dtype=np.float32)
+
+    def silhouette(pixels):
+        mask = (np.abs(pixels - bg).max(axis=2, keepdims=True) >= MASK_THRESHOLD).astype(np.float32)
+        return bg + (white - bg) * mask
+
+    # 키 프레임 4장(이전, 이전 실루엣, 새 실루엣, 새)을 (4, 픽셀 수) 행렬로 놓고,
+    # 프레임별 혼합 가중치 (프레임 수, 4) 행렬과 곱해 모든 프레임을 한 번에 계산합니다.
+    keyframes = np.stack([old, silhouette(old), silhouette(new), new]).reshape(4, -1)
+    weights = np.zeros((frame_count, 4), dtype=np.float32)
+    for index, (phase, weight) in enumerate(_frame_plan(frame_count)):
+        weights[index, phase] = 1 - weight
+        weights[index, phase + 1] = weight
+    frames = weights @ keyframes
+    frames += 0.5  # 반올림 (가중치 합이 1이므로 0~255 범위를 벗어나지 않음)
+    frames = frames.astype(np.uint8).reshape((frame_count,) + old.shape)
+    return [Image.fromarray(frame, "RGB") for frame in frames]
+
+
+def _silhouette_pil(image, background):
+    bg = Image.new("RGB", image.size, background)
+    red, green, blue = ImageChops.difference(image, bg).split()
+    diff = ImageChops.lighter(ImageChops.lighter(red, green), blue)  # 채널별 차이의 최댓값
+    mask = diff.point(lambda value: 255 if value >= MASK_THRESHOLD else 0)
+    return Image.composite(Image.new("RGB", image.size, SILHOUETTE_COLOR), bg, mask)
+
+
+def _build_pil(old_image, new_image, frame_count, background):
+    old_sil = _silhouette_pil(old_image, background)
+    new_sil = _silhouette_pil(new_image, background)
+    stages = ((old_image, old_sil), (old_sil, new_sil), (new_sil, new_image))
+    return [Image.blend(stages[phase][0], stages[phase][1], weight) for phase, weight in _frame_plan(frame_count)]
+
+
+def build_transition_frames(old_image, new_image, frame_count=TRANSITION_FRAMES, background=DISPLAY_BACKGROUND):
+    """
+    (워커 스레드) 이전/새 표시용 이미지로 전환 프레임 목록(RGB PIL Image)을 만듭니다.
+    두 이미지 크기가 다르면 새 이미지 크기에 맞춥니다.
+    """
+    old_image = old_image.convert("RGB")
+    new_image = new_image.convert("RGB")
+    if old_image.size != new_image.size:
+        old_image = old_image.resize(new_image.size, Image.Resampling.LANCZOS)
+    background = ImageColor.getrgb(background)
+    if np is not None:
+        return _build_numpy(old_image, new_image, frame_count, background)
+    return _build_pil(old_image, new_image, frame_count, background)
@@ -0,0 +1,78 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# ----------------------------------------------------
+# 💡 프로필 파일 권고(advisory) 잠금
+# ----------------------------------------------------
+# 같은 user_data/<이름>.json을 여러 Todomon 인스턴스(또는 이 잠금을 따르는 동기화 도구)가 쓸 때
+# "읽고 -> 병합하고 -> 쓰기"가 겹치지 않도록 <파일>.lock 옆 파일을 잠급니다.
+# 데이터 파일은 임시 파일 + os.replace로 바꾸므로(아이노드가 바뀜) 데이터 파일 자체가 아니라 옆 파일을 잠급니다.
+# POSIX는 fcntl.flock(공유/배타), Windows는 msvcrt.locking(배타만)을 사용합니다.
+
+LOCK_SUFFIX = ".lock"
+LOCK_TIMEOUT_S = 5.0
+LOCK_RETRY_S = 0.05
+
+
+class FileLock:
+    """
+    path + ".lock" 파일에 대한 잠금입니다. with 문으로 사용합니다.
+    LOCK_TIMEOUT_S 안에 잠그지 못하면 TimeoutError(OSError)를 발생시킵니다. (UI가 무한정 멈추지 않도록)
+
+    Args:
+        path (str): 보호할 데이터 파일 경로.
+        shared (bool): 읽기 전용 공유 잠금 여부. (Windows에서는 항상 배타 잠금)
+    """
+
+    def __init__(self, path, shared=False, timeout=LOCK_TIMEOUT_S):
+        self.lock_path = path + LOCK_SUFFIX
+        self.shared = shared
+        self.timeout = timeout
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.lock_path, "a+b")
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._try_lock()
+                return self
+            except (BlockingIOError, PermissionError):
+                if time.monotonic() >= deadline:
+                    self._file.close()
+                    self._file = None
+                    raise TimeoutError(f"프로필 잠금 대기 시간 초과: {self.lock_path}")
+                time.sleep(LOCK_RETRY_S)
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _try_lock(self):
+        if fcntl is not None:
+            mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(self._file.fileno(), mode | fcntl.LOCK_NB)
+        else:
+            self._file.seek(0)
+            msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+
+
+def replace_file(path, text):
+    """임시 파일에 쓴 뒤 한 번에 바꿔 넣습니다. (다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록)"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
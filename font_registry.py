@@ -0,0 +1,87 @@
+import ctypes
+import ctypes.util
+import functools
+import glob
+import os
+import re
+import sys
+from tkinter import font as tkfont
+
+# ----------------------------------------------------
+# 💡 공용 폰트 / 스타일 레지스트리
+# ----------------------------------------------------
+# - get_font: (글꼴, 크기, 취소선, 굵기) 조합마다 tkfont.Font를 하나만 만들어 모든 위젯이 공유합니다.
+#   (완료된 태스크마다 취소선 폰트를 새로 만들던 문제 해결)
+# - is_korean: 텍스트별 한글 포함 여부를 캐시합니다.
+# - register_bundled_fonts: 프로젝트 폴더의 .ttf/.otf 파일을 앱 실행 시 한 번만 등록합니다.
+#   Tk 루트를 만들기 전에 호출해야 Linux(fontconfig)에서 글꼴 목록에 반영됩니다.
+
+FONT_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_PATTERNS = ("*.ttf", "*.otf")
+
+_HANGUL_PATTERN = re.compile("[가-힣]")  # 가(0xAC00) ~ 힣(0xD7A3)
+
+_fonts = {}
+_registered_fonts = None
+
+
+def get_font(family, size, overstrike=False, weight="normal"):
+    """공유 폰트 객체를 반환합니다. (Tk 루트가 만들어진 뒤 호출)"""
+    key = (family, size, overstrike, weight)
+    font = _fonts.get(key)
+    if font is None:
+        font = tkfont.Font(family=family, size=size, overstrike=int(overstrike), weight=weight)
+        _fonts[key] = font
+    return font
+
+
+def font_count():
+    """레지스트리가 만든 폰트 객체 수 (메모리 점검용)."""
+    return len(_fonts)
+
+
+@functools.lru_cache(maxsize=4096)
+def is_korean(text):
+    """주어진 텍스트에 한글 음절이 포함되어 있는지 확인합니다. 같은 텍스트는 캐시된 결과를 씁니다."""
+    return bool(text) and _HANGUL_PATTERN.search(text) is not None
+
+
+def family_for_text(text, korean_family, default_family):
+    return korean_family if is_korean(text) else default_family
+
+
+def _register_font_file(path):
+    """운영체제별로 글꼴 파일을 현재 프로세스에 등록합니다. 성공하면 True."""
+    if sys.platform.startswith("win"):
+        FR_PRIVATE = 0x10
+        return ctypes.windll.gdi32.AddFontResourceExW(path, FR_PRIVATE, 0) > 0
+    if sys.platform == "darwin":
+        # CoreText 등록은 지원하지 않습니다. (글꼴을 직접 설치해야 함)
+        return False
+    library = ctypes.util.find_library("fontconfig")
+    if not library:
+        return False
+    fontconfig = ctypes.CDLL(library)
+    fontconfig.FcConfigAppFontAddFile.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+    return bool(fontconfig.FcConfigAppFontAddFile(None, os.fsencode(path)))
+
+
+def register_bundled_fonts(font_dir=FONT_DIR):
+    """프로젝트 폴더의 글꼴 파일을 한 번만 등록하고, 등록된 파일 이름 목록을 반환합니다."""
+    global _registered_fonts
+    if _registered_fonts is not None:
+        return _registered_fonts
+
+    _registered_fonts = []
+    for pattern in FONT_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(font_dir, pattern))):
+            try:
+                registered = _register_font_file(path)
+            except (OSError, AttributeError) as e:
+                print(f"글꼴 등록 중 오류 발생 ({os.path.basename(path)}): {e}")
+                continue
+            if registered:
+                _registered_fonts.append(os.path.basename(path))
+    if _registered_fonts:
+        print(f"글꼴 등록 완료: {', '.join(_registered_fonts)}")
+    return _registered_fonts
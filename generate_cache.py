@@ -4,10 +4,12 @@ import json
 import os
 import time
 
+import pokeapi_client
+
 def fetch_base_id_from_chain(chain_detail_url):
     """주어진 진화 체인 URL에서 미진화체 포켓몬 ID를 추출합니다."""
     try:
-        detail_response = requests.get(chain_detail_url, timeout=5)
+        detail_response = pokeapi_client.get(chain_detail_url, timeout=5)
         if detail_response.status_code != 200:
             return None
             
@@ -30,8 +32,8 @@ def fetch_base_id_from_chain(chain_detail_url):
         pokemon_id = int(pokemon_id_str)
             
         # 전설/환상 포켓몬 필터링을 위해 종족 정보 요청
-        species_url = f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_id}"
-        species_response = requests.get(species_url, timeout=5)
+        species_url = pokeapi_client.api_url(f"pokemon-species/{pokemon_id}")
+        species_response = pokeapi_client.get(species_url, timeout=5)
         if species_response.status_code != 200: return None
             
         species_data = species_response.json()
@@ -51,10 +53,10 @@ def generate_base_ids_cache():
     print("--- 캐시 파일 생성 시작 (PokeAPI 요청) ---")
     
     # 전체 진화 체인 목록을 요청 (약 500개)
-    chain_list_url = "https://pokeapi.co/api/v2/evolution-chain/?limit=1000" 
+    chain_list_url = pokeapi_client.api_url("evolution-chain/?limit=1000")
     
     try:
-        response = requests.get(chain_list_url, timeout=10)
+        response = pokeapi_client.get(chain_list_url, timeout=10)
         response.raise_for_status() 
         all_chain_urls = [res['url'] for res in response.json().get('results', [])]
         base_ids = []
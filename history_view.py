@@ -0,0 +1,59 @@
+import tkinter as tk
+
+# ----------------------------------------------------
+# 💡 완료 기록 창 (보관함 세그먼트를 필요할 때만 한 페이지씩 읽음)
+# ----------------------------------------------------
+
+
+class HistoryView:
+    """보관된 완료 태스크를 최신 순으로 보여주는 창입니다. '더 보기'를 누를 때마다 다음 세그먼트를 읽습니다."""
+
+    def __init__(self, app):
+        self.app = app
+        self.window = None
+        self.listbox = None
+        self.more_button = None
+        self.status_label = None
+        self._pages = None
+        self._shown = 0
+
+    def open(self):
+        if self.window is not None and self.window.winfo_exists():
+            self.window.lift()
+            return
+        self.window = tk.Toplevel(self.app.root)
+        self.window.title("완료 기록")
+        self.window.geometry("320x420")
+        self.window.protocol("WM_DELETE_WINDOW", self.close)
+
+        button_frame = tk.Frame(self.window, bg="Ivory")
+        button_frame.pack(side="bottom", fill="x", padx=5, pady=5)
+        self.more_button = tk.Button(button_frame, text="더 보기", font=self.app.korean_font, command=self.load_next_page)
+        self.more_button.pack(side="right")
+        self.status_label = tk.Label(button_frame, bg="Ivory", font=("DungGeunMo", 10))
+        self.status_label.pack(side="left")
+
+        self.listbox = tk.Listbox(self.window, font=self.app.korean_font, bg="Ivory", activestyle="none")
+        self.listbox.pack(fill="both", expand=True, padx=5, pady=(5, 0))
+
+        self._pages = self.app.core.iter_archive_pages()
+        self._shown = 0
+        self.load_next_page()
+
+    def close(self):
+        self._pages = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
+
+    def load_next_page(self):
+        """다음(더 오래된) 세그먼트 하나를 읽어 목록 끝에 붙입니다."""
+        page = next(self._pages, None) if self._pages is not None else None
+        if page is None:
+            self.more_button.config(state=tk.DISABLED)
+            if self._shown == 0:
+                self.listbox.insert(tk.END, "보관된 완료 태스크가 없습니다.")
+        else:
+            self.listbox.insert(tk.END, *(f"{task.completed_at}  {task.name}" for task in page))
+            self._shown += len(page)
+        self.status_label.config(text=f"{self._shown}개 표시")
@@ -0,0 +1,76 @@
+from io import BytesIO
+
+from PIL import Image, ImageColor
+
+# ----------------------------------------------------
+# 💡 워커 스레드용 이미지 파이프라인 (디코딩 -> RGBA 변환 -> 축소 -> 배경 합성)
+# ----------------------------------------------------
+# 메인(Tk) 스레드는 이 모듈이 만든 "표시용" 이미지를 ImageTk.PhotoImage로 감싸기만 합니다.
+# Tk의 PhotoImage는 알파를 미리 곱한(premultiplied) 버퍼를 받지 않으므로,
+# 투명 영역을 레이블 배경색(Ivory)에 미리 합성해 알파 없는 RGB 이미지로 넘깁니다.
+# (배경과 합성하는 것이 곧 알파 곱하기이고, 이후 Tk는 픽셀을 그대로 복사만 합니다.)
+
+DISPLAY_BACKGROUND = "Ivory"
+
+
+def prepare_display_image(source, size, background=DISPLAY_BACKGROUND):
+    """
+    (워커 스레드) 원본 이미지(PIL Image 또는 bytes)를 size 크기의 표시용 RGB 이미지로 만듭니다.
+
+    Args:
+        source: PIL Image 객체 또는 인코딩된 이미지 바이트.
+        size (tuple): (가로, 세로) 표시 크기.
+        background (str): 투명 영역을 합성할 배경색.
+    """
+    image = Image.open(BytesIO(source)) if isinstance(source, (bytes, bytearray)) else source
+    image = image.convert("RGBA")
+    if image.size != tuple(size):
+        # reducing_gap: 큰 원본은 정수 배율로 먼저 줄인 뒤 LANCZOS를 적용해 속도를 높입니다.
+        image = image.resize(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+    canvas = Image.new("RGBA", image.size, ImageColor.getrgb(background) + (255,))
+    canvas.alpha_composite(image)
+    return canvas.convert("RGB")
+
+
+def load_gif_frames(path, size, background=DISPLAY_BACKGROUND):
+    """(워커 스레드) GIF의 모든 프레임을 표시용 RGB 이미지 목록으로 만듭니다. 파일이 없으면 빈 목록."""
+    try:
+        with Image.open(path) as gif:
+            frames = []
+            for index in range(getattr(gif, "n_frames", 1)):
+                gif.seek(index)
+                frames.append(prepare_display_image(gif, size, background))
+            return frames
+    except FileNotFoundError:
+        print(f"오류: GIF 파일 '{path}'을 찾을 수 없습니다. 현재 디렉토리에 있는지 확인하세요.")
+        return []
+    except Exception as e:
+        print(f"GIF 파일 로드 중 오류 발생: {e}")
+        return []
+
+
+DEFAULT_FRAME_MS = 100
+
+
+def stream_gif_frames(source, size, background=DISPLAY_BACKGROUND):
+    """
+    (워커 스레드) 애니메이션 GIF를 한 프레임씩 디코딩해 (표시용 이미지, 표시 시간 ms)를 돌려주는 제너레이터입니다.
+    모든 프레임을 한꺼번에 만들지 않으므로, 소비하는 쪽이 멈추면 디코딩도 멈춥니다.
+    """
+    with Image.open(BytesIO(source) if isinstance(source, (bytes, bytearray)) else source) as gif:
+        for index in range(getattr(gif, "n_frames", 1)):
+            gif.seek(index)
+            duration = gif.info.get("duration") or DEFAULT_FRAME_MS
+            yield prepare_display_image(gif, size, background), duration
+
+
+def fetch_display_pokemon(pokemon_service, pokemon_id, size, background=DISPLAY_BACKGROUND):
+    """
+    (워커 스레드) 포켓몬을 다운로드하고 표시용 이미지까지 만들어 (표시용 이미지, 이름, ID)를 반환합니다.
+    실패 시 None. 원본 해상도 이미지는 이 함수 안에서만 쓰이고 메인 스레드로 넘어가지 않습니다.
+    """
+    result = pokemon_service.fetch_pokemon(pokemon_id, target_px=max(size))
+    if not result:
+        return None
+    raw_image, name, p_id = result
+    return (prepare_display_image(raw_image, size, background), name, p_id)
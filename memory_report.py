@@ -0,0 +1,191 @@
+import gc
+import sys
+import time
+import tracemalloc
+from tkinter import font as tkfont
+
+import font_registry
+import task_index
+
+# ----------------------------------------------------
+# 💡 메모리 사용량 보고서 / 누수 추적 (디버그 패널용)
+# ----------------------------------------------------
+# collect_report: 항목별(위젯, 폰트, 이미지, 예약된 타이머, 캐시) 개수와 추정 바이트를 모읍니다.
+#   위젯 수는 tkinter가 관리하는 children 딕셔너리를 따라가며 세므로 Tcl 호출이 거의 없습니다.
+# MemoryTracer: tracemalloc 스냅샷을 찍고 직전 스냅샷과의 차이(늘어난 할당 위치)를 보여줍니다.
+#   tracemalloc은 느려지므로 첫 스냅샷을 요청할 때만 켭니다.
+#   Python 객체 수(gc.get_objects)도 힙 전체를 훑으므로 1초 갱신에서는 세지 않고 스냅샷 때만 셉니다.
+
+TRACE_FRAMES = 10
+TOP_DIFFS = 10
+
+
+def _count_widgets(root):
+    """root 아래 위젯 수를 클래스 이름별로 셉니다."""
+    counts = {}
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        name = type(widget).__name__
+        counts[name] = counts.get(name, 0) + 1
+        stack.extend(widget.children.values())
+    return counts
+
+
+def _tk_images(root):
+    """Tk 인터프리터에 살아 있는 이미지 수와 추정 바이트 (photo 이미지는 픽셀당 4바이트)."""
+    count = 0
+    nbytes = 0
+    for name in root.image_names():
+        count += 1
+        try:
+            if root.tk.call("image", "type", name) == "photo":
+                nbytes += int(root.tk.call("image", "width", name)) * int(root.tk.call("image", "height", name)) * 4
+        except Exception:
+            continue
+    return count, nbytes
+
+
+def _pending_timers(root):
+    """after로 예약된 타이머/idle 콜백 수."""
+    timers = idle = 0
+    for after_id in root.tk.splitlist(root.tk.call("after", "info")):
+        try:
+            kind = root.tk.splitlist(root.tk.call("after", "info", after_id))[1]
+        except Exception:
+            continue
+        if kind == "idle":
+            idle += 1
+        else:
+            timers += 1
+    return timers, idle
+
+
+def _cache_line(name, info):
+    return f"{name}: {info.currsize}/{info.maxsize} (hit {info.hits}, miss {info.misses})"
+
+
+def collect_report(app):
+    """앱의 메모리 관련 현황을 {항목: 값} 딕셔너리로 모읍니다. (메인 스레드에서 호출)"""
+    root = app.root
+    widgets = _count_widgets(root)
+    image_count, image_bytes = _tk_images(root)
+    timers, idle = _pending_timers(root)
+    sprite_stats = app.sprite_cache.stats()
+    report = {
+        "widgets": sum(widgets.values()),
+        "widgets_by_class": widgets,
+        "task_items": len(app.task_items),
+        "tasks": len(app.core.tasks),
+        "fonts_registry": font_registry.font_count(),
+        "fonts_tk": len(tkfont.names(root)),
+        "tk_images": image_count,
+        "tk_image_bytes": image_bytes,
+        "loading_frames": sum(frame is not None for frame in app.loading_gif_frames),
+        "pending_timers": timers,
+        "pending_idle": idle,
+        "sprite_cache_entries": sprite_stats["entries"],
+        "sprite_cache_bytes": sprite_stats["bytes"],
+        "caches": [
+            _cache_line("normalize_token", task_index.normalize_token.cache_info()),
+            _cache_line("is_korean", font_registry.is_korean.cache_info()),
+        ],
+        "peak_rss_bytes": process_rss_bytes(),
+    }
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        report["traced_bytes"] = current
+        report["traced_peak_bytes"] = peak
+    return report
+
+
+def format_report(report):
+    """디버그 패널에 표시할 텍스트 요약을 만듭니다."""
+    top_classes = sorted(report["widgets_by_class"].items(), key=lambda item: -item[1])[:4]
+    lines = [
+        f"위젯 {report['widgets']}개 ({', '.join(f'{name} {count}' for name, count in top_classes)})",
+        f"태스크 {report['tasks']}개 / TaskItem {report['task_items']}개",
+        f"폰트 레지스트리 {report['fonts_registry']}개 / Tk 폰트 {report['fonts_tk']}개",
+        f"Tk 이미지 {report['tk_images']}개 {report['tk_image_bytes'] / 1024:.0f}KB (로딩 프레임 {report['loading_frames']}개)",
+        f"예약된 타이머 {report['pending_timers']}개, idle {report['pending_idle']}개",
+        f"스프라이트 캐시 {report['sprite_cache_entries']}개 {report['sprite_cache_bytes'] / 1024:.0f}KB",
+    ]
+    lines.extend(report["caches"])
+    if report["peak_rss_bytes"] is not None:
+        lines.append(f"최대 RSS {report['peak_rss_bytes'] / 1024 / 1024:.1f}MB")
+    if "traced_bytes" in report:
+        lines.append(
+            f"tracemalloc {report['traced_bytes'] / 1024 / 1024:.1f}MB (peak {report['traced_peak_bytes'] / 1024 / 1024:.1f}MB)"
+        )
+    return "\n".join(lines)
+
+
+class MemoryTracer:
+    """tracemalloc 스냅샷을 찍고 직전 스냅샷 대비 늘어난 할당 위치를 보여줍니다."""
+
+    def __init__(self, frames=TRACE_FRAMES):
+        self.frames = frames
+        self.previous = None
+        self.previous_at = None
+        self.last_diff = []
+        self.gc_objects = None
+        self.gc_objects_diff = None
+
+    @property
+    def is_tracing(self):
+        return tracemalloc.is_tracing()
+
+    def take_snapshot(self):
+        """스냅샷을 찍습니다. 직전 스냅샷이 있으면 차이를 last_diff에 남기고 줄 목록으로 반환합니다."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ))
+        now = time.time()
+        gc_objects = len(gc.get_objects())
+        self.gc_objects_diff = None if self.gc_objects is None else gc_objects - self.gc_objects
+        self.gc_objects = gc_objects
+        if self.previous is None:
+            self.last_diff = []
+        else:
+            stats = snapshot.compare_to(self.previous, "lineno")
+            self.last_diff = [
+                f"{stat.size_diff / 1024:+.1f}KB ({stat.count_diff:+d}) {stat.traceback[0]}"
+                for stat in stats[:TOP_DIFFS] if stat.size_diff
+            ]
+        self.previous = snapshot
+        self.previous_at = now
+        return self.last_diff
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self.previous = None
+        self.previous_at = None
+        self.last_diff = []
+        self.gc_objects = None
+        self.gc_objects_diff = None
+
+    def format_summary(self):
+        if self.previous is None:
+            return "꺼짐 (스냅샷 버튼으로 시작)"
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.previous_at))
+        objects = f"Python 객체 {self.gc_objects}개"
+        if self.gc_objects_diff is not None:
+            objects += f" ({self.gc_objects_diff:+d})"
+        lines = [f"마지막 스냅샷 {stamp}", objects]
+        lines.extend(self.last_diff or ["(직전 스냅샷 대비 차이 없음)"])
+        return "\n".join(lines)
+
+
+def process_rss_bytes():
+    """프로세스 최대 RSS(바이트). 지원하지 않는 플랫폼이면 None."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
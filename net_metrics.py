@@ -0,0 +1,183 @@
+import collections
+import json
+import threading
+import time
+from urllib.parse import urlparse
+
+# ----------------------------------------------------
+# 💡 네트워크 계측 (엔드포인트별 지연시간 히스토그램 / 전송량)
+# ----------------------------------------------------
+# PokeAPI/스프라이트 요청마다 엔드포인트 종류, 상태, 지연시간, 바이트 수,
+# 캐시 적중 여부, 재시도 횟수를 기록합니다. 숨겨진 디버그 패널에서 확인하고
+# JSON Lines로 내보낼 수 있습니다.
+
+MAX_RECENT_RECORDS = 5000
+
+
+def _bucket_bounds():
+    """1ms ~ 60초 구간을 1.25배 간격으로 나눈 히스토그램 경계값(ms)."""
+    bounds = []
+    bound = 1.0
+    while bound < 60000:
+        bounds.append(round(bound, 3))
+        bound *= 1.25
+    bounds.append(float("inf"))
+    return bounds
+
+
+BUCKET_BOUNDS_MS = _bucket_bounds()
+
+
+def classify_url(url):
+    """URL을 엔드포인트 종류(pokemon, pokemon-species, evolution-chain, sprite 등)로 분류합니다."""
+    path = urlparse(url).path
+    if "/api/v2/" in path:
+        parts = path.split("/api/v2/", 1)[1].strip("/").split("/")
+        return parts[0] or "api"
+    return "sprite"
+
+
+class LatencyHistogram:
+    """고정 로그 구간 히스토그램. 백분위수는 구간 내 선형 보간으로 추정합니다."""
+
+    def __init__(self):
+        self.counts = [0] * len(BUCKET_BOUNDS_MS)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, latency_ms):
+        index = 0
+        while latency_ms > BUCKET_BOUNDS_MS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.max_ms = max(self.max_ms, latency_ms)
+
+    def percentile(self, p):
+        if self.count == 0:
+            return 0.0
+        target = self.count * p / 100.0
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if bucket_count and seen + bucket_count >= target:
+                lower = BUCKET_BOUNDS_MS[index - 1] if index > 0 else 0.0
+                upper = min(BUCKET_BOUNDS_MS[index], self.max_ms)
+                ratio = (target - seen) / bucket_count
+                return lower + (max(upper, lower) - lower) * ratio
+            seen += bucket_count
+        return self.max_ms
+
+
+class EndpointStats:
+    """엔드포인트 하나의 누적 통계."""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.statuses = collections.Counter()
+        self.bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.retries = 0
+
+    def to_dict(self):
+        return {
+            "count": self.histogram.count,
+            "p50_ms": round(self.histogram.percentile(50), 2),
+            "p95_ms": round(self.histogram.percentile(95), 2),
+            "p99_ms": round(self.histogram.percentile(99), 2),
+            "max_ms": round(self.histogram.max_ms, 2),
+            "mean_ms": round(self.histogram.total_ms / self.histogram.count, 2) if self.histogram.count else 0.0,
+            "bytes": self.bytes,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "retries": self.retries,
+            "statuses": dict(self.statuses),
+        }
+
+
+class NetworkMetrics:
+    """프로세스 내 네트워크 계측 저장소. 여러 워커 스레드에서 동시에 기록할 수 있습니다."""
+
+    def __init__(self, max_records=MAX_RECENT_RECORDS):
+        self._lock = threading.Lock()
+        self._endpoints = collections.defaultdict(EndpointStats)
+        self._records = collections.deque(maxlen=max_records)
+
+    def record(self, endpoint, status, latency_ms, nbytes=0, cache=None, retries=0):
+        """
+        요청 하나의 결과를 기록합니다.
+
+        Args:
+            endpoint (str): 엔드포인트 종류 (classify_url 결과 또는 임의 이름).
+            status: HTTP 상태 코드 또는 "ok"/예외 이름 등의 문자열.
+            cache (str | None): 미러의 X-Todomon-Cache 값 ("HIT", "MISS", "COALESCED"). 없으면 None.
+        """
+        with self._lock:
+            stats = self._endpoints[endpoint]
+            stats.histogram.add(latency_ms)
+            stats.statuses[str(status)] += 1
+            stats.bytes += nbytes
+            stats.retries += retries
+            if cache == "HIT":
+                stats.cache_hits += 1
+            elif cache is not None:
+                stats.cache_misses += 1
+            self._records.append({
+                "ts": time.time(),
+                "endpoint": endpoint,
+                "status": status,
+                "latency_ms": round(latency_ms, 3),
+                "bytes": nbytes,
+                "cache": cache,
+                "retries": retries,
+            })
+
+    def percentile(self, endpoint, p):
+        """엔드포인트의 지연시간 p 백분위수(ms). 기록이 없으면 0.0."""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            return stats.histogram.percentile(p) if stats else 0.0
+
+    def sample_count(self, endpoint):
+        """엔드포인트에 기록된 요청 수."""
+        with self._lock:
+            stats = self._endpoints.get(endpoint)
+            return stats.histogram.count if stats else 0
+
+    def snapshot(self):
+        """엔드포인트별 요약 통계를 딕셔너리로 반환합니다."""
+        with self._lock:
+            return {name: stats.to_dict() for name, stats in sorted(self._endpoints.items())}
+
+    def format_summary(self):
+        """디버그 패널에 표시할 텍스트 요약을 만듭니다."""
+        lines = [f"{'endpoint':<22}{'n':>6}{'p50':>9}{'p99':>9}{'KB':>9}{'hit/miss':>10}{'retry':>6}"]
+        for name, stats in self.snapshot().items():
+            lines.append(
+                f"{name:<22}{stats['count']:>6}{stats['p50_ms']:>8.0f}m{stats['p99_ms']:>8.0f}m"
+                f"{stats['bytes'] / 1024:>9.1f}{stats['cache_hits']:>5}/{stats['cache_misses']:<4}{stats['retries']:>6}"
+            )
+        return "\n".join(lines)
+
+    def export_jsonl(self, path):
+        """최근 요청 기록과 엔드포인트별 요약을 JSON Lines 형식으로 저장합니다."""
+        with self._lock:
+            records = list(self._records)
+        summary = self.snapshot()
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps({"type": "request", **record}, ensure_ascii=False) + "\n")
+            for name, stats in summary.items():
+                f.write(json.dumps({"type": "summary", "endpoint": name, **stats}, ensure_ascii=False) + "\n")
+        return len(records)
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._records.clear()
+
+
+# 💡 앱 전체에서 공유하는 계측 인스턴스
+METRICS = NetworkMetrics()
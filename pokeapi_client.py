@@ -0,0 +1,346 @@
+import concurrent.futures
+import os
+import socket
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from net_metrics import METRICS, classify_url
+
+# ----------------------------------------------------
+# 💡 PokeAPI 접속 주소 설정
+# ----------------------------------------------------
+# 기본값은 공식 PokeAPI 입니다. 로컬 미러(pokeapi_mirror.py)를 사용할 때는
+# 환경 변수 TODOMON_API_BASE_URL 에 미러 주소를 지정합니다.
+#   예) TODOMON_API_BASE_URL=http://192.168.0.10:8765 python todomon1.py
+DEFAULT_API_BASE_URL = "https://pokeapi.co"
+SPRITE_BASE_URL = "https://raw.githubusercontent.com"
+MIRROR_SPRITE_PREFIX = "/sprites"
+
+API_BASE_URL = os.environ.get("TODOMON_API_BASE_URL", DEFAULT_API_BASE_URL).rstrip("/")
+
+# 💡 스프라이트 헤지(hedged) 요청용 대체 호스트 (로컬 미러 주소). 비어 있으면 헤지하지 않습니다.
+#   예) TODOMON_SPRITE_HEDGE_URL=http://192.168.0.10:8765
+HEDGE_BASE_URL = os.environ.get("TODOMON_SPRITE_HEDGE_URL", "").rstrip("/")
+HEDGE_PERCENTILE = 95
+HEDGE_MIN_SAMPLES = 20          # 이보다 기록이 적으면 기본 지연을 사용
+HEDGE_DEFAULT_DELAY_MS = 1000
+HEDGE_MIN_DELAY_MS = 50
+
+_hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="hedge")
+
+_thread_local = threading.local()
+
+
+def is_mirror_mode():
+    """기본 PokeAPI 대신 다른 주소(로컬 미러)를 사용 중인지 여부를 반환합니다."""
+    return API_BASE_URL != DEFAULT_API_BASE_URL
+
+
+def api_url(path):
+    """'pokemon/1/' 과 같은 상대 경로를 설정된 주소의 /api/v2/ URL로 변환합니다."""
+    return f"{API_BASE_URL}/api/v2/{path.lstrip('/')}"
+
+
+def resolve_url(url):
+    """
+    API 응답에 포함된 절대 URL(pokeapi.co, 스프라이트 호스트)을 설정된 주소로 바꿉니다.
+    미러 모드가 아니면 URL을 그대로 반환합니다.
+    """
+    if not url or not is_mirror_mode():
+        return url
+    if url.startswith(DEFAULT_API_BASE_URL):
+        return API_BASE_URL + url[len(DEFAULT_API_BASE_URL):]
+    if url.startswith(SPRITE_BASE_URL):
+        return API_BASE_URL + MIRROR_SPRITE_PREFIX + url[len(SPRITE_BASE_URL):]
+    return url
+
+
+def scaled_sprite_url(url, width):
+    """
+    미러가 width 픽셀로 줄여서 제공하는 스프라이트 URL을 반환합니다. (pokeapi_mirror의 ?w= 변형)
+    미러 모드가 아니거나 스프라이트 URL이 아니면 None.
+    """
+    if not is_mirror_mode() or not url or not url.startswith(SPRITE_BASE_URL) or "?" in url:
+        return None
+    return f"{url}?w={int(width)}"
+
+
+def hedge_url(url):
+    """스프라이트 URL의 대체 호스트(미러) URL을 반환합니다. 설정이 없거나 주 요청과 같은 주소면 None."""
+    if not HEDGE_BASE_URL or not url or not url.startswith(SPRITE_BASE_URL):
+        return None
+    alternate = HEDGE_BASE_URL + MIRROR_SPRITE_PREFIX + url[len(SPRITE_BASE_URL):]
+    return alternate if alternate != resolve_url(url) else None
+
+
+def hedge_delay_ms(endpoint="sprite"):
+    """헤지 요청을 보내기 전 기다릴 시간(ms). 충분히 기록이 쌓이면 해당 엔드포인트의 p95를 씁니다."""
+    if METRICS.sample_count(endpoint) < HEDGE_MIN_SAMPLES:
+        return HEDGE_DEFAULT_DELAY_MS
+    return max(HEDGE_MIN_DELAY_MS, METRICS.percentile(endpoint, HEDGE_PERCENTILE))
+
+
+def _session():
+    """스레드별 requests.Session을 반환합니다. (Keep-Alive 연결 재사용)"""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _thread_local.session = session
+    return session
+
+
+# ----------------------------------------------------
+# 💡 헤지 요청 취소용 연결
+# ----------------------------------------------------
+# 승부가 나면 진 쪽의 소켓을 shutdown 해서, 헤더를 기다리며 막혀 있던 헤지 스레드를 바로 풀어줍니다.
+# (그대로 두면 멈춘 주 요청이 timeout까지 워커를 붙잡아 다음 헤지 요청이 그 뒤에 줄을 섭니다)
+# 연결 수립(TCP connect) 중에는 아직 소켓을 받지 못해 끊을 수 없으므로 timeout으로만 제한됩니다.
+
+class _HedgeLeg:
+    """헤지 경주의 한 쪽(주 요청/헤지 요청)이 사용 중인 소켓을 기억했다가 취소할 때 끊습니다."""
+
+    def __init__(self, cancelled=False):
+        self._lock = threading.Lock()
+        self._sock = None
+        self.cancelled = cancelled
+        self.finished = False
+
+    def attach(self, sock):
+        with self._lock:
+            if self.finished:
+                return
+            self._sock = sock
+            if self.cancelled:
+                self._shutdown()
+
+    def cancel(self):
+        with self._lock:
+            if self.finished or self.cancelled:
+                return
+            self.cancelled = True
+            self._shutdown()
+
+    def finish(self):
+        """헤더를 받은 뒤에는 소켓이 연결 풀로 돌아갈 수 있으므로 더 이상 끊지 않습니다."""
+        with self._lock:
+            self.finished = True
+            self._sock = None
+
+    def _shutdown(self):
+        if self._sock is None:
+            return
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass # 이미 닫힌 소켓
+
+
+class _HedgeConnectionMixin:
+    """현재 스레드의 _HedgeLeg에 새 소켓과 재사용되는 소켓을 등록합니다."""
+
+    def _new_conn(self):
+        sock = super()._new_conn()
+        self._attach_leg(sock)
+        return sock
+
+    def request(self, *args, **kwargs):
+        if self.sock is not None:  # Keep-Alive로 재사용되는 연결
+            self._attach_leg(self.sock)
+        return super().request(*args, **kwargs)
+
+    @staticmethod
+    def _attach_leg(sock):
+        leg = getattr(_thread_local, "hedge_leg", None)
+        if leg is not None:
+            leg.attach(sock)
+
+
+class _HedgeHTTPConnection(_HedgeConnectionMixin, HTTPConnection):
+    pass
+
+
+class _HedgeHTTPSConnection(_HedgeConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _HedgeHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HedgeHTTPConnection
+
+
+class _HedgeHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HedgeHTTPSConnection
+
+
+class _HedgeAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HedgeHTTPConnectionPool,
+            "https": _HedgeHTTPSConnectionPool,
+        }
+
+
+def _hedge_session():
+    """(헤지 스레드) 취소 가능한 연결을 쓰는 스레드별 requests.Session을 반환합니다."""
+    session = getattr(_thread_local, "hedge_session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = _HedgeAdapter()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _thread_local.hedge_session = session
+    return session
+
+
+def get(url, timeout=10, retries=0, endpoint=None):
+    """
+    설정된 주소 기준으로 GET 요청을 보내고 결과를 METRICS에 기록합니다.
+    연결 오류/타임아웃은 retries 횟수만큼 재시도하며, 마지막 예외는 그대로 전달합니다.
+    """
+    url = resolve_url(url)
+    endpoint = endpoint or classify_url(url)
+    start = time.perf_counter()
+    attempt = 0
+    while True:
+        try:
+            response = _session().get(url, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt < retries:
+                attempt += 1
+                continue
+            METRICS.record(endpoint, type(e).__name__, (time.perf_counter() - start) * 1000, retries=attempt)
+            raise
+        except requests.exceptions.RequestException as e:
+            METRICS.record(endpoint, type(e).__name__, (time.perf_counter() - start) * 1000, retries=attempt)
+            raise
+        METRICS.record(
+            endpoint,
+            response.status_code,
+            (time.perf_counter() - start) * 1000,
+            nbytes=len(response.content),
+            cache=response.headers.get("X-Todomon-Cache"),
+            retries=attempt,
+        )
+        return response
+
+
+class _HedgeRace:
+    """
+    주 요청과 헤지 요청 중 먼저 확정된 응답(헤더)을 받은 쪽을 승자로 정합니다.
+    승자가 정해지면 나머지 쪽의 진행 중인 연결을 끊습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._legs = {}
+        self.winner = None
+
+    def join(self, name):
+        """경주에 참가합니다. 이미 다른 쪽이 이겼으면 처음부터 취소된 상태입니다."""
+        with self._lock:
+            leg = _HedgeLeg(cancelled=self.winner is not None and self.winner != name)
+            self._legs[name] = leg
+            return leg
+
+    def claim(self, name):
+        with self._lock:
+            if self.winner is None:
+                self.winner = name
+                losers = [leg for other, leg in self._legs.items() if other != name]
+            else:
+                losers = []
+            won = self.winner == name
+        for leg in losers:
+            leg.cancel()
+        return won
+
+    def lost(self, name):
+        return self.winner is not None and self.winner != name
+
+
+def _race_get(race, name, url, timeout, endpoint):
+    """
+    (헤지 스레드) 응답 헤더까지 받은 뒤 승자를 가립니다. 진 쪽은 본문을 받지 않고 연결을 닫습니다(취소).
+    헤더를 기다리는 중에 다른 쪽이 이기면 소켓이 끊겨 바로 None을 돌려줍니다.
+    4xx(변형 없음 등)는 확정된 결과로 보고 승자가 됩니다. 5xx는 승자를 주장하지 않고 응답만 돌려줍니다.
+    (다른 쪽도 실패했을 때의 결과용)
+    💡 지연 시간은 이기든 지든 기록합니다. 진 요청을 빼면 느린 주 요청이 p95에서 빠져
+    hedge_delay_ms가 점점 짧아지기 때문입니다. (헤더를 받고 진 쪽은 "lost", 도중에 끊긴 쪽은
+    끊긴 시점까지를 "cancelled"로, 바이트 없이 기록)
+    """
+    leg = race.join(name)
+    if leg.cancelled:
+        return None  # 보내기 전에 이미 승부가 났음
+    start = time.perf_counter()
+    _thread_local.hedge_leg = leg
+    try:
+        response = _hedge_session().get(url, timeout=timeout, stream=True)
+    except requests.exceptions.RequestException as e:
+        status = "cancelled" if leg.cancelled else type(e).__name__
+        METRICS.record(endpoint, status, (time.perf_counter() - start) * 1000)
+        if leg.cancelled:
+            return None
+        raise
+    finally:
+        leg.finish()
+        _thread_local.hedge_leg = None
+    header_ms = (time.perf_counter() - start) * 1000
+    if race.lost(name) or (response.status_code < 500 and not race.claim(name)):
+        response.close()
+        METRICS.record(endpoint, "lost", header_ms)
+        return None
+    content = response.content  # 승자(또는 실패 응답)만 본문을 읽습니다.
+    METRICS.record(
+        endpoint,
+        response.status_code,
+        header_ms,
+        nbytes=len(content),
+        cache=response.headers.get("X-Todomon-Cache"),
+    )
+    return response
+
+
+def get_hedged(url, timeout=10, endpoint="sprite"):
+    """
+    스프라이트를 헤지 요청으로 가져옵니다.
+    주 요청이 hedge_delay_ms 안에 응답하지 못하면 대체 호스트에 같은 요청을 보내고, 먼저 도착한 응답을 씁니다.
+    (진 쪽은 헤더를 받는 즉시, 또는 헤더를 기다리던 중이면 승부가 나는 즉시 닫으므로
+    본문은 한 번만 전송되고 멈춘 요청이 헤지 워커를 붙잡지 않습니다.)
+    대체 호스트가 설정되지 않았으면 get과 같습니다.
+    """
+    alternate = hedge_url(url)
+    if alternate is None:
+        return get(url, timeout=timeout, endpoint=endpoint)
+
+    race = _HedgeRace()
+    start = time.perf_counter()
+    futures = {_hedge_executor.submit(_race_get, race, "primary", resolve_url(url), timeout, endpoint): "primary"}
+    concurrent.futures.wait(futures, timeout=hedge_delay_ms(endpoint) / 1000)
+    if race.winner is None:
+        # 💡 주 요청이 느리거나 실패했으면 대체 호스트로 헤지 요청을 보냅니다.
+        hedge_future = _hedge_executor.submit(_race_get, race, "hedge", alternate, timeout, endpoint + "-hedge")
+        futures[hedge_future] = "hedge"
+
+    fallback = None
+    last_error = None
+    for future in concurrent.futures.as_completed(futures):
+        try:
+            response = future.result()
+        except requests.exceptions.RequestException as e:
+            last_error = e
+            continue
+        if response is None:
+            continue
+        if race.winner == futures[future]:
+            if len(futures) > 1:
+                METRICS.record("hedge", f"{race.winner}-won", (time.perf_counter() - start) * 1000)
+            return response
+        fallback = fallback or response
+    if fallback is not None:
+        return fallback
+    raise last_error
@@ -0,0 +1,254 @@
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs
+
+import requests
+from PIL import Image
+
+from pokeapi_client import DEFAULT_API_BASE_URL, SPRITE_BASE_URL, MIRROR_SPRITE_PREFIX
+
+# ----------------------------------------------------
+# 💡 로컬 PokeAPI 미러 서버
+# ----------------------------------------------------
+# 여러 대의 Todomon 데스크톱이 pokeapi.co를 각각 요청하지 않도록,
+# 같은 /api/v2/... 경로와 스프라이트 경로를 공유 캐시에서 응답합니다.
+#
+#   python pokeapi_mirror.py --port 8765
+#   TODOMON_API_BASE_URL=http://<미러 주소>:8765 python todomon1.py
+#
+# 스프라이트는 /sprites/<raw.githubusercontent.com 경로> 로 제공됩니다.
+# /sprites/...png?w=190 처럼 요청하면 원본을 긴 변 190px로 줄인 PNG를 만들어 캐시합니다.
+
+DEFAULT_CACHE_DIR = "mirror_cache"
+CACHEABLE_STATUS = (200, 404)
+SCALED_WIDTH_RANGE = (16, 1024)
+
+
+class SpriteDecodeError(Exception):
+    """업스트림 스프라이트 본문을 이미지로 읽을 수 없음 (손상되었거나 이미지가 아님). 502로 응답합니다."""
+
+
+class MirrorCache:
+    """업스트림 응답을 디스크에 저장하고, 같은 경로의 동시 요청을 하나로 합칩니다."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, upstream_api=DEFAULT_API_BASE_URL,
+                 upstream_sprites=SPRITE_BASE_URL, timeout=10):
+        self.cache_dir = cache_dir
+        self.upstream_api = upstream_api.rstrip("/")
+        self.upstream_sprites = upstream_sprites.rstrip("/")
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._inflight = {}  # 경로 -> 진행 중인 업스트림 요청 Future
+        self._thread_local = threading.local()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @staticmethod
+    def normalize_path(path):
+        """캐시 키로 사용할 경로를 정규화합니다. (API 경로는 항상 '/'로 끝나도록)"""
+        path, _, query = path.partition("?")
+        if path.startswith("/api/v2/") and not path.endswith("/"):
+            path += "/"
+        return f"{path}?{query}" if query else path
+
+    def upstream_url(self, path):
+        """미러 경로에 대응하는 업스트림 URL을 반환합니다. 지원하지 않는 경로는 None."""
+        if path.startswith("/api/v2/"):
+            return self.upstream_api + path
+        if path.startswith(MIRROR_SPRITE_PREFIX + "/"):
+            return self.upstream_sprites + path[len(MIRROR_SPRITE_PREFIX):]
+        return None
+
+    def _cache_paths(self, path):
+        key = hashlib.sha1(path.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return base + ".bin", base + ".meta.json"
+
+    def _read_cache(self, path):
+        body_path, meta_path = self._cache_paths(path)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            return meta["status"], meta["content_type"], body
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cache(self, path, status, content_type, body):
+        body_path, meta_path = self._cache_paths(path)
+        os.makedirs(os.path.dirname(body_path), exist_ok=True)
+        try:
+            # 임시 파일에 쓴 뒤 교체하여, 다른 스레드가 반쯤 쓰인 파일을 읽지 않도록 합니다.
+            for target, data, mode in ((body_path, body, "wb"),
+                                       (meta_path, json.dumps({"status": status, "content_type": content_type}), "w")):
+                tmp_path = f"{target}.{threading.get_ident()}.tmp"
+                with open(tmp_path, mode) as f:
+                    f.write(data)
+                os.replace(tmp_path, target)
+        except OSError as e:
+            print(f"[미러] 캐시 저장 실패 ({path}): {e}")
+
+    def _session(self):
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._thread_local.session = session
+        return session
+
+    def _scaled_width(self, path):
+        """스프라이트 축소 요청(?w=)이면 목표 픽셀을, 아니면 None을 반환합니다."""
+        base, _, query = path.partition("?")
+        if not base.startswith(MIRROR_SPRITE_PREFIX + "/") or not base.endswith(".png"):
+            return None
+        try:
+            width = int(parse_qs(query).get("w", [""])[0])
+        except ValueError:
+            return None
+        low, high = SCALED_WIDTH_RANGE
+        return width if low <= width <= high else None
+
+    def _fetch_scaled(self, path, width):
+        """
+        캐시된(없으면 업스트림) 원본 스프라이트를 width로 줄인 PNG를 만듭니다.
+        원본을 이미지로 읽지 못하면 SpriteDecodeError를 발생시키고 결과를 캐시하지 않습니다.
+        """
+        status, content_type, body, _ = self.get(path.partition("?")[0])
+        if status == 200:
+            try:
+                image = Image.open(BytesIO(body))
+                if max(image.size) > width:
+                    image.thumbnail((width, width), Image.Resampling.LANCZOS)
+                    output = BytesIO()
+                    image.save(output, "PNG", optimize=True)
+                    # 줄인 PNG가 원본보다 커지는 경우(색이 단순한 원본)에는 원본을 그대로 보냅니다.
+                    if len(output.getvalue()) < len(body):
+                        body = output.getvalue()
+            except (OSError, Image.DecompressionBombError) as e:  # UnidentifiedImageError는 OSError
+                raise SpriteDecodeError(f"스프라이트 디코딩 실패: {e}") from e
+        result = (status, content_type, body)
+        if status in CACHEABLE_STATUS:
+            self._write_cache(path, *result)
+        return result
+
+    def _fetch_upstream(self, path):
+        width = self._scaled_width(path)
+        if width is not None:
+            return self._fetch_scaled(path, width)
+        url = self.upstream_url(path)
+        response = self._session().get(url, timeout=self.timeout)
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        result = (response.status_code, content_type, response.content)
+        if response.status_code in CACHEABLE_STATUS:
+            self._write_cache(path, *result)
+        return result
+
+    def get(self, path):
+        """
+        (status, content_type, body, cache_state) 튜플을 반환합니다.
+        cache_state는 "HIT", "MISS", "COALESCED" 중 하나입니다.
+        """
+        path = self.normalize_path(path)
+        cached = self._read_cache(path)
+        if cached:
+            return (*cached, "HIT")
+
+        with self._lock:
+            future = self._inflight.get(path)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._inflight[path] = future
+
+        if not is_owner:
+            # 💡 같은 경로를 이미 다른 스레드가 요청 중이면 그 결과를 기다립니다.
+            return (*future.result(), "COALESCED")
+
+        try:
+            result = self._fetch_upstream(path)
+            future.set_result(result)
+            return (*result, "MISS")
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(path, None)
+
+
+class MirrorRequestHandler(BaseHTTPRequestHandler):
+    """MirrorCache를 사용해 GET/HEAD 요청에 응답합니다."""
+
+    cache = None  # make_server에서 설정
+
+    def do_GET(self):
+        self._respond(send_body=True)
+
+    def do_HEAD(self):
+        self._respond(send_body=False)
+
+    def _respond(self, send_body):
+        if self.cache.upstream_url(self.path) is None:
+            # HTTP 상태 메시지는 latin-1만 허용하므로 영문으로 응답합니다.
+            self.send_error(404, "Unsupported path")
+            return
+        try:
+            status, content_type, body, cache_state = self.cache.get(self.path)
+        except requests.exceptions.RequestException as e:
+            print(f"[미러] 업스트림 요청 실패 ({self.path}): {e}")
+            self.send_error(502, "Upstream request failed")
+            return
+        except SpriteDecodeError as e:
+            # 💡 같은 경로를 기다리던 요청들도 같은 예외를 받아 각자 502로 응답합니다.
+            print(f"[미러] {e} ({self.path})")
+            self.send_error(502, "Upstream sprite is not a valid image")
+            return
+
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Todomon-Cache", cache_state)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 요청마다 출력하지 않습니다. (업스트림 오류는 _respond에서 직접 출력)
+        pass
+
+
+def make_server(host, port, cache):
+    """미러 캐시를 사용하는 ThreadingHTTPServer를 생성합니다."""
+    handler = type("BoundMirrorRequestHandler", (MirrorRequestHandler,), {"cache": cache})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Todomon용 로컬 PokeAPI 미러 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--upstream", default=DEFAULT_API_BASE_URL, help="업스트림 PokeAPI 주소")
+    parser.add_argument("--sprite-upstream", default=SPRITE_BASE_URL, help="업스트림 스프라이트 호스트")
+    args = parser.parse_args()
+
+    cache = MirrorCache(args.cache_dir, args.upstream, args.sprite_upstream)
+    server = make_server(args.host, args.port, cache)
+    print(f"--- PokeAPI 미러 시작: http://{args.host}:{args.port} (캐시: {os.path.abspath(args.cache_dir)}) ---")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n미러 서버를 종료합니다.")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
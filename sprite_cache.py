@@ -0,0 +1,162 @@
+import collections
+import os
+import threading
+
+# ----------------------------------------------------
+# 💡 표시용 스프라이트 LRU 캐시 (바이트 예산 제한)
+# ----------------------------------------------------
+# (포켓몬 ID, 표시 크기) -> 축소된 표시용 이미지 + 이름 + (만들어졌다면) PhotoImage.
+# (("animated", 스프라이트 ID), 표시 크기) -> 애니메이션 스프라이트의 축소된 프레임 목록.
+# 원본 해상도 이미지는 보관하지 않습니다. 항목 크기는 픽셀 버퍼 기준으로 추정하며
+# (PIL 이미지 가로*세로*채널 + Tk PhotoImage 가로*세로*4), 합계가 예산을 넘으면
+# 가장 오래 쓰지 않은 항목부터 버립니다. 예산은 TODOMON_SPRITE_CACHE_MB로 바꿀 수 있습니다.
+
+DEFAULT_BUDGET_MB = 16
+PHOTO_BYTES_PER_PIXEL = 4  # Tk photo 이미지는 픽셀당 RGBA 4바이트로 보관
+
+
+def budget_from_env():
+    raw = os.environ.get("TODOMON_SPRITE_CACHE_MB", str(DEFAULT_BUDGET_MB))
+    try:
+        return int(float(raw) * 1024 * 1024)
+    except ValueError:
+        print(f"[sprite_cache] 잘못된 TODOMON_SPRITE_CACHE_MB 값: {raw}")
+        return DEFAULT_BUDGET_MB * 1024 * 1024
+
+
+def image_nbytes(image):
+    """PIL 이미지의 픽셀 버퍼 크기(바이트)를 추정합니다."""
+    width, height = image.size
+    return width * height * len(image.getbands())
+
+
+class SpriteEntry:
+    """캐시 항목 하나입니다. photo는 메인 스레드에서 처음 표시할 때 채워집니다."""
+
+    def __init__(self, image, name):
+        self.image = image
+        self.name = name
+        self.photo = None
+
+    @property
+    def nbytes(self):
+        size = image_nbytes(self.image)
+        if self.photo is not None:
+            width, height = self.image.size
+            size += width * height * PHOTO_BYTES_PER_PIXEL
+        return size
+
+
+class AnimationEntry:
+    """애니메이션 스프라이트의 표시용 프레임 [(이미지, 표시 시간 ms)] 목록입니다."""
+
+    def __init__(self, frames):
+        self.frames = frames
+
+    @property
+    def nbytes(self):
+        return sum(image_nbytes(image) for image, _ in self.frames)
+
+
+class SpriteCache:
+    """(pokemon_id, size) 키의 LRU 캐시입니다. 워커 스레드에서 put 해도 안전합니다."""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes if max_bytes is not None else budget_from_env()
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, pokemon_id, size):
+        """항목을 반환하고 가장 최근 사용으로 표시합니다. 없으면 None."""
+        key = (pokemon_id, tuple(size))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, pokemon_id, size, image, name):
+        """표시용 이미지를 넣고 예산을 넘으면 오래된 항목을 버립니다. 넣은 항목을 반환합니다."""
+        return self._store((pokemon_id, tuple(size)), SpriteEntry(image, name))
+
+    def get_animation(self, sprite_id, size):
+        """애니메이션 프레임 항목(AnimationEntry)을 반환합니다. 없으면 None."""
+        return self.get(("animated", sprite_id), size)
+
+    def put_animation(self, sprite_id, size, frames):
+        """애니메이션 프레임 목록을 넣습니다. 예산 계산은 정지 이미지와 같습니다."""
+        return self._store((("animated", sprite_id), tuple(size)), AnimationEntry(frames))
+
+    def _store(self, key, entry):
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous.nbytes
+            self._entries[key] = entry
+            self.bytes += entry.nbytes
+            self._evict()
+        return entry
+
+    def attach_photo(self, entry, photo):
+        """(메인 스레드) 항목에 PhotoImage를 붙이고 늘어난 크기를 예산에 반영합니다."""
+        with self._lock:
+            before = entry.nbytes
+            entry.photo = photo
+            if any(cached is entry for cached in self._entries.values()):
+                self.bytes += entry.nbytes - before
+                self._evict(keep=entry)
+
+    def _evict(self, keep=None):
+        """예산 안으로 들어올 때까지 오래된 항목을 버립니다. (방금 넣은 항목 하나는 남김)"""
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            key, entry = next(iter(self._entries.items()))
+            if entry is keep:
+                self._entries.move_to_end(key)
+                key, entry = next(iter(self._entries.items()))
+            del self._entries[key]
+            size = entry.nbytes
+            self.bytes -= size
+            self.evictions += 1
+            self.evicted_bytes += size
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "evicted_bytes": self.evicted_bytes,
+            }
+
+    def format_summary(self):
+        """디버그 패널에 표시할 텍스트 요약을 만듭니다."""
+        stats = self.stats()
+        return (
+            f"{stats['entries']}개 {stats['bytes'] / 1024:.0f}KB / {stats['max_bytes'] / 1024:.0f}KB  "
+            f"hit {stats['hits']} miss {stats['misses']} ({stats['hit_rate']:.0%})  "
+            f"evict {stats['evictions']}회 {stats['evicted_bytes'] / 1024:.0f}KB"
+        )
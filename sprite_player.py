@@ -0,0 +1,209 @@
+import concurrent.futures
+import os
+import queue
+import threading
+
+from PIL import ImageTk
+
+import image_pipeline
+from sprite_cache import image_nbytes
+
+# ----------------------------------------------------
+# 💡 프레임 애니메이션 (로딩 GIF / 애니메이션 포켓몬 스프라이트 공용)
+# ----------------------------------------------------
+# FrameAnimator: 레이블에 프레임을 순서대로 보여주는 타이머입니다. 레이블이 화면에 보이지 않으면
+#   (창 최소화 등) 다음 프레임을 예약하지 않고 멈췄다가, 창이 다시 보이면(<Map>) 이어서 재생합니다.
+# SpritePlayer: 애니메이션 스프라이트를 전용 워커 스레드에서 한 프레임씩 디코딩/축소해
+#   작은 링 버퍼(queue.Queue)에 넣고, 메인 스레드는 꺼내서 PhotoImage로 감싸기만 합니다.
+#   한 바퀴를 다 돌았을 때 프레임 합계가 캐시 예산의 일부 이하이면 스프라이트 캐시에 넣고
+#   이후로는 디코딩 없이 반복 재생합니다. (크면 다음 바퀴도 스트리밍으로 다시 디코딩)
+# TODOMON_ANIMATED_SPRITES=0 으로 끄면 정지 이미지만 표시합니다.
+
+ANIMATED_SPRITES_ENABLED = os.environ.get("TODOMON_ANIMATED_SPRITES", "1") != "0"
+RING_BUFFER_FRAMES = 8
+RETRY_MS = 20             # 다음 프레임이 아직 준비되지 않았을 때 다시 확인하는 간격
+MIN_FRAME_MS = 20
+CACHE_SHARE = 4           # 캐시 예산의 1/4 이하인 애니메이션만 통째로 캐시
+
+_END = object()           # 한 바퀴 디코딩 완료 표시
+
+
+class FrameAnimator:
+    """next_frame()이 돌려주는 (PhotoImage, 표시 시간 ms)를 label에 차례로 보여줍니다. None이면 잠시 뒤 다시 묻습니다."""
+
+    def __init__(self, label, next_frame):
+        self.label = label
+        self.next_frame = next_frame
+        self.is_running = False
+        self._after_id = None
+        self._paused = False
+        label.winfo_toplevel().bind("<Map>", self._on_map, add="+")
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self._paused = False
+        self._tick()
+
+    def stop(self):
+        self.is_running = False
+        self._paused = False
+        if self._after_id is not None:
+            self.label.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _on_map(self, event=None):
+        if self.is_running and self._paused:
+            self._paused = False
+            self._tick()
+
+    def _tick(self):
+        self._after_id = None
+        if not self.is_running:
+            return
+        if not self.label.winfo_viewable():
+            # 💡 보이지 않는 동안은 타이머를 걸지 않습니다. (<Map>에서 재개)
+            self._paused = True
+            return
+        frame = self.next_frame()
+        if not self.is_running:
+            return  # next_frame 안에서 재생이 중지됨
+        if frame is None:
+            self._after_id = self.label.after(RETRY_MS, self._tick)
+            return
+        photo, delay_ms = frame
+        self.label.config(image=photo, text="")
+        self.label.image = photo  # 가비지 컬렉션 방지
+        self._after_id = self.label.after(max(MIN_FRAME_MS, int(delay_ms)), self._tick)
+
+
+class SpritePlayer:
+    """애니메이션 포켓몬 스프라이트를 스트리밍 디코딩으로 재생합니다."""
+
+    def __init__(self, label, fetch_sprite, cache, size):
+        self.fetch_sprite = fetch_sprite  # (워커) 스프라이트 ID -> GIF 바이트 또는 None
+        self.cache = cache
+        self.size = tuple(size)
+        self.animator = FrameAnimator(label, self._next_frame)
+        self._decoder = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="sprite-decode")
+
+        self.sprite_id = None
+        self._data = None         # 스트리밍 재생 중인 GIF 바이트 (다음 바퀴 재디코딩용)
+        self._buffer = None       # 디코딩된 프레임 링 버퍼
+        self._stop_event = None
+        self._collected = None    # 첫 바퀴 프레임 [(이미지, ms)] (캐시 후보, 너무 커지면 None)
+        self._collected_bytes = 0
+        self._photos = None       # 캐시된 애니메이션의 PhotoImage 목록 (처음 표시할 때 만듦)
+        self._frames = None       # 캐시된 프레임 [(이미지, ms)]
+        self._index = 0
+
+    def play(self, sprite_id):
+        """스프라이트 재생을 시작합니다. 캐시에 있으면 바로, 없으면 워커에서 받아 디코딩하면서 재생합니다."""
+        self.stop()
+        self.sprite_id = sprite_id
+        entry = self.cache.get_animation(sprite_id, self.size)
+        if entry is not None:
+            self._play_cached(entry.frames)
+        else:
+            self._collected = []
+            self._collected_bytes = 0
+            self._start_stream(data=None)
+        self.animator.start()
+
+    def stop(self):
+        self.animator.stop()
+        if self._stop_event is not None:
+            self._stop_event.set()
+        self.sprite_id = None
+        self._data = self._buffer = self._stop_event = None
+        self._collected = self._photos = self._frames = None
+        self._index = 0
+
+    def shutdown(self):
+        self.stop()
+        self._decoder.shutdown(wait=False)
+
+    def _play_cached(self, frames):
+        self._frames = frames
+        self._photos = [None] * len(frames)
+        self._index = 0
+
+    def _start_stream(self, data):
+        self._buffer = queue.Queue(maxsize=RING_BUFFER_FRAMES)
+        self._stop_event = threading.Event()
+        self._decoder.submit(self._decode, self.sprite_id, data, self._buffer, self._stop_event)
+
+    @staticmethod
+    def _put(buffer, item, stop_event):
+        """버퍼에 빈자리가 날 때까지 기다립니다. 재생이 중지되면 False."""
+        while not stop_event.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode(self, sprite_id, data, buffer, stop_event):
+        """(디코딩 스레드) GIF를 받아(필요하면) 한 프레임씩 링 버퍼에 넣습니다. 버퍼가 차면 기다립니다."""
+        try:
+            if data is None:
+                data = self.fetch_sprite(sprite_id)
+                if data is None:
+                    self._put(buffer, None, stop_event)  # 애니메이션 변형 없음
+                    return
+                if not self._put(buffer, data, stop_event):
+                    return
+            for frame in image_pipeline.stream_gif_frames(data, self.size):
+                if not self._put(buffer, frame, stop_event):
+                    return
+            self._put(buffer, _END, stop_event)
+        except Exception as e:
+            print(f"애니메이션 스프라이트 디코딩 중 오류 발생 (ID: {sprite_id}): {e}")
+            self._put(buffer, None, stop_event)
+
+    def _next_frame(self):
+        """(메인 스레드) 다음 프레임을 돌려줍니다. 아직 준비되지 않았으면 None."""
+        if self._frames is not None:
+            image, duration = self._frames[self._index]
+            if self._photos[self._index] is None:
+                self._photos[self._index] = ImageTk.PhotoImage(image)
+            photo = self._photos[self._index]
+            self._index = (self._index + 1) % len(self._frames)
+            return photo, duration
+
+        if self._buffer is None:
+            return None
+        try:
+            item = self._buffer.get_nowait()
+        except queue.Empty:
+            return None
+        if item is None:
+            # 애니메이션이 없거나 실패: 정지 이미지를 그대로 둡니다.
+            self.stop()
+            return None
+        if item is _END:
+            self._finish_loop()
+            return None
+        if isinstance(item, bytes):
+            self._data = item  # 캐시하지 못하면 다음 바퀴에 다시 디코딩할 원본
+            return None
+
+        image, duration = item
+        if self._collected is not None:
+            self._collected.append(item)
+            self._collected_bytes += image_nbytes(image)
+            if self._collected_bytes > self.cache.max_bytes // CACHE_SHARE:
+                self._collected = None  # 캐시하기에는 너무 큼
+        return ImageTk.PhotoImage(image), duration
+
+    def _finish_loop(self):
+        """한 바퀴가 끝났습니다. 작으면 캐시해 반복 재생하고, 크면 같은 데이터로 다시 스트리밍합니다."""
+        if self._collected:
+            entry = self.cache.put_animation(self.sprite_id, self.size, self._collected)
+            self._collected = None
+            self._play_cached(entry.frames)
+        else:
+            self._collected = None
+            self._start_stream(self._data)
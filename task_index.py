@@ -0,0 +1,196 @@
+import bisect
+import datetime
+import functools
+import re
+import unicodedata
+
+# ----------------------------------------------------
+# 💡 태스크 검색 / 마감일 인덱스 (메모리)
+# ----------------------------------------------------
+# - 이름 인덱스: 토큰 -> 태스크 ID 집합 + 정렬된 토큰 목록. 접두어 검색은 정렬 목록을 이분 탐색합니다.
+#   한글은 자모로 풀어(NFD) 저장하므로 "포켓ㅁ", "ㅍ" 처럼 입력 중인 음절도 접두어로 찾습니다.
+# - 마감일 인덱스: 미완료 태스크의 (마감일, ID)를 정렬 상태로 유지해 지난 마감/오늘/이번 주를 범위로 잘라냅니다.
+# 모든 갱신은 태스크 하나 단위(add/remove/update)로 이루어지며 전체 목록을 다시 훑지 않습니다.
+
+DATE_FORMAT = "%Y-%m-%d"
+AGENDA_FILTERS = ("overdue", "today", "week")
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# 호환 자모(키보드 입력, U+3131~) -> 첫소리 자모(NFD 분해 결과, U+1100~)
+_COMPAT_TO_LEADING = str.maketrans(
+    "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ",
+    "".join(chr(code) for code in range(0x1100, 0x1113)),
+)
+
+
+@functools.lru_cache(maxsize=65536)
+def normalize_token(token):
+    """소문자 + 한글 음절을 자모로 분해한 검색 키를 만듭니다."""
+    return unicodedata.normalize("NFD", token.lower()).translate(_COMPAT_TO_LEADING)
+
+
+def tokenize(text):
+    return {normalize_token(token) for token in _TOKEN_PATTERN.findall(text or "")}
+
+
+def week_end(today):
+    """이번 주 일요일 날짜를 반환합니다. (월요일 시작 기준)"""
+    return today + datetime.timedelta(days=6 - today.weekday())
+
+
+class TaskIndex:
+    """TaskStore가 변경될 때마다 태스크 하나씩 갱신되는 검색/마감일 인덱스입니다."""
+
+    def __init__(self):
+        self._postings = {}        # 토큰 키 -> {task_id}
+        self._keys = []            # 정렬된 토큰 키 (접두어 검색용)
+        self._task_keys = {}       # task_id -> 토큰 키 집합 (삭제용)
+        self._due = []             # 정렬된 (due_date, task_id) - 미완료 + 마감일 있는 태스크
+        self._due_entry = {}       # task_id -> (due_date, task_id)
+        self._order = {}           # task_id -> 입력 순번 (결과 정렬용)
+        self._next_order = 0
+
+    def clear(self):
+        self.__init__()
+
+    # ------------------- 갱신 -------------------
+
+    def add(self, task):
+        if task.id in self._order:
+            self.update(task)
+            return
+        self._order[task.id] = self._next_order
+        self._next_order += 1
+        self._index_name(task)
+        self._index_due(task)
+
+    def add_many(self, tasks):
+        """대량 추가: 새 토큰을 모아 정렬 목록을 한 번만 다시 정렬합니다."""
+        new_keys = []
+        for task in tasks:
+            if task.id in self._order:
+                self.update(task)
+                continue
+            self._order[task.id] = self._next_order
+            self._next_order += 1
+            new_keys.extend(self._index_name(task, sort_keys=False))
+            self._index_due(task, sort_entries=False)
+        if new_keys:
+            self._keys.extend(new_keys)
+            self._keys.sort()
+        self._due.sort()
+
+    def remove(self, task_id):
+        if self._order.pop(task_id, None) is None:
+            return
+        for key in self._task_keys.pop(task_id, ()):
+            ids = self._postings[key]
+            ids.discard(task_id)
+            if not ids:
+                del self._postings[key]
+                del self._keys[bisect.bisect_left(self._keys, key)]
+        self._unindex_due(task_id)
+
+    def update(self, task):
+        """완료 상태/마감일이 바뀐 태스크의 마감일 인덱스를 갱신합니다. (이름은 바뀌지 않음)"""
+        if task.id not in self._order:
+            self.add(task)
+            return
+        self._unindex_due(task.id)
+        self._index_due(task)
+
+    def _index_name(self, task, sort_keys=True):
+        keys = tokenize(task.name)
+        self._task_keys[task.id] = keys
+        new_keys = []
+        for key in keys:
+            ids = self._postings.get(key)
+            if ids is None:
+                self._postings[key] = {task.id}
+                new_keys.append(key)
+                if sort_keys:
+                    bisect.insort(self._keys, key)
+            else:
+                ids.add(task.id)
+        return new_keys
+
+    def _index_due(self, task, sort_entries=True):
+        if not task.due_date or task.is_completed:
+            return
+        entry = (task.due_date, task.id)
+        self._due_entry[task.id] = entry
+        if sort_entries:
+            bisect.insort(self._due, entry)
+        else:
+            self._due.append(entry)
+
+    def _unindex_due(self, task_id):
+        entry = self._due_entry.pop(task_id, None)
+        if entry is not None:
+            del self._due[bisect.bisect_left(self._due, entry)]
+
+    # ------------------- 조회 -------------------
+
+    def search(self, text):
+        """모든 검색어 토큰을 접두어로 포함하는 태스크 ID 집합. 검색어가 비면 None(필터 없음)."""
+        result = None
+        for key in tokenize(text):
+            matches = set()
+            start = bisect.bisect_left(self._keys, key)
+            for index in range(start, len(self._keys)):
+                if not self._keys[index].startswith(key):
+                    break
+                matches |= self._postings[self._keys[index]]
+            result = matches if result is None else result & matches
+            if not result:
+                return set()
+        return result
+
+    def agenda(self, kind, today=None):
+        """"overdue" | "today" | "week" 에 해당하는 미완료 태스크 ID 목록 (마감일 순)."""
+        today = today or datetime.date.today()
+        today_str = today.strftime(DATE_FORMAT)
+        if kind == "overdue":
+            low, high = "", today_str
+        elif kind == "today":
+            low, high = today_str, (today + datetime.timedelta(days=1)).strftime(DATE_FORMAT)
+        elif kind == "week":
+            low, high = today_str, (week_end(today) + datetime.timedelta(days=1)).strftime(DATE_FORMAT)
+        else:
+            raise ValueError(f"알 수 없는 일정 필터: {kind}")
+        start = bisect.bisect_left(self._due, (low, ""))
+        end = bisect.bisect_left(self._due, (high, ""))
+        return [task_id for _, task_id in self._due[start:end]]
+
+    def query(self, text="", agenda=None, today=None):
+        """검색어와 일정 필터를 함께 적용한 ID 집합. 둘 다 없으면 None(필터 없음)."""
+        result = self.search(text)
+        if agenda:
+            due_ids = set(self.agenda(agenda, today))
+            result = due_ids if result is None else result & due_ids
+        return result
+
+    def matches(self, task, text="", agenda=None, today=None):
+        """태스크 하나가 현재 필터에 맞는지 검사합니다. (인덱스 전체를 훑지 않는 증분 갱신용)"""
+        if agenda:
+            if task.id not in self._due_entry:
+                return False
+            due_date = task.due_date
+            today = today or datetime.date.today()
+            today_str = today.strftime(DATE_FORMAT)
+            if agenda == "overdue" and not due_date < today_str:
+                return False
+            if agenda == "today" and due_date != today_str:
+                return False
+            if agenda == "week" and not today_str <= due_date <= week_end(today).strftime(DATE_FORMAT):
+                return False
+        task_keys = self._task_keys.get(task.id, ())
+        for key in tokenize(text):
+            if not any(task_key.startswith(key) for task_key in task_keys):
+                return False
+        return True
+
+    def sort_key(self, task_id):
+        """결과를 원래 입력 순서로 정렬하기 위한 키입니다."""
+        return self._order.get(task_id, -1)
@@ -0,0 +1,186 @@
+import csv
+import datetime
+import json
+import os
+
+from todomon_core import Task, DATE_FORMAT, is_past_due
+
+# ----------------------------------------------------
+# 💡 태스크 일괄 가져오기 / 내보내기 (JSONL, CSV)
+# ----------------------------------------------------
+# 파일을 한 줄씩 읽는 제너레이터 파이프라인으로 검증합니다.
+#   read_records -> parse_records(검증) -> ImportResult.tasks
+# 검증을 통과한 태스크는 메인 스레드에서 한 번에 코어에 넣고, 프로필 저장도 한 번만 합니다.
+# (위젯은 화면 쪽에서 TASK_WIDGET_CHUNK 개씩 나눠 만듦)
+
+CSV_FIELDS = ("id", "name", "completed", "recurring", "due_date", "completed_at")
+MAX_REPORTED_ERRORS = 20
+
+TRUE_VALUES = {"1", "true", "yes", "y", "o", "t"}
+
+
+class ImportResult:
+    """가져오기 결과 요약입니다. errors는 앞쪽 MAX_REPORTED_ERRORS 건만 보관합니다."""
+
+    def __init__(self):
+        self.tasks = []
+        self.skipped = 0
+        self.errors = []
+
+    def add_error(self, line_no, message):
+        self.skipped += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f"{line_no}행: {message}")
+
+    def summary(self):
+        text = f"{len(self.tasks)}개 가져옴, {self.skipped}개 건너뜀"
+        if self.errors:
+            text += "\n" + "\n".join(self.errors)
+        return text
+
+
+def _file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".json", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"지원하지 않는 파일 형식입니다: {ext or path}")
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in TRUE_VALUES
+
+
+def read_records(path):
+    """파일에서 (행 번호, 원본 딕셔너리)를 한 줄씩 돌려줍니다. JSON 파싱 오류는 딕셔너리 대신 예외 객체로 전달합니다."""
+    fmt = _file_format(path)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            # 헤더 행이 1행이므로 데이터는 2행부터
+            for line_no, row in enumerate(csv.DictReader(f), start=2):
+                yield line_no, row
+        else:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_no, e
+
+
+def parse_record(raw, today=None):
+    """
+    원본 딕셔너리를 Task로 변환합니다. 잘못된 행은 ValueError.
+    마감일은 add_task와 같이 is_past_due로 검사합니다. (이미 완료된 태스크는 기록이므로 지난 마감일 허용)
+    """
+    if not isinstance(raw, dict):
+        raise ValueError("객체 형식이 아닙니다.")
+    name = str(raw.get("name") or "").strip()
+    if not name:
+        raise ValueError("태스크 이름이 비어 있습니다.")
+
+    is_completed = _to_bool(raw.get("completed", False))
+    due_date = str(raw.get("due_date") or "").strip()
+    if due_date:
+        try:
+            datetime.datetime.strptime(due_date, DATE_FORMAT)
+        except ValueError:
+            raise ValueError(f"마감일 형식이 잘못되었습니다: {due_date}")
+        if not is_completed and is_past_due(due_date, today):
+            raise ValueError(f"마감일이 이미 지났습니다: {due_date}")
+
+    return Task.from_dict({
+        "id": raw.get("id") or None,
+        "name": name,
+        "completed": is_completed,
+        "recurring": _to_bool(raw.get("recurring", False)),
+        "due_date": due_date,
+        "completed_at": str(raw.get("completed_at") or "").strip(),
+    })
+
+
+def parse_records(records, result, existing_ids=()):
+    """검증을 통과한 Task만 돌려줍니다. 실패한 행과 이미 있는 ID는 result에 기록하고 건너뜁니다."""
+    seen_ids = set(existing_ids)
+    for line_no, raw in records:
+        if isinstance(raw, Exception):
+            result.add_error(line_no, f"JSON 오류 ({raw.msg})")
+            continue
+        try:
+            task = parse_record(raw)
+        except ValueError as e:
+            result.add_error(line_no, str(e))
+            continue
+        if task.id in seen_ids:
+            result.add_error(line_no, "이미 있는 태스크입니다.")
+            continue
+        seen_ids.add(task.id)
+        yield task
+
+
+def _iter_archive(repository, username):
+    """보관함 기록(딕셔너리)을 최신 순으로 돌려줍니다. 세그먼트는 공유 잠금 안에서 하나씩 읽습니다."""
+    for path in repository.archive_segments(username):
+        with repository.lock(username, shared=True):
+            records = repository.read_archive_segment(path)
+        yield from reversed(records)
+
+
+def read_tasks(path, existing_ids=(), repository=None, username=None):
+    """
+    (워커 스레드용) 파일을 읽고 검증해 ImportResult를 돌려줍니다.
+    파일은 한 줄씩 읽지만, 검증된 Task는 모두 result.tasks에 모아 메인 스레드에서 한 번에 적용합니다.
+    repository와 username을 주면 보관된 태스크의 id도 이미 있는 것으로 봅니다.
+    (내보낸 백업에는 보관함도 들어 있으므로, 다시 가져올 때 보관된 태스크가 목록으로 돌아오지 않도록)
+    """
+    existing_ids = set(existing_ids)
+    if repository is not None and username:
+        existing_ids.update(data.get("id") for data in _iter_archive(repository, username))
+    result = ImportResult()
+    result.tasks.extend(parse_records(read_records(path), result, existing_ids))
+    return result
+
+
+def import_tasks(core, path):
+    """(헤드리스용) 파일의 태스크를 한 번에 코어에 넣고 한 번만 저장합니다."""
+    result = read_tasks(path, [task.id for task in core.tasks], core.repository, core.username)
+    if result.tasks:
+        core.tasks.add_many(result.tasks)
+        if core.username:
+            core.save()
+    return result
+
+
+def export_tasks(tasks, path):
+    """태스크들을 한 줄씩 파일에 씁니다. tasks는 제너레이터여도 됩니다. 쓴 개수를 반환합니다."""
+    fmt = _file_format(path)
+    count = 0
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for task in tasks:
+                writer.writerow(task.to_dict())
+                count += 1
+        else:
+            for task in tasks:
+                f.write(json.dumps(task.to_dict(), ensure_ascii=False) + "\n")
+                count += 1
+    os.replace(tmp_path, path)
+    return count
+
+
+def iter_all_tasks(tasks, repository, username):
+    """
+    현재 태스크와 보관된 완료 태스크를 모두 돌려줍니다. (백업용, 보관함은 최신 순)
+    💡 워커 스레드에서 돌므로 코어 상태(core.tasks, core.username)를 직접 읽지 않습니다.
+    호출한 쪽이 메인 스레드에서 만든 태스크 목록과 사용자 이름을 넘기고, 보관함 세그먼트는 공유 잠금 안에서 읽습니다.
+    """
+    yield from tasks
+    for data in _iter_archive(repository, username):
+        yield Task.from_dict(data)
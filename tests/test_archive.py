@@ -0,0 +1,49 @@
+import tempfile
+import unittest
+
+from todomon_core import ProfileRepository, TodomonCore
+
+USERNAME = "tester"
+
+
+class ArchiveTest(unittest.TestCase):
+    """보관은 프로필 저장과 한 잠금 안에서 이루어지고, 같은 태스크를 두 번 보관하지 않습니다."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        core = TodomonCore(repository=ProfileRepository(self._tmp.name))
+        core.username = USERNAME
+        self.old = core.add_task("오래전에 끝낸 일")
+        core.tasks.set_completed(self.old.id, True)
+        self.old.completed_at = "2000-01-01"
+        self.kept = core.add_task("아직 할 일")
+        core.save()
+
+    def _archived_ids(self, repository):
+        return [data["id"] for path in repository.archive_segments(USERNAME)
+                for data in repository.read_archive_segment(path)]
+
+    def test_two_instances_archive_once(self):
+        cores = []
+        for _ in range(2):
+            core = TodomonCore(repository=ProfileRepository(self._tmp.name))
+            core.username = USERNAME
+            core.apply_profile(core.repository.load(USERNAME))
+            cores.append(core)
+        self.assertEqual([core.archive_completed() for core in cores], [1, 1])
+
+        repository = ProfileRepository(self._tmp.name)
+        self.assertEqual(self._archived_ids(repository), [self.old.id])
+        self.assertEqual([data["id"] for data in repository.load(USERNAME)["tasks"]], [self.kept.id])
+
+    def test_login_archives_and_saves(self):
+        core = TodomonCore(repository=ProfileRepository(self._tmp.name))
+        self.assertTrue(core.load(USERNAME))
+        self.assertIsNone(core.tasks.get(self.old.id))
+        self.assertEqual([data["id"] for data in core.repository.load(USERNAME)["tasks"]], [self.kept.id])
+
+
+
+if __name__ == "__main__":
+    unittest.main()
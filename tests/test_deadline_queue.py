@@ -0,0 +1,71 @@
+import datetime
+import unittest
+
+from deadline_notifier import DeadlineQueue, deadline_for
+from todomon_core import Task
+
+HOUR = 3600
+LEAD_TIMES = [datetime.timedelta(hours=24), datetime.timedelta(hours=1)]
+
+
+class DeadlineQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.queue = DeadlineQueue(LEAD_TIMES)
+        self.task = Task("보고서 제출", due_date="2026-03-11", task_id="report")
+        self.deadline = deadline_for(self.task.due_date)
+
+    def test_deadline_is_end_of_due_day(self):
+        expected = datetime.datetime(2026, 3, 12).timestamp()
+        self.assertEqual(self.deadline, expected)
+        self.assertIsNone(deadline_for("2026-13-01"))
+
+    def test_schedules_one_entry_per_lead_time(self):
+        self.queue.schedule(self.task, now=self.deadline - 48 * HOUR)
+        self.assertEqual(len(self.queue), 2)
+        self.assertEqual(self.queue.next_fire_time(), self.deadline - 24 * HOUR)
+
+    def test_past_fire_times_are_not_scheduled(self):
+        self.queue.schedule(self.task, now=self.deadline - 2 * HOUR)
+        self.assertEqual(len(self.queue), 1)
+        self.assertEqual(self.queue.next_fire_time(), self.deadline - HOUR)
+
+    def test_completed_or_undated_tasks_are_skipped(self):
+        done = Task("끝난 일", due_date="2026-03-11", is_completed=True)
+        undated = Task("마감 없음")
+        self.queue.schedule_many([done, undated], now=self.deadline - 48 * HOUR)
+        self.assertEqual(len(self.queue), 0)
+        self.assertIsNone(self.queue.next_fire_time())
+
+    def test_reschedule_invalidates_old_entries(self):
+        now = self.deadline - 48 * HOUR
+        self.queue.schedule(self.task, now=now)
+        self.task.due_date = "2026-03-20"
+        self.queue.schedule(self.task, now=now)
+        self.assertEqual(len(self.queue), 2)
+        self.assertEqual(self.queue.pop_due(now=self.deadline, window=0), [])
+
+    def test_unschedule(self):
+        self.queue.schedule(self.task, now=self.deadline - 48 * HOUR)
+        self.queue.unschedule(self.task.id)
+        self.assertEqual(len(self.queue), 0)
+        self.assertIsNone(self.queue.next_fire_time())
+
+    def test_pop_due_keeps_one_alert_per_task(self):
+        # 절전 후 깨어나 두 리드 타임이 모두 지난 경우: 가장 임박한(1시간 전) 알림 하나만
+        self.queue.schedule(self.task, now=self.deadline - 48 * HOUR)
+        alerts = self.queue.pop_due(now=self.deadline - HOUR, window=0)
+        self.assertEqual([(alert.task.id, alert.lead) for alert in alerts], [("report", LEAD_TIMES[1])])
+        self.assertEqual(len(self.queue), 0)
+
+    def test_pop_due_window_batches_nearby_alerts(self):
+        other = Task("다른 일", due_date="2026-03-11", task_id="other")
+        now = self.deadline - 48 * HOUR
+        self.queue.schedule_many([self.task, other], now=now)
+        alerts = self.queue.pop_due(now=self.deadline - 24 * HOUR - 30, window=60)
+        self.assertEqual(sorted(alert.task.id for alert in alerts), ["other", "report"])
+        self.assertEqual(len(self.queue), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import tempfile
+import unittest
+
+from todomon_core import ProfileRepository, TodomonCore, XP_PER_TASK
+
+USERNAME = "tester"
+
+
+class ProfileMergeTest(unittest.TestCase):
+    """같은 프로필을 두 인스턴스(a, b)가 함께 쓸 때의 병합 규칙 (_merge_external)."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.a = self._make_core()
+        self.a.username = USERNAME
+        self.first, self.second, self.third = (self.a.add_task(name) for name in ("하나", "둘", "셋"))
+        self.a.save()
+        self.b = self._make_core()
+        self.assertTrue(self.b.load(USERNAME))
+
+    def _make_core(self):
+        # 인스턴스마다 따로 파일 서명을 기억하도록 저장소도 따로 만듭니다.
+        return TodomonCore(repository=ProfileRepository(self._tmp.name), rng=random.Random(0))
+
+    def _disk(self):
+        return ProfileRepository(self._tmp.name).load(USERNAME)
+
+    def _disk_tasks(self):
+        return {data["id"]: data for data in self._disk()["tasks"]}
+
+    def test_additions_from_both_sides_are_kept(self):
+        added_a = self.a.add_task("a에서 추가")
+        self.a.save()
+        added_b = self.b.add_task("b에서 추가")
+        self.b.save()
+
+        self.assertIn(added_a.id, self._disk_tasks())
+        self.assertIn(added_b.id, self._disk_tasks())
+        self.assertTrue(self.a.sync_external())
+        self.assertIsNotNone(self.a.tasks.get(added_b.id))
+
+    def test_remote_deletion_wins_over_local_change(self):
+        self.a.remove_tasks([self.first.id])
+        self.a.save()
+        self.b.complete_task(self.first.id)
+        self.b.save()
+
+        self.assertIsNone(self.b.tasks.get(self.first.id))
+        self.assertNotIn(self.first.id, self._disk_tasks())
+
+    def test_local_deletion_wins_over_remote_change(self):
+        self.a.complete_task(self.second.id)
+        self.a.save()
+        self.b.remove_tasks([self.second.id])
+        self.b.save()
+
+        self.assertIsNone(self.b.tasks.get(self.second.id))
+        self.assertNotIn(self.second.id, self._disk_tasks())
+
+    def test_local_completion_wins_when_both_changed(self):
+        self.a.tasks.get(self.third.id).due_date = "2099-12-31"
+        self.a.save()
+        self.b.complete_task(self.third.id)
+        self.b.save()
+
+        merged = self._disk_tasks()[self.third.id]
+        self.assertTrue(merged["completed"])
+        self.assertEqual(merged["due_date"], "")
+
+    def test_remote_change_applies_when_local_untouched(self):
+        self.a.complete_task(self.third.id)
+        self.a.save()
+        self.assertTrue(self.b.sync_external())
+        self.assertTrue(self.b.tasks.get(self.third.id).is_completed)
+
+    def test_xp_is_rebased_on_disk_and_pending_replayed(self):
+        self.a.complete_task(self.first.id)
+        self.a.save()
+        self.b.complete_task(self.second.id)
+        self.b.save()
+
+        self.assertEqual(self._disk()["xp"], 2 * XP_PER_TASK)
+        self.assertEqual(self.b.xp.current_xp, 2 * XP_PER_TASK)
+        self.assertEqual(self.b.pending_xp, 0)
+
+    def test_task_completed_on_both_sides_counts_once(self):
+        self.a.complete_task(self.first.id)
+        self.a.save()
+        self.b.complete_task(self.first.id)
+        self.b.save()
+
+        self.assertEqual(self._disk()["xp"], XP_PER_TASK)
+
+    def test_unchanged_profile_is_not_rewritten(self):
+        signature = self.b.repository.signature(USERNAME)
+        self.b.save()
+        self.assertEqual(self.b.repository.signature(USERNAME), signature)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import datetime
+import unittest
+
+from task_index import TaskIndex
+from todomon_core import Task
+
+TODAY = datetime.date(2026, 3, 11)  # 수요일
+
+
+class TaskIndexSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TaskIndex()
+        self.pokemon = Task("포켓몬 도감 정리", task_id="pokemon")
+        self.report = Task("Weekly report", task_id="report")
+        self.potato = Task("포도 사기", task_id="potato")
+        self.index.add_many([self.pokemon, self.report, self.potato])
+
+    def test_empty_query_is_no_filter(self):
+        self.assertIsNone(self.index.search(""))
+
+    def test_prefix_is_case_insensitive(self):
+        self.assertEqual(self.index.search("WEEK"), {"report"})
+
+    def test_hangul_syllable_prefix(self):
+        self.assertEqual(self.index.search("포"), {"pokemon", "potato"})
+        self.assertEqual(self.index.search("포켓"), {"pokemon"})
+
+    def test_hangul_partial_syllable_prefix(self):
+        # 입력 중인 음절("포켓ㅁ")과 초성만 입력한 경우("ㅍ")도 접두어로 찾습니다.
+        self.assertEqual(self.index.search("포켓ㅁ"), {"pokemon"})
+        self.assertEqual(self.index.search("ㅍ"), {"pokemon", "potato"})
+
+    def test_all_tokens_must_match(self):
+        self.assertEqual(self.index.search("포켓 도감"), {"pokemon"})
+        self.assertEqual(self.index.search("포켓 report"), set())
+
+    def test_remove_drops_unused_keys(self):
+        self.index.remove("report")
+        self.assertEqual(self.index.search("week"), set())
+        self.assertNotIn("weekly", self.index._keys)
+
+
+class TaskIndexAgendaTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = TaskIndex()
+        self.tasks = {
+            "overdue": Task("지난 일", due_date="2026-03-10", task_id="overdue"),
+            "today": Task("오늘 할 일", due_date="2026-03-11", task_id="today"),
+            "sunday": Task("주말 할 일", due_date="2026-03-15", task_id="sunday"),
+            "next_week": Task("다음 주 할 일", due_date="2026-03-16", task_id="next_week"),
+            "no_due": Task("마감 없음", task_id="no_due"),
+        }
+        for task in self.tasks.values():
+            self.index.add(task)
+
+    def test_agenda_ranges(self):
+        self.assertEqual(self.index.agenda("overdue", TODAY), ["overdue"])
+        self.assertEqual(self.index.agenda("today", TODAY), ["today"])
+        self.assertEqual(self.index.agenda("week", TODAY), ["today", "sunday"])
+
+    def test_completed_tasks_leave_agenda(self):
+        task = self.tasks["today"]
+        task.is_completed = True
+        self.index.update(task)
+        self.assertEqual(self.index.agenda("today", TODAY), [])
+        self.assertFalse(self.index.matches(task, agenda="today", today=TODAY))
+
+    def test_matches_agrees_with_query(self):
+        ids = self.index.query("할", "week", TODAY)
+        for task in self.tasks.values():
+            self.assertEqual(self.index.matches(task, "할", "week", TODAY), task.id in ids)
+
+    def test_unknown_agenda_raises(self):
+        with self.assertRaises(ValueError):
+            self.index.agenda("month", TODAY)
+
+
+if __name__ == "__main__":
+    unittest.main()
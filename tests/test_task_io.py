@@ -0,0 +1,110 @@
+import datetime
+import os
+import tempfile
+import unittest
+
+import task_io
+from todomon_core import ProfileRepository, TodomonCore
+
+TODAY = datetime.date(2026, 3, 11)
+
+
+class ParseRecordTest(unittest.TestCase):
+
+    def test_parses_fields(self):
+        task = task_io.parse_record(
+            {"name": " 장보기 ", "completed": "yes", "recurring": "0", "due_date": "2026-03-01"}, TODAY
+        )
+        self.assertEqual(task.name, "장보기")
+        self.assertTrue(task.is_completed)
+        self.assertFalse(task.is_recurring)
+        self.assertEqual(task.due_date, "2026-03-01")
+
+    def test_rejects_invalid_records(self):
+        for raw in (["리스트"], {"name": "  "}, {"name": "날짜", "due_date": "03/01/2026"},
+                    {"name": "지난 마감", "due_date": "2026-03-10"}):
+            with self.subTest(raw=raw), self.assertRaises(ValueError):
+                task_io.parse_record(raw, TODAY)
+
+    def test_completed_task_may_have_past_due_date(self):
+        task = task_io.parse_record({"name": "기록", "completed": True, "due_date": "2026-03-10"}, TODAY)
+        self.assertEqual(task.due_date, "2026-03-10")
+
+
+class ReadTasksTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write(self, name, text):
+        path = os.path.join(self._tmp.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_jsonl_skips_bad_lines_and_duplicate_ids(self):
+        path = self._write("tasks.jsonl", "\n".join([
+            '{"id": "a", "name": "첫째"}',
+            "{not json",
+            "",
+            '{"id": "a", "name": "중복"}',
+            '{"id": "old", "name": "이미 있음"}',
+            '{"name": ""}',
+            '{"name": "둘째", "recurring": true}',
+        ]))
+        result = task_io.read_tasks(path, existing_ids=["old"])
+        self.assertEqual([task.name for task in result.tasks], ["첫째", "둘째"])
+        self.assertEqual(result.skipped, 4)
+        self.assertTrue(result.errors[0].startswith("2행: JSON 오류"))
+
+    def test_csv_line_numbers_start_after_header(self):
+        path = self._write("tasks.csv", "name,completed\n할 일,1\n,0\n")
+        result = task_io.read_tasks(path)
+        self.assertEqual([(task.name, task.is_completed) for task in result.tasks], [("할 일", True)])
+        self.assertEqual(result.errors, ["3행: 태스크 이름이 비어 있습니다."])
+
+    def test_unsupported_extension(self):
+        with self.assertRaises(ValueError):
+            task_io.read_tasks(self._write("tasks.txt", ""))
+
+    def test_export_round_trip_includes_archive(self):
+        repository = ProfileRepository(self._tmp.name)
+        core = TodomonCore(repository=repository)
+        core.username = "tester"
+        old = core.add_task("보관될 일")
+        core.tasks.set_completed(old.id, True)
+        old.completed_at = "2000-01-01"
+        current = core.add_task("지금 할 일")
+        core.save()
+        core.archive_completed()
+
+        for name in ("backup.jsonl", "backup.csv"):
+            with self.subTest(name=name):
+                path = os.path.join(self._tmp.name, name)
+                tasks = task_io.iter_all_tasks(list(core.tasks), repository, core.username)
+                self.assertEqual(task_io.export_tasks(tasks, path), 2)
+                imported = task_io.read_tasks(path)
+                self.assertEqual([task.id for task in imported.tasks], [current.id, old.id])
+                self.assertEqual(imported.skipped, 0)
+
+    def test_reimporting_backup_skips_archived_tasks(self):
+        repository = ProfileRepository(self._tmp.name)
+        core = TodomonCore(repository=repository)
+        core.username = "tester"
+        old = core.add_task("보관될 일")
+        core.tasks.set_completed(old.id, True)
+        old.completed_at = "2000-01-01"
+        core.save()
+        core.archive_completed()
+        path = os.path.join(self._tmp.name, "backup.jsonl")
+        task_io.export_tasks(task_io.iter_all_tasks(list(core.tasks), repository, core.username), path)
+
+        result = task_io.import_tasks(core, path)
+        self.assertEqual(result.tasks, [])
+        self.assertEqual(result.skipped, 1)
+        self.assertIsNone(core.tasks.get(old.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import random
+import unittest
+
+from todomon_core import EvolutionXP, ProfileRepository, TodomonCore, XpEngine, XP_PER_TASK
+
+
+class XpEngineGainBatchTest(unittest.TestCase):
+    """gain_batch가 여러 단계를 한 번에 넘는 경험치를 반복 없이 처리하는지 확인합니다."""
+
+    def test_below_threshold_only_adds(self):
+        engine = XpEngine()
+        self.assertEqual(engine.gain_batch([10, 20]), 0)
+        self.assertEqual((engine.current_xp, engine.evolution_stage), (30, 1))
+
+    def test_exact_threshold_crosses_once(self):
+        engine = XpEngine()
+        engine.load(90, 1)
+        self.assertEqual(engine.gain(10), 1)
+        self.assertEqual((engine.current_xp, engine.evolution_stage), (0, 1))
+
+    def test_reset_mode_crosses_several_stages(self):
+        # 1단계 100XP: 90 + 250 = 340 -> 첫 단계에서 240 남고, 이후 100씩 두 번 더 넘어 40이 남음
+        engine = XpEngine(reset_on_level_up=True)
+        engine.load(90, 1)
+        self.assertEqual(engine.gain_batch([XP_PER_TASK] * 25), 3)
+        self.assertEqual((engine.current_xp, engine.evolution_stage), (40, 1))
+
+    def test_reset_mode_matches_one_by_one(self):
+        batch, single = XpEngine(), XpEngine()
+        batch.load(55, 2)
+        single.load(55, 2)
+        amounts = [XP_PER_TASK] * 47
+        levels = sum(single.gain(amount) for amount in amounts)
+        self.assertEqual(batch.gain_batch(amounts), levels)
+        self.assertEqual((batch.current_xp, batch.evolution_stage), (single.current_xp, single.evolution_stage))
+
+    def test_cumulative_mode_uses_stage_table(self):
+        # 1단계 100 + 2단계 150 = 250을 넘은 뒤 10이 남아 3단계
+        engine = XpEngine(reset_on_level_up=False)
+        self.assertEqual(engine.gain_batch([100, 150, 10]), 2)
+        self.assertEqual((engine.current_xp, engine.evolution_stage), (10, 3))
+        self.assertEqual(engine.total_xp_needed, EvolutionXP.get_xp_needed(3))
+
+
+class CoreGainXpBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.core = TodomonCore(repository=ProfileRepository("unused"), rng=random.Random(0))
+
+    def test_one_outcome_per_crossed_stage(self):
+        self.core.current_pokemon_id = 1
+        self.core.evolution_map = {1: [2], 2: [3]}
+        self.core.base_list = [10]
+        outcomes = self.core.gain_xp_batch([100, 100, 100])
+        self.assertEqual([outcome.kind for outcome in outcomes], ["evolve", "evolve", "reroll"])
+        self.assertEqual([outcome.new_id for outcome in outcomes], [2, 3, 10])
+        self.assertEqual(self.core.current_pokemon_id, 10)
+        self.assertEqual(self.core.pending_xp, 300)
+
+    def test_fallback_without_base_list(self):
+        outcomes = self.core.gain_xp_batch([100])
+        self.assertEqual([(outcome.kind, outcome.new_id) for outcome in outcomes], [("fallback", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
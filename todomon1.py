@@ -1,27 +1,44 @@
 import tkinter as tk
-import requests
 from PIL import Image, ImageTk
-from io import BytesIO
-import random
 import threading
 import concurrent.futures
 from tkinter import font as tkfont
 import sys
-import json
 import os
 import subprocess
-from tkinter import messagebox, font as tkfont, ttk # ttk 추가
+from tkinter import messagebox, filedialog, font as tkfont, ttk # ttk 추가
 from tkcalendar import Calendar # tkcalendar 추가
 import datetime
 
-USER_DATA_DIR = "user_data"
-DATA_FILE_EXT = ".json"
+from debug_panel import DebugPanel
+from history_view import HistoryView
+from deadline_notifier import DeadlineNotifier
+from xp_bar import XpBar
+from font_registry import get_font, family_for_text, is_korean, register_bundled_fonts
+import task_io
+from ui_watchdog import StallWatchdog, SamplingProfiler
+from warm_start import SpeculativeLogin
+import evolution_transition
+from event_bus import (
+    EventBus, EventMetrics, EvolutionMapLoaded, PokemonChanged, ProfileChanged, TasksAdded, TasksRemoved,
+    TasksUpdated, XpChanged,
+    PERSISTED_EVENTS, TASK_EVENTS,
+)
+import image_pipeline
+from sprite_cache import SpriteCache
+from sprite_player import ANIMATED_SPRITES_ENABLED, FrameAnimator, SpritePlayer
+from todomon_core import TodomonCore, PokemonDataService, CACHE_FILE, XP_PER_TASK, is_past_due
 
 # ----------------------------------------------------
 # 💡 캐시 파일 존재 여부 확인 및 생성 로직 추가
 # ----------------------------------------------------
-CACHE_FILE = "base_ids.json"
 CACHE_GENERATOR = "generate_cache.py"
+SELECTED_TASK_BG = "#FDEBD0" # 일괄 작업용으로 선택된 태스크 배경색
+TASK_WIDGET_CHUNK = 100 # 가져오기 후 한 번의 after 콜백에서 만드는 TaskItem 수
+FILTER_DEBOUNCE_MS = 150 # 검색어 입력 후 필터를 적용하기까지 기다리는 시간
+LAYOUT_FRAME_MS = 16 # 레이아웃(스크롤 영역/목록 너비) 갱신은 한 프레임(약 60fps)에 최대 한 번
+PROFILE_POLL_MS = 1000 # 다른 인스턴스가 프로필 파일을 바꿨는지 확인하는 간격 (stat 한 번)
+AGENDA_LABELS = {"전체": None, "지난 마감": "overdue", "오늘": "today", "이번 주": "week"}
 
 if not os.path.exists(CACHE_FILE):
     print(f"[{CACHE_FILE}] 캐시 파일이 없습니다. 생성 중...")
@@ -53,15 +70,13 @@ if not os.path.exists(CACHE_FILE):
 # 할 일 항목 클래스 (TaskItem)
 # -----------------------------------------------------------
 class TaskItem(tk.Frame):
-    """체크박스와 레이블을 포함하는 단일 할 일 항목을 나타냅니다."""
-    def __init__(self, parent_frame, task_name, app_instance, is_recurring=False, due_date=""):
+    """체크박스와 레이블을 포함하는 단일 할 일 항목을 나타냅니다. (todomon_core.Task의 뷰)"""
+    def __init__(self, parent_frame, task, app_instance):
         super().__init__(parent_frame, bg="Ivory")
-        self.task_name = task_name
+        self.task = task
         self.app = app_instance
-        # 💡 체크박스 상태: 기본값 False (체크되지 않음)
-        self.is_completed = tk.BooleanVar(value=False) 
-        self.is_recurring = is_recurring
-        self.due_date = due_date
+        # 💡 체크박스 상태: 모델의 완료 상태를 따름
+        self.is_completed = tk.BooleanVar(value=task.is_completed) 
         
         self.content_frame = tk.Frame(self, bg="Ivory")
         self.content_frame.pack(fill="x", expand=True)
@@ -77,14 +92,15 @@ class TaskItem(tk.Frame):
         )
         self.checkbox.pack(side="left", padx=(0, 5))
         
-        # 💡 태스크 이름 레이블 (한글 폰트 자동 적용 로직 포함)
-        current_font = self.app.korean_font if self.app._is_korean(task_name) else self.app.default_font
+        # 💡 태스크 이름 레이블 (한글 폰트 자동 적용 로직 포함, 폰트는 레지스트리에서 공유)
+        self._font_family = family_for_text(task.name, self.app.korean_font[0], self.app.default_font[0])
+        self._font_size = self.app.korean_font[1]
         
         self.label = tk.Label(
             self.content_frame, 
-            text=task_name, 
+            text=task.name, 
             bg="Ivory",
-            font=current_font,
+            font=get_font(self._font_family, self._font_size),
             anchor="w"
         )
         self.label.pack(side="left", fill="x", expand=True)
@@ -99,7 +115,22 @@ class TaskItem(tk.Frame):
         )
         self.info_label.pack(side="right", padx=(5, 0))
         
-        self._strikethrough_font = None
+        # 💡 이름/정보 레이블 클릭으로 일괄 작업 대상 선택/해제
+        self.is_selected = False
+        for widget in (self.label, self.info_label):
+            widget.bind("<Button-1>", lambda e: self.app.toggle_task_selection(self))
+        
+    @property
+    def task_name(self):
+        return self.task.name
+        
+    @property
+    def is_recurring(self):
+        return self.task.is_recurring
+        
+    @property
+    def due_date(self):
+        return self.task.due_date
         
     def _get_info_text(self):
         info_parts = []
@@ -112,52 +143,46 @@ class TaskItem(tk.Frame):
         
     def toggle_complete(self):
         if self.is_completed.get():
-            print(f"태스크 '{self.task_name}' 완료! (+10 XP 획득)")
+            print(f"태스크 '{self.task_name}' 완료! (+{XP_PER_TASK} XP 획득)")
 
-            self.app.gain_xp(10)  # 경험치 10 증가
-            
-            self.checkbox.config(state=tk.DISABLED)
-            
-            # 완료된 태스크에 취소선 적용
-            current_font_config = self.label.cget("font").split()
-            font_name = current_font_config[0]
-            font_size = int(current_font_config[1]) if len(current_font_config) > 1 else self.app.default_font[1]
-            self._strikethrough_font = tkfont.Font(family=font_name, size=font_size, overstrike=1)
-            self.label.config(fg="gray", font=self._strikethrough_font)
-            self.info_label.config(fg="gray")
-            
-            # 💡 [수정] is_persistent_task 변수 할당을 TaskItem 클래스 내부에서 처리
-            is_persistent_task = self.is_recurring or (self.due_date != "")
-            
-            if is_persistent_task: # 💡 [수정] 지역 변수 사용
-                self.app._schedule_daily_reset(self)         
+            self.app.complete_task(self)  # 모델 완료 처리 + 경험치 증가 (표시는 이벤트 구독에서)
         else:
             pass
         
-# -----------------------------------------------------------
-# 경험치 계산 로직 (EvolutionXP)
-# -----------------------------------------------------------
-class EvolutionXP:
-    """포켓몬의 진화 단계에 따라 필요한 총 경험치를 계산합니다."""
-    
-    BASE_XP = 100
-    XP_MULTIPLIER = 1.5
-    
-    @staticmethod
-    def get_xp_needed(evolution_stage):
-        """
-        주어진 진화 단계(1, 2, 3...)에서 다음 단계로 진화하기 위해 필요한 총 경험치입니다.
-        """
-        if evolution_stage < 1:
-            return EvolutionXP.BASE_XP
+    def show_completed(self):
+        """완료 상태로 표시합니다. (체크박스 비활성화 + 취소선)"""
+        self.is_completed.set(True)
+        self.checkbox.config(state=tk.DISABLED)
+        
+        # 완료된 태스크에 취소선 적용 (같은 글꼴/크기의 취소선 폰트 하나를 모든 태스크가 공유)
+        self.label.config(fg="gray", font=get_font(self._font_family, self._font_size, overstrike=True))
+        self.info_label.config(fg="gray")
+        
+    def show_active(self):
+        """미완료 상태로 되돌려 표시합니다."""
+        self.is_completed.set(False)
+        self.checkbox.config(state=tk.NORMAL)
+        self.label.config(fg="black", font=get_font(self._font_family, self._font_size))
+        self.info_label.config(fg="#e67e22")
+        
+    def refresh(self):
+        """다른 인스턴스에서 바뀐 이름/반복/마감일과 완료 상태를 다시 표시합니다."""
+        self._font_family = family_for_text(self.task.name, self.app.korean_font[0], self.app.default_font[0])
+        self.label.config(text=self.task.name)
+        self.info_label.config(text=self._get_info_text())
+        if self.task.is_completed:
+            self.show_completed()
+        else:
+            self.show_active()
         
-        xp_needed = EvolutionXP.BASE_XP
+    def set_selected(self, selected):
+        """일괄 작업 선택 여부를 배경색으로 표시합니다."""
+        self.is_selected = selected
+        bg = SELECTED_TASK_BG if selected else "Ivory"
+        for widget in (self, self.content_frame, self.checkbox, self.label, self.info_label):
+            widget.config(bg=bg)
+        self.checkbox.config(activebackground=bg)
         
-        for _ in range(evolution_stage - 1):
-            xp_needed *= EvolutionXP.XP_MULTIPLIER
-            
-        return int(xp_needed)
-    
 # ====================================================
 #  ResponsiveApp 클래스
 # ====================================================
@@ -168,11 +193,6 @@ class ResponsiveApp:
     
     def __init__(self, root, aspect_ratio=(9, 16)):
         # 1. 초기 설정 및 변수 초기화
-        self.current_pokemon_id = None
-        self.current_pokemon_name = "미정"
-        self.current_level = 1     # XP/레벨 시스템에 필요한 기본값
-        self.current_xp = 0
-        self.xp_needed = 100
         self.root = root
         self.aspect_ratio = aspect_ratio
         self.root.title("ToDoMonster")
@@ -183,39 +203,30 @@ class ResponsiveApp:
         self.root.geometry(f"{initial_width}x{initial_height}")
         self.root.minsize(360, 640)
         
-        self.base_pokemon_ids = []
-        
-        self.current_pokemon_id = 0
-        self.evolution_chain_ids = {} # 딕셔너리로 초기화
-        
-        self.current_pokemon_id = 1 
         self.pokemon_image = None
-        self.base_list = []
-        
-        self.completed_chains = {}
-        
-        # XP 변수
-        self.current_xp = 0
-        self.total_xp_needed = EvolutionXP.get_xp_needed(1)
-        self.evolution_stage = 1
         
         # 💡 [수정] 스레드 풀 초기화
         self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
         
-        self.loading_gif_frames = self._load_gif_frames("loading.gif") # loading.gif 파일이 있어야 함
-        self.is_loading_gif_active = False
-        self.loading_after_id = None
+        # 💡 태스크/경험치/포켓몬 상태는 UI와 분리된 코어가 관리합니다.
+        # 코어가 발행한 이벤트는 한 프레임(LAYOUT_FRAME_MS) 동안 모았다가 구독자에게 한 번에 전달합니다.
+        self.events = EventBus(scheduler=lambda flush: self.root.after(LAYOUT_FRAME_MS, flush))
+        self.core = TodomonCore(PokemonDataService(self.executor), events=self.events)
         
         # 💡 [수정] 이미지/GIF 변수 통합 및 초기화
         self.POKEMON_IMAGE_SIZE = (190, 190) # 포켓몬/GIF 표시 크기 고정 (프레임 200px보다 작게)
         self.LOADING_IMAGE_PATH = "loading.gif" # 로딩 GIF 파일 경로
         
-        self.current_pil_image = None   # 현재 포켓몬의 PIL 이미지 원본
-        self.loading_gif_frames = []    # 로딩 GIF의 PIL 프레임 목록
+        self.current_tk_image = None       # 현재 표시 중인 포켓몬 PhotoImage
+        self.sprite_cache = SpriteCache()  # (포켓몬 ID, 크기) -> 표시용 이미지 LRU (원본은 보관하지 않음)
+        self.pending_transition = None     # (새 포켓몬 ID, 이전 표시용 이미지) - 진화 전환 대기
+        self.prefetch_futures = {}         # 포켓몬 ID -> 미리 받는 표시용 이미지 Future (다음 진화, 웜 스타트)
+        self.evolution_futures = {}        # 포켓몬 ID -> 미리 받는 진화 맵 Future (웜 스타트)
+        self.loading_gif_images = []    # 로딩 GIF의 표시용 PIL 프레임 목록 (워커에서 준비됨)
+        self.loading_gif_frames = []    # 위 프레임의 PhotoImage (처음 표시할 때 만듦)
         self.frame_index = 0
         
         self.is_loading_gif_active = False # 로딩 애니메이션 활성 상태
-        self.loading_after_id = None    # 애니메이션 루프 ID
         
         #폰트 설정
         self.default_font = ("pixelFont-7-8x14-sproutLands", 14)
@@ -224,6 +235,11 @@ class ResponsiveApp:
         # 💡 드래그 스크롤 변수 추가
         self.last_y = 0
         
+        # 💡 레이아웃 갱신 요청을 프레임 단위로 모으기 위한 상태
+        self.layout_after_id = None
+        self.layout_scroll_to_end = False
+        self.last_task_list_width = None
+        
         # 2. 메인 프레임 설정
         self.main_frame = tk.Frame(root, bg="Ivory")
         root.grid_rowconfigure(0, weight=1)
@@ -234,26 +250,68 @@ class ResponsiveApp:
         self.is_recurring = tk.BooleanVar(value=False)
         self.due_date_str = tk.StringVar(value="마감일 선택")
         
+        # 💡 태스크 검색어 / 일정 필터 (코어의 TaskIndex로 조회)
+        self.search_var = tk.StringVar()
+        self.agenda_var = tk.StringVar(value="전체")
+        self.filter_after_id = None
+        
+        # 💡 마감일 달력 팝업 (처음 사용할 때 한 번만 생성 후 재사용)
+        self.calendar_popup = None
+        self.calendar = None
+        
         #사용자 로그인 관리
         self.current_user = None # 현재 로그인된 사용자 이름
         self.is_logged_in = False
         
-        #로그인 전 임시값
-        self.xp = 0
-        self.level = 1
-        self.current_pokemon_id = 1
+        # 💡 화면의 태스크 위젯 (task id -> TaskItem) 및 일괄 작업용 선택 목록
+        self.task_items = {}
+        self.selected_task_ids = set()
+        self.daily_reset_after_id = None  # 반복 태스크 자정 초기화 타이머 (하나만 유지)
+        self.profile_poll_after_id = None # 프로필 외부 변경 확인 타이머
         
-        self._load_user_data_if_exists() # 💡 데이터 로드 시도
+        self.speculative_login = SpeculativeLogin(self)
+        self._load_user_data_if_exists() # 💡 마지막 사용자 미리 준비 (로그인 창이 떠 있는 동안)
         
         # 3. 위젯 생성 및 로딩 시작
         self.create_widgets()
         self.root.bind('<Configure>', self._handle_resize)
         
+        # 💡 로딩 GIF / 애니메이션 스프라이트 재생 (창이 보이지 않으면 타이머를 멈춤)
+        self.loading_animator = FrameAnimator(self.image_label, self._next_loading_frame)
+        self.transition_animator = FrameAnimator(self.image_label, lambda: None)
+        self.sprite_player = SpritePlayer(
+            self.image_label, self.core.pokemon_service.fetch_animated_sprite, self.sprite_cache, self.POKEMON_IMAGE_SIZE
+        )
+        
         # 한글 입력 감지
         self.task_entry.bind('<KeyRelease>', self._check_korean_input)
         
-        # 💡 GIF 프레임 로드
-        self.loading_gif_frames = self._load_gif_frames("loading.gif")
+        # 💡 메인 루프 지연 감지 및 샘플링 프로파일러 (메인 스레드 대상)
+        self.watchdog = StallWatchdog(self.root, interval_ms=50, budget_ms=200)
+        self.watchdog.start()
+        self.profiler = SamplingProfiler(interval_ms=5)
+        
+        # 💡 숨겨진 디버그 패널 (Ctrl+Shift+D), 프로파일러 토글 (Ctrl+Shift+P)
+        self.debug_panel = DebugPanel(self)
+        
+        # 💡 완료 기록 창 (보관함은 이 창을 열 때만 읽음)
+        self.history_view = HistoryView(self)
+        
+        # 💡 마감일 알림 (가장 가까운 알림 시각에 맞춘 타이머 하나)
+        self.deadline_notifier = DeadlineNotifier(self.root, self._show_deadline_alerts)
+        
+        # 💡 코어 이벤트 구독: 태스크 목록, 경험치 바, 저장, 다음 진화 미리 받기, 계측
+        self.event_metrics = EventMetrics(self.events)
+        self.events.subscribe(self._render_task_events, *TASK_EVENTS)
+        self.events.subscribe(self._render_xp_events, XpChanged, ProfileChanged)
+        self.events.subscribe(self._persist_events, *PERSISTED_EVENTS)
+        self.events.subscribe(self._prefetch_evolutions, EvolutionMapLoaded)
+        self.events.subscribe(self._show_external_pokemon, PokemonChanged)
+        self.root.bind('<Control-Shift-D>', self.debug_panel.toggle)
+        self.root.bind('<Control-Shift-P>', self.debug_panel.toggle_profiler)
+        
+        # 💡 GIF 프레임 로드 (워커에서 디코딩/축소, 도착하면 애니메이션 시작)
+        self._load_gif_frames(self.LOADING_IMAGE_PATH)
         
         # 💡 [수정] 로그인 상태가 아니면 로딩 애니메이션 시작
         if not self.is_logged_in:
@@ -265,48 +323,40 @@ class ResponsiveApp:
         # self._initial_load_pokemon_chain(self.current_pokemon_id) 
         
         print("미진화체 리스트 로딩 중...")
-        self.update_xp_bar() # 경험치 바 초기 업데이트
+        self.update_xp_bar(animate=False) # 경험치 바 초기 업데이트
         
         self.root.after(0, self._show_login_window) # 로그인 창 표시
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
         
-    def show_loading_animation(self):
-        """
-        로딩 GIF 애니메이션을 시작하고, self.image_label에 표시합니다.
-        """
-        if self.loading_gif_frames and not self.is_loading_gif_active:
-            # 💡 [수정] 로딩 애니메이션 활성화 플래그 설정
-            self.is_loading_gif_active = True
-            self.frame_index = 0
-            self._animate_loading()
-        elif not self.loading_gif_frames:
-            # GIF 프레임이 없을 경우 텍스트 표시
-            self.image_label.config(text="포켓몬 로딩 중...", font=self.korean_font)
-        
     def _stop_loading_animation(self):
         """로딩 애니메이션을 중지하고 예약된 다음 호출을 취소합니다."""
         if self.is_loading_gif_active:
             self.is_loading_gif_active = False
             # 💡 [핵심] 예약된 다음 애니메이션 호출을 취소합니다.
-            if self.loading_after_id:
-                self.root.after_cancel(self.loading_after_id)
-                self.loading_after_id = None
+            self.loading_animator.stop()
             
     def _on_closing(self):
         """윈도우가 닫힐 때 사용자 데이터를 저장하고 앱을 종료합니다."""
         if self.is_logged_in:
             self.save_user_data()
+        self._stop_profile_watch()
+        self.watchdog.stop()
+        self.sprite_player.shutdown()
+        if self.profiler.is_running:
+            self.profiler.stop()
         self.executor.shutdown(wait=False)
         self.root.destroy()
         sys.exit()
         
     def _handle_resize(self, event):
         """창 크기 변경 시 UI 요소들을 업데이트합니다."""
+        # 💡 루트 <Configure>는 자식 위젯마다 전달되므로 루트 창 자신의 이벤트만 처리합니다.
+        if event.widget is not self.root:
+            return
         
         # 창 너비나 높이가 변경될 때만 실행 (x, y 이동은 무시)
-        if (event.widget == self.root and 
-            (event.width != self.root.winfo_width() or 
-             event.height != self.root.winfo_height())):
+        if (event.width != self.root.winfo_width() or 
+            event.height != self.root.winfo_height()):
             
             # 메인 프레임의 크기를 부모 창 크기에 맞춥니다.
             self.main_frame.place(
@@ -319,23 +369,22 @@ class ResponsiveApp:
         
         # 💡 [수정] 이미지 크기 조절 로직 제거 (고정 크기 사용)
         
-        self._configure_task_list()
+        self.request_layout()
         
-    def _update_pokemon_display(self, pil_image):
+    def _update_pokemon_display(self, entry):
         """
-        PIL Image 객체를 받아 크기를 조정한 후 Tkinter 레이블에 표시합니다.
+        스프라이트 캐시 항목의 표시용 이미지를 Tkinter 레이블에 표시합니다.
+        (크기 조정/배경 합성은 image_pipeline에서 끝났으므로 여기서는 PhotoImage로 감싸기만 하고,
+        만든 PhotoImage는 캐시 항목에 붙여 다음에 다시 표시할 때 재사용합니다.)
         
         Args:
-            pil_image (Image): 표시할 PIL Image 객체.
+            entry (SpriteEntry): POKEMON_IMAGE_SIZE 크기의 표시용 이미지를 담은 캐시 항목.
         """
         try:
-            target_size = self.POKEMON_IMAGE_SIZE
-            
-            # 크기 조정
-            resized_image = pil_image.resize(target_size, Image.Resampling.LANCZOS)
-            
             # ImageTk 객체 생성 (Tkinter가 사용할 수 있는 형식)
-            self.current_tk_image = ImageTk.PhotoImage(resized_image)
+            if entry.photo is None:
+                self.sprite_cache.attach_photo(entry, ImageTk.PhotoImage(entry.image))
+            self.current_tk_image = entry.photo
             
             # 💡 [핵심] 레이블 업데이트
             self.image_label.config(image=self.current_tk_image, text="")
@@ -348,31 +397,34 @@ class ResponsiveApp:
             print(f"포켓몬 디스플레이 업데이트 중 오류 발생: {e}")
             self.image_label.config(text="이미지 표시 오류")
         
-    def _configure_task_list(self):
+    def request_layout(self, scroll_to_end=False):
         """
-        태스크 리스트 업데이트
+        태스크 목록 레이아웃 갱신을 요청합니다. 여러 번 요청해도 다음 프레임에 한 번만 실행됩니다.
+        (드래그 리사이즈 중 <Configure>가 연속으로 와도 update_idletasks를 강제하지 않음)
         """
-        if hasattr(self, 'task_list_canvas') and self.task_list_canvas.winfo_exists():
-            # 💡 [수정] task_canvas_frame이 정의되지 않았으므로 main_frame 너비 사용 시도
-            self.root.update_idletasks()
-            canvas_width = self.main_frame.winfo_width() * 0.9 # relwidth 0.9 기준
-            
-            if canvas_width <= 0: return
-
-            # canvas_height = self.task_canvas_frame.winfo_height() # 높이는 relheight로 자동 조절됨
-            
-            # self.task_list_canvas.config(width=canvas_width, height=canvas_height) # Config 대신 itemconfigure 사용
-            
-            self.task_list_canvas.itemconfigure(
-                "self.task_list_frame",
-                width=int(canvas_width) # 정수로 변환
-            )
-            
-            self.root.update_idletasks()
-            self.task_list_canvas.config(
-                scrollregion=self.task_list_canvas.bbox("all")
+        self.layout_scroll_to_end = self.layout_scroll_to_end or scroll_to_end
+        if self.layout_after_id is None:
+            # 타이머 뒤 after_idle: 대기 중인 geometry 계산(idle)이 끝난 다음에 실행되도록
+            self.layout_after_id = self.root.after(
+                LAYOUT_FRAME_MS, lambda: self.root.after_idle(self._run_layout)
             )
         
+    def _run_layout(self):
+        """목록 너비(바뀐 경우만)와 스크롤 영역을 한 번에 갱신합니다."""
+        self.layout_after_id = None
+        if not hasattr(self, 'task_list_canvas') or not self.task_list_canvas.winfo_exists():
+            return
+        
+        canvas_width = self.task_list_canvas.winfo_width()
+        if canvas_width > 1 and canvas_width != self.last_task_list_width:
+            self.last_task_list_width = canvas_width
+            self.task_list_canvas.itemconfigure("self.task_list_frame", width=canvas_width)
+        
+        self.task_list_canvas.config(scrollregion=self.task_list_canvas.bbox("all"))
+        if self.layout_scroll_to_end:
+            self.layout_scroll_to_end = False
+            self.task_list_canvas.yview_moveto(1)
+        
     def initial_load_sequence(self):
         """앱 시작 시 초기 포켓몬 데이터와 UI를 로드합니다."""
         # (이 함수는 현재 _apply_loaded_data로 대체되어 사용되지 않음)
@@ -381,53 +433,39 @@ class ResponsiveApp:
     # ------------------- GIF 로딩 및 애니메이션 -------------------
     
     def _load_gif_frames(self, filename):
-        """지정된 GIF 파일에서 프레임을 로드하고 ImageTk 객체 목록으로 반환합니다."""
-        
-        # 💡 [필수] 이미지 크기 조정을 위해 self.POKEMON_IMAGE_SIZE 변수를 사용합니다.
-        # 이 변수가 __init__에 (가로, 세로) 튜플 형태로 정의되어 있다고 가정합니다.
-        try:
-            target_size = self.POKEMON_IMAGE_SIZE # 예: (180, 180)
-        except AttributeError:
-            print("경고: POKEMON_IMAGE_SIZE가 정의되지 않았습니다. 기본값 (180, 180) 사용.")
-            target_size = (180, 180) # 안전을 위한 기본값
-
-        try:
-            img = Image.open(filename)
-            frames = []
-            for i in range(img.n_frames):
-                img.seek(i)
-                
-                frame = img.copy().convert("RGBA") 
-                
-                # 💡 [핵심 수정] 로드된 프레임의 크기를 목표 크기로 조정 (ANTIALIAS 사용)
-                frame = frame.resize(target_size, Image.Resampling.LANCZOS)
-                
-                frames.append(ImageTk.PhotoImage(frame))
-            return frames
-        except FileNotFoundError:
-            print(f"오류: GIF 파일 '{filename}'을 찾을 수 없습니다. 현재 디렉토리에 있는지 확인하세요.")
-            return []
-        except Exception as e:
-            print(f"GIF 파일 로드 중 오류 발생: {e}")
-            return []
+        """GIF 프레임 준비(디코딩/축소/배경 합성)를 워커 스레드에 맡깁니다."""
+        future = self.executor.submit(image_pipeline.load_gif_frames, filename, self.POKEMON_IMAGE_SIZE)
+        future.add_done_callback(lambda f: self.root.after(0, self._apply_gif_frames, f))
+        
+    def _apply_gif_frames(self, future):
+        """(메인 스레드) 준비된 프레임을 받고, 로딩 애니메이션이 대기 중이면 시작합니다."""
+        self.loading_gif_images = future.result()
+        self.loading_gif_frames = [None] * len(self.loading_gif_images)
+        if self.is_loading_gif_active:
+            self._animate_loading()
             
     def _animate_loading(self):
-        """GIF의 다음 프레임을 표시하고 애니메이션 루프를 예약합니다."""
+        """프레임이 준비되어 있으면 로딩 애니메이션 타이머를 시작합니다."""
         if self.is_loading_gif_active and self.loading_gif_frames:
-            # 현재 프레임 인덱스 업데이트
-            self.current_gif_frame_index = (self.current_gif_frame_index + 1) % len(self.loading_gif_frames)
+            self.loading_animator.start()
             
-            # 다음 프레임 표시
-            frame = self.loading_gif_frames[self.current_gif_frame_index]
-            self.image_label.config(image=frame)
-            
-            # 💡 [핵심] 다음 프레임을 표시하도록 50ms 후에 재귀적으로 예약
-            # 이 코드가 없으면 GIF는 첫 프레임에서 멈춥니다.
-            self.loading_after_id = self.root.after(50, self._animate_loading)
+    def _next_loading_frame(self):
+        """(FrameAnimator) 로딩 GIF의 다음 프레임과 표시 시간(50ms)을 돌려줍니다."""
+        # 현재 프레임 인덱스 업데이트
+        self.current_gif_frame_index = (self.current_gif_frame_index + 1) % len(self.loading_gif_frames)
+        
+        # 다음 프레임 (PhotoImage는 처음 표시할 때 한 번만 만듭니다)
+        frame = self.loading_gif_frames[self.current_gif_frame_index]
+        if frame is None:
+            frame = ImageTk.PhotoImage(self.loading_gif_images[self.current_gif_frame_index])
+            self.loading_gif_frames[self.current_gif_frame_index] = frame
+        return frame, 50
             
     def show_loading_animation(self):
         """로딩 애니메이션을 시작합니다."""
         if not self.is_loading_gif_active:
+            self.sprite_player.stop()
+            self.transition_animator.stop()
             self.is_loading_gif_active = True
             self.image_label.config(text="")
             self.current_gif_frame_index = -1  # 0부터 시작하도록 -1로 초기화
@@ -437,317 +475,57 @@ class ResponsiveApp:
             
     # ------------------- API 통신 및 포켓몬 로딩 -------------------
     
-    def _fetch_pokemon_data(self, pokemon_id):
-        """PokeAPI에서 포켓몬 데이터와 이미지를 가져와 (이미지 객체, 이름, ID) 튜플을 반환합니다."""
-        pokemon_url = f"https://pokeapi.co/api/v2/pokemon/{pokemon_id}/"
-        
-        try: 
-            # 1. 기본 포켓몬 데이터 가져오기 (이미지 URL 포함)
-            response = requests.get(pokemon_url, timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # 2. 종(species) 데이터 가져오기 (한글 이름 포함)
-            species_url = data['species']['url']
-            species_response = requests.get(species_url, timeout=10)
-            species_response.raise_for_status()
-            species_data = species_response.json()
-            
-            # 3. 한글 이름 추출
-            korean_name = next(
-                (name_info['name'] for name_info in species_data['names'] if name_info['language']['name'] == 'ko'),
-                data['name'].capitalize()
-            )
-            
-            # 4. 이미지 URL 추출 (고화질 official-artwork 선호)
-            image_url = data['sprites']['other'].get('official-artwork', {}).get('front_default')
-            if not image_url:
-                # Fallback: 일반 스프라이트
-                image_url = data['sprites']['front_default']
-            
-            if not image_url:
-                print(f"포켓몬 이미지 URL을 찾을 수 없습니다. (ID: {pokemon_id})")
-                return None
-                
-            # 5. 이미지 다운로드
-            image_response = requests.get(image_url, timeout=10)
-            image_response.raise_for_status()
-            
-            # 6. PIL Image 객체 생성 및 RGBA로 변환 (투명도 유지)
-            pil_image = Image.open(BytesIO(image_response.content)).convert("RGBA")
-            
-            # 7. 💡 [핵심 수정] PIL Image 객체와 필요한 정보를 튜플로 반환합니다.
-            return (pil_image, korean_name, pokemon_id)
-        
-        except requests.exceptions.RequestException as e:
-            print(f"포켓몬 데이터 로드 오류 (ID: {pokemon_id}): {e}")
-            return None
-        except Exception as e:
-            print(f"포켓몬 데이터 처리 중 예상치 못한 오류 발생 (ID: {pokemon_id}): {e}")
-            return None
-        
-    def _fetch_evolution_chain_url_async(self, pokemon_id):
-        """진화 체인 URL 로드를 백그라운드 스레드로 예약하고 완료 시 콜백을 설정합니다."""
-        # 1. 스레드풀을 사용하여 URL을 가져오는 함수를 호출합니다.
-        future = self.executor.submit(self._fetch_evolution_chain_url, pokemon_id)
-        
-        # 2. 작업 완료 시 _check_evolution_chain_url_completion 콜백을 호출하도록 설정합니다.
-        future.add_done_callback(lambda f: self.root.after(0, self._check_evolution_chain_url_completion, f))
-
-    def _fetch_evolution_chain_url(self, pokemon_id):
-        """(스레드에서 실행) 진화 체인 URL을 가져옵니다."""
-        # 이 함수는 API 호출 로직을 담고, 성공 시 URL 문자열을 반환해야 합니다.
-        try:
-            # 예시: 포켓몬 종(species) 정보 API 호출
-            species_url = f"https://pokeapi.co/api/v2/pokemon-species/{pokemon_id}"
-            response = requests.get(species_url, timeout=5)
-            response.raise_for_status()
-            data = response.json()
-            
-            # 진화 체인 URL 추출
-            evo_chain_url = data.get('evolution_chain', {}).get('url')
-            return evo_chain_url
-            
-        except requests.exceptions.RequestException as e:
-            print(f"진화 종 URL 로드 오류: {e}")
-            return None # 실패 시 None 반환
-        
-    def _check_evolution_chain_url_completion(self, future):
-        """진화 체인 URL 로드 완료 후 호출됩니다."""
-        try:
-            evo_chain_url = future.result()
-            
-            if evo_chain_url:
-                # 💡 [핵심] URL을 인수로 사용하여 다음 단계인 데이터 로드를 시작합니다.
-                self._fetch_evolution_chain_data_async(evo_chain_url)
-            else:
-                print("진화 체인 URL을 찾을 수 없습니다. 진화 정보 업데이트를 건너뜁니다.")
-                
-        except Exception as e:
-            print(f"진화 체인 URL 콜백 처리 중 오류 발생: {e}")
-            # 여기서 오류가 발생하여 누락된 함수를 호출했기 때문에 기존 오류가 났을 수 있습니다.
-
-    def _fetch_evolution_chain_data_async(self, evo_chain_url):
-        """진화 체인 데이터를 백그라운드 스레드로 예약합니다."""
-        # 💡 self.executor가 __init__에서 concurrent.futures.ThreadPoolExecutor로 초기화되어 있어야 합니다.
-        future = self.executor.submit(self._fetch_evolution_chain_data, evo_chain_url)
-        future.add_done_callback(lambda f: self.root.after(0, self._check_evolution_chain_data_completion, f))
-
-    # 💡 [해결] 실제로 누락된 함수 _fetch_evolution_chain_data를 정의합니다.
-    def _fetch_evolution_chain_data(self, evo_chain_url):
-        try:
-            response = requests.get(evo_chain_url, timeout=5)
-            response.raise_for_status()
-            data = response.json()
-            
-            # 💡 필요한 데이터만 파싱하여 반환합니다. (여기서는 간단히 전체 데이터를 반환)
-            # 실제 구현에서는 필요한 진화 단계 정보를 추출하여 반환해야 합니다.
-            return data 
-        except requests.exceptions.RequestException as e:
-            print(f"진화 체인 데이터 로드 오류: {e}")
-            return None # 실패 시 None 반환
-        
-    def _check_evolution_chain_data_completion(self, future):
-        try:
-            # 💡 진화 체인 데이터 (dict 또는 None)
-            evo_data = future.result() 
-            
-            if evo_data:
-                print("진화 체인 데이터 로드 완료. UI 업데이트 필요.")
-                # 💡 여기에 진화 체인 데이터를 파싱하여 UI에 표시하는 로직을 구현해야 합니다.
-                # 예: self._update_evolution_info(evo_data)
-            else:
-                print("진화 체인 데이터 로드 실패.")
-        except Exception as e:
-            print(f"진화 체인 데이터 콜백 처리 중 오류 발생: {e}")
-
-    def _parse_evolution_chain(self, url):
-        """진화 체인 URL에서 포켓몬 ID 목록을 파싱합니다."""
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            chain_data = response.json()['chain']
-            
-            evolution_map = {}
-            
-            def extract_chain(chain):
-                current_id = int(chain['species']['url'].split('/')[-2])
-                next_evolutions = []
-                
-                for evo in chain['evolves_to']:
-                    next_id = int(evo['species']['url'].split('/')[-2])
-                    next_evolutions.append(next_id)
-                    extract_chain(evo) # 재귀적으로 다음 단계 처리
-                    
-                if next_evolutions:
-                    evolution_map[current_id] = next_evolutions
-                
-            extract_chain(chain_data)
-            return evolution_map
-        except requests.exceptions.RequestException as e:
-            print(f"진화 체인 로드 오류 (URL: {url}): {e}")
-            return {}
-
-    def _initial_load_pokemon_chain(self, pokemon_id):
+    def _initial_load_pokemon_chain(self, pokemon_id, transition_from=None):
         """
         주어진 ID의 포켓몬 데이터를 로드하고 진화 체인을 구성합니다.
         (💡 [수정] 로딩 애니메이션을 먼저 시작합니다.)
+        transition_from(이전 포켓몬의 표시용 이미지)을 주면 로딩 GIF 대신 이전 포켓몬을 그대로 두었다가
+        새 이미지가 준비되면 진화 전환 애니메이션을 보여줍니다.
         """
+        self.pending_transition = (pokemon_id, transition_from) if transition_from is not None else None
         
-        if not self.is_loading_gif_active:
-            self.show_loading_animation()
-        
-        pokemon_future = self.executor.submit(self._fetch_pokemon_data, pokemon_id)
-        
-        evolution_future = self.executor.submit(self._fetch_evolution_chain_url, pokemon_id)
-        evolution_future.add_done_callback(self._load_evolution_chain_done)
-        
-        self.root.after(100, self._check_pokemon_load_completion, pokemon_future)
-        
-    def _load_evolution_chain_done(self, future):
-        """
-        [콜백 함수] 진화 체인 URL 로드가 완료된 후 호출되어 진화 정보를 로드하는
-        다음 스레드 작업을 시작합니다.
-        
-        Args:
-            future: concurrent.futures.Future 객체. 이 객체의 result()는
-                    진화 체인 URL 문자열을 반환합니다.
-        """
-        try:
-            # _fetch_evolution_chain_url의 결과(진화 체인 URL)를 가져옵니다.
-            chain_url = future.result()
+        # 💡 최근에 본 포켓몬은 캐시에서 바로 다시 표시합니다. (다운로드/디코딩 없음)
+        entry = self.sprite_cache.get(pokemon_id, self.POKEMON_IMAGE_SIZE)
+        if entry is not None:
+            self._stop_loading_animation()
+            self._show_pokemon_entry(pokemon_id, entry)
+        else:
+            if not self.is_loading_gif_active and self.pending_transition is None:
+                self.show_loading_animation()
             
-            if chain_url:
-                print(f"진화 체인 URL 로드 완료: {chain_url}")
-                # 💡 진화 체인 URL을 사용하여 실제 진화 정보를 로드하는 새 스레드 작업 시작
-                # 이 함수(_fetch_evolution_chain_data)가 다음 포켓몬 ID 목록을 self.evolution_chain_ids에 저장해야 합니다.
-                self.executor.submit(self._fetch_evolution_chain_data, chain_url)
-            else:
-                print("진화 체인 URL 로드 실패. (진화 체인 정보 없음)")
-                # 진화 체인이 없는 포켓몬일 수 있으므로, 오류 대신 빈 리스트로 초기화합니다.
-                self.evolution_chain_ids = []
-                
-        except Exception as e:
-            # 스레드 실행 중 발생한 예외 처리
-            print(f"진화 체인 URL 콜백 처리 중 오류 발생: {e}")
-            self.evolution_chain_ids = []
+            # 💡 다운로드부터 표시용 이미지 준비까지 워커에서 끝내고, 완료되면 메인 스레드로 전달합니다.
+            # (다음 진화로 미리 받는 중이었다면 그 작업의 결과를 기다립니다)
+            pokemon_future = self.prefetch_futures.pop(pokemon_id, None) or self.executor.submit(
+                image_pipeline.fetch_display_pokemon, self.core.pokemon_service, pokemon_id, self.POKEMON_IMAGE_SIZE
+            )
+            pokemon_future.add_done_callback(
+                lambda f: self.root.after(0, self._check_pokemon_load_completion, pokemon_id, f)
+            )
         
-    def _check_pokemon_load_completion(self, future):
-        """백그라운드 포켓몬 로드 작업이 완료되었는지 확인하고 UI를 업데이트합니다."""
-        if future.done():
-            self._stop_loading_animation() 
-            try:
-                # 💡 [핵심] 스레드 작업 결과를 가져옵니다. 
-                # (pil_image, name, id) 튜플을 기대합니다.
-                result = future.result()
-                
-                # 1. 결과 유효성 및 타입 검사
-                # 결과가 튜플이고, 첫 번째 요소가 'resize' 속성을 가진 Image 객체인지 확인
-                if (isinstance(result, tuple) and 
-                    len(result) == 3 and 
-                    hasattr(result[0], 'resize')):
-                    
-                    pil_image, name, p_id = result
-                    
-                    # 2. [오류 2 해결] 다음 콜백을 위해 필수 속성 저장
-                    self.current_pokemon_name = name
-                    self.current_pokemon_id = p_id
-                    
-                    # 3. 이미지 업데이트
-                    self._update_pokemon_display(pil_image)
-                    
-                    # 4. 정보 업데이트 (레벨 정보가 설정되어 있어야 함)
-                    # self.current_level, self.current_xp, self.xp_needed가 정의되어 있다고 가정
-                    self.xp_info_label.config(text=f"Lv.{self.current_level} {name} ({self.current_xp}/{self.xp_needed})")
-                    
-                    # 5. 진화 체인 로딩 시작 (다음 단계 콜백 호출)
-                    # p_id(포켓몬 ID)를 인수로 전달하여 진화 체인 URL 로드를 시작합니다.
-                    self._fetch_evolution_chain_url_async(p_id) 
-
-                else:
-                    # 데이터가 딕셔너리이거나 잘못된 형식일 때의 처리
-                    self.image_label.config(text="이미지 로드 실패 (데이터 형식 오류)", font=self.korean_font)
+        # 💡 진화 맵은 완료 시 메인 스레드에서 코어에 반영합니다. (웜 스타트로 받는 중이면 이어받음)
+        evolution_future = self.evolution_futures.pop(pokemon_id, None) or self.executor.submit(
+            self.core.pokemon_service.fetch_evolution_map, pokemon_id
+        )
+        evolution_future.add_done_callback(
+            lambda f: self.root.after(0, self._apply_evolution_map, pokemon_id, f)
+        )
 
-            except Exception as e:
-                # 로드 중 오류 발생 시 처리
-                print(f"포켓몬 데이터 로드 중 치명적인 오류 발생: {e}")
-                self.image_label.config(text="이미지 로드 실패", font=self.korean_font)
-                
-    def _load_pokemon_data_thread(self, pokemon_id):
-        """(스레드 실행용) 포켓몬 데이터와 이미지를 로드합니다."""
         
-        data = self._fetch_pokemon_data(pokemon_id)
-            
-        if data:
-            image_url = data['sprites']['front_default']
-            raw_image = self._load_pokemon_image_from_url(image_url) # PIL 이미지 반환
-                
-            species_url = data['species']['url']
-            species_id = int(species_url.split('/')[-2])
-            chain_url = self._fetch_evolution_chain_url(species_id)
-                
-            if chain_url:
-                self.evolution_chain_ids = self._parse_evolution_chain(chain_url)
-            else:
-                self.evolution_chain_ids = {}
-                    
-            self.current_pokemon_id = pokemon_id
-            self.pokemon_name = data.get('korean_name', data['name'].capitalize())
-            self.pokemon_gender_rate = data.get('gender_rate', -1)
-                
-            # 7. 메인 스레드에서 UI 업데이트 요청
-            self.root.after(0, 
-                            self._update_ui_elements, 
-                            raw_image,
-                            self.pokemon_name, 
-                            pokemon_id)
-                
-            print(f"포켓몬 데이터 로드 완료: {self.pokemon_name} (ID: {pokemon_id})")
-        else:
-            # 로드 실패 시
-            self.pokemon_image = None
-            self.root.after(0, self._update_ui_elements, None, "로딩 실패", 0)
-            
-    def _update_ui_elements(self, raw_image, pokemon_name, pokemon_id):
-        """💡 [수정] 메인 스레드 콜백. 로딩을 중지하고 포켓몬 이미지를 표시합니다."""
-        
-        # 1. 로딩 중지
-        self._stop_loading_animation() 
-        
-        if raw_image:
-            self.current_pil_image = raw_image
-            # 2. 이미지 표시 (리사이징은 _update_pokemon_display에서 처리)
-            self._update_pokemon_display(raw_image) 
-            # 3. 정보 업데이트
-            self.update_pokemon_info(pokemon_name, pokemon_id)
-        else:
-            # 4. 실패 처리
-            self.image_label.config(text="이미지 로드 실패", image='', width=self.POKEMON_IMAGE_SIZE[0], height=self.POKEMON_IMAGE_SIZE[1])
-            self.update_pokemon_info(f"{pokemon_name} (실패)", pokemon_id)
-            self.current_pil_image = None
-        
-    def _load_pokemon_image_from_url(self, url, size=None):
-        """💡 [수정] URL에서 PIL Image 객체를 다운로드하고 고정 크기로 리사이즈합니다."""
+    def _apply_evolution_map(self, pokemon_id, future):
+        """(메인 스레드) 진화 맵 로드 결과를 코어에 반영합니다."""
         try:
-            image_response = requests.get(url, timeout=10)
-            image_response.raise_for_status()
-            image_data = image_response.content
-            
-            image = Image.open(BytesIO(image_data))
-            
-            # 💡 [수정] size 인자 대신 고정 크기(POKEMON_IMAGE_SIZE) 사용
-            img_width, img_height = self.POKEMON_IMAGE_SIZE
-            image = image.resize((img_width, img_height), Image.Resampling.LANCZOS)
-            
-            return image
-        except requests.exceptions.RequestException as e:
-            print(f"이미지 로드 오류 (URL: {url}): {e}")
-            return None
+            evolution_map = future.result()
+            self.core.set_evolution_map(pokemon_id, evolution_map)
+            if not evolution_map:
+                print("진화 체인 정보 없음. (최종 진화 시 새로운 포켓몬을 선택합니다)")
+        except Exception as e:
+            print(f"진화 체인 처리 중 오류 발생: {e}")
             
     def display_pokemon(self):
         """(로그인 시) 이미 로드된 포켓몬 이미지를 표시합니다."""
-        if self.current_pil_image:
-             self._update_pokemon_display(self.current_pil_image)
+        if self.current_tk_image:
+            self.image_label.config(image=self.current_tk_image, text="")
+            self.image_label.image = self.current_tk_image
         elif self.pokemon_image: # self.pokemon_image는 PhotoImage
             self.image_label.config(image=self.pokemon_image)
             self.image_label.image = self.pokemon_image
@@ -761,50 +539,45 @@ class ResponsiveApp:
         self.pokemon_info_label.config(text=status_text)
         
     # ------------------- XP 증가 및 진화 로직 -------------------
+    def complete_task(self, task_item):
+        """태스크를 코어에서 완료 처리합니다. (목록/경험치 바/저장은 이벤트 구독자가 다음 프레임에 반영)"""
+        self._apply_xp_outcomes(self.core.complete_task(task_item.task.id))
+        
     def gain_xp(self, amount):
         """경험치를 증가시키고 진화/재선택 로직을 처리합니다."""
-        self.current_xp += amount
-        self.root.after(0, self.update_xp_bar)
+        self._apply_xp_outcomes(self.core.gain_xp(amount))
         
-        if self.current_xp >= self.total_xp_needed:
-            self.current_xp -= self.total_xp_needed # 초과 경험치 남기기
-            self.evolution_stage += 1
-            self.total_xp_needed = EvolutionXP.get_xp_needed(self.evolution_stage)
-            
-            current_id = self.current_pokemon_id
-            next_evolutions = self.evolution_chain_ids.get(current_id, [])
-            
-            if next_evolutions:
-                new_id = next_evolutions[0] 
-                messagebox.showinfo("진화!", f"{self.pokemon_name}이(가) 새로운 포켓몬으로 진화합니다!")
-                self._change_pokemon(new_id)
+    def _apply_xp_outcomes(self, outcomes):
+        """
+        포켓몬이 바뀌었으면 알림 후 최종 포켓몬만 로드합니다.
+        💡 여러 단계를 한 번에 넘어도 알림/로드는 각각 한 번만 합니다. (경험치 바와 저장은 XpChanged 구독자)
+        """
+        if outcomes:
+            first, last = outcomes[0], outcomes[-1]
+            if len(outcomes) > 1:
+                messagebox.showinfo("연속 진화!", f"{first.previous_name}이(가) 경험치를 한꺼번에 얻어 {len(outcomes)}번 바뀌었습니다!")
+            elif first.kind == "evolve":
+                messagebox.showinfo("진화!", f"{first.previous_name}이(가) 새로운 포켓몬으로 진화합니다!")
             else:
-                messagebox.showinfo("만렙!", f"{self.pokemon_name}은(는) 최종 진화 단계입니다! 새로운 포켓몬을 선택합니다.")
-                self._change_pokemon_randomly()
-        
-        self.save_user_data()
-
-    def _change_pokemon(self, new_id):
-        """포켓몬 ID를 변경하고 새로운 포켓몬 데이터를 로드합니다."""
-        self.current_pokemon_id = new_id
-        self.evolution_stage = 1
-        self.total_xp_needed = EvolutionXP.get_xp_needed(1)
-        
-        # 💡 [수정] 스레드 직접 생성 대신 _initial_load_pokemon_chain 호출
-        self._initial_load_pokemon_chain(new_id)
-        
-    def _change_pokemon_randomly(self):
-        """미진화체 목록에서 랜덤으로 새 포켓몬을 선택합니다."""
-        if self.base_list:
-            new_id = random.choice(self.base_list)
-            self._change_pokemon(new_id)
-        else:
-            messagebox.showerror("오류", "미진화체 목록이 로드되지 않아 새로운 포켓몬을 선택할 수 없습니다.")
-            self._change_pokemon(1) # 오류 시 기본값 1번으로 변경
+                messagebox.showinfo("만렙!", f"{first.previous_name}은(는) 최종 진화 단계입니다! 새로운 포켓몬을 선택합니다.")
+            if any(outcome.kind == "fallback" for outcome in outcomes):
+                messagebox.showerror("오류", "미진화체 목록이 로드되지 않아 새로운 포켓몬을 선택할 수 없습니다.")
+            
+            # 💡 [수정] 스레드 직접 생성 대신 _initial_load_pokemon_chain 호출
+            # (진화 전 포켓몬 이미지가 캐시에 있으면 전환 애니메이션으로 바꿉니다)
+            previous = self.sprite_cache.get(first.previous_id, self.POKEMON_IMAGE_SIZE)
+            self._initial_load_pokemon_chain(last.new_id, previous.image if previous is not None else None)
 
-    def _schedule_daily_reset(self, task_item):
-        """매일 반복 태스크의 경우 다음 날 자정에 완료 상태를 해제하도록 예약합니다."""
-        if not task_item.is_recurring:
+    def _schedule_daily_reset(self, task_item=None):
+        """
+        완료된 매일 반복 태스크를 다음 날 자정에 초기화하도록 예약합니다.
+        태스크마다 타이머를 걸지 않고 자정 타이머 하나만 유지합니다.
+        (일정 필터가 켜져 있을 때도 같은 타이머로 날짜가 바뀐 뒤 필터를 다시 계산합니다)
+        (태스크별 타이머는 삭제/로그아웃 뒤에도 파괴된 TaskItem을 자정까지 붙잡고 있었음)
+        """
+        if task_item is not None and not task_item.is_recurring:
+            return
+        if self.daily_reset_after_id is not None:
             return
             
         now = datetime.datetime.now()
@@ -813,105 +586,59 @@ class ResponsiveApp:
         
         time_until_reset = (reset_time - now).total_seconds() * 1000 # 밀리초 변환
         
-        print(f"'{task_item.task_name}' 태스크는 {reset_time.strftime('%Y-%m-%d %H:%M:%S')}에 초기화됩니다.")
+        print(f"반복 태스크는 {reset_time.strftime('%Y-%m-%d %H:%M:%S')}에 초기화됩니다.")
         
-        self.root.after(int(time_until_reset), self._reset_task_completion, task_item)
+        self.daily_reset_after_id = self.root.after(int(time_until_reset), self._reset_task_completion)
         
-    def _reset_task_completion(self, task_item):
-        """매일 반복 태스크의 완료 상태를 해제하고 UI를 초기화합니다."""
-        if task_item.is_recurring:
-            task_item.is_completed.set(False)
-            task_item.checkbox.config(state=tk.NORMAL)
-            
-            task_item.label.config(fg="black", font=task_item.app.korean_font)
-            task_item.info_label.config(fg="#e67e22")
-            
-            print(f"'{task_item.task_name}' 태스크가 초기화되었습니다.")
-            
-            self._schedule_daily_reset(task_item)
+    def _cancel_daily_reset(self):
+        if self.daily_reset_after_id is not None:
+            self.root.after_cancel(self.daily_reset_after_id)
+            self.daily_reset_after_id = None
+        
+    def _reset_task_completion(self):
+        """(자정 타이머) 완료된 매일 반복 태스크의 완료 상태를 모두 해제하고 UI를 초기화합니다."""
+        self.daily_reset_after_id = None
+        reset_tasks = self.core.reset_tasks(
+            [task.id for task in self.core.tasks if task.is_recurring and task.is_completed]
+        )
+        if reset_tasks:
+            print(f"반복 태스크 {len(reset_tasks)}개가 초기화되었습니다.")
+        # 💡 오늘/이번 주 필터는 날짜 기준이 바뀌었으므로 목록 전체를 다시 계산하고 다음 자정도 예약합니다.
+        if AGENDA_LABELS[self.agenda_var.get()]:
+            self._apply_task_filter()
+            self._schedule_daily_reset()
 
     # ------------------- 사용자 데이터 저장/로드 및 로그인 로직 -------------------
     
     def _get_user_filepath(self, username):
         """사용자 데이터 파일 경로를 반환합니다."""
-        if not os.path.exists(USER_DATA_DIR):
-            os.makedirs(USER_DATA_DIR)
-        return os.path.join(USER_DATA_DIR, f"{username}{DATA_FILE_EXT}")
+        return self.core.repository.path_for(username)
         
     def save_user_data(self):
         """현재 사용자의 태스크, XP, 포켓몬 현황을 파일에 저장합니다."""
         if not self.is_logged_in:
             return
         
-        data = {
-            "xp": self.current_xp,
-            "level": self.evolution_stage,
-            "current_pokemon_id": self.current_pokemon_id,
-            "tasks": []
-        }
-        
-        for widget in self.task_list_frame.winfo_children():
-            if isinstance(widget, TaskItem):
-                task_data = {
-                    "name": widget.task_name,
-                    "completed": widget.is_completed.get(),
-                    "recurring": widget.is_recurring,
-                    "due_date": widget.due_date
-                }
-                data["tasks"].append(task_data)
-        
-        filepath = self._get_user_filepath(self.current_user)
-        
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+            self.core.save()
             print(f"[{self.current_user}] 데이터 저장 완료.")
         except Exception as e:
             messagebox.showerror("저장 오류", f"사용자 데이터 저장 중 오류 발생: {e}")
 
     def load_base_list_sync(self):
         """미진화체 목록을 동기적으로 로드합니다. 앱 시작 시 로그인 전에 호출됩니다."""
-        if os.path.exists(CACHE_FILE):
-            try:
-                with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                    if isinstance(data, dict):
-                        self.base_list = data.get("base_ids", [])
-                    elif isinstance(data, list):
-                        self.base_list = data
-                    else:
-                        print("경고: 캐시 파일 내용이 딕셔너리 또는 리스트가 아닙니다.")
-                        self.base_list = []
-                        
-                    print(f"[{CACHE_FILE}] 동기 로드 완료. 미진화체 {len(self.base_list)}종.")
-
-            except Exception as e:
-                print(f"캐시 파일 로드 중 오류 발생: {e}") 
-                self.base_list = [] 
-                
-        else:
-            print("캐시 파일이 존재하지 않아 미진화체 목록 로드 실패. (generate_cache.py 확인 필요)")
-            self.base_list = []
+        self.core.base_list = self.core.pokemon_service.load_base_list(CACHE_FILE)
 
     def update_scrollregion(self):
-        self.task_list_frame.update_idletasks()
-        self.task_list_canvas.config(scrollregion=self.task_list_canvas.bbox("all"))
-        frame_width = self.task_list_canvas.winfo_width()
-        if frame_width > 0:
-            self.task_list_canvas.itemconfigure(
-                "self.task_list_frame", width=frame_width
-            )
-        self.task_list_canvas.yview_moveto(1)
+        """목록 내용이 바뀐 뒤 스크롤 영역을 갱신하고 맨 아래로 이동합니다. (다음 프레임에 한 번만 실행)"""
+        self.request_layout(scroll_to_end=True)
 
     def load_user_data(self, username):
         """지정된 사용자의 데이터를 파일에서 로드합니다."""
-        filepath = self._get_user_filepath(username)
-        if not os.path.exists(filepath):
-            return None # 파일 없음
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = self.core.repository.load(username)
+            if data is None:
+                return None # 파일 없음
             print(f"[{username}] 데이터 로드 완료.")
             return data
         except Exception as e:
@@ -919,82 +646,102 @@ class ResponsiveApp:
             return None
             
     def _load_user_data_if_exists(self):
-        """앱 시작 시 마지막 로그인 사용자 데이터가 있으면 로드합니다."""
-        pass # 로그인 창에서 처리
+        """
+        마지막 로그인 사용자가 있으면 로그인 창이 떠 있는 동안 프로필과 포켓몬을 미리 준비합니다.
+        (같은 사용자로 로그인하면 바로 표시, 다른 사용자면 버림 - warm_start.SpeculativeLogin)
+        """
+        try:
+            last_user = self.core.repository.last_user()
+        except OSError as e:
+            print(f"마지막 사용자 기록을 읽는 중 오류 발생: {e}")
+            return
+        if last_user:
+            self.speculative_login.start(last_user)
     
     def _logout_user(self):
         """현재 사용자를 로그아웃하고 모든 데이터를 저장한 후, 로그인 화면으로 돌아갑니다."""
         if self.current_user:
             #self._save_user_data(self.current_user)
+            self.events.flush() # 아직 전달되지 않은 변경(저장 포함)을 이 사용자로 마무리
+            self._stop_profile_watch()
             self.current_user = None
             self.is_logged_in = False
             
-            # XP, 레벨 등 임시값으로 초기화
-            self.xp = 0
-            self.level = 1
-            self.current_pokemon_id = 1
+            # XP, 레벨 등 코어 상태 초기화
+            self.core.reset()
             
-            # UI 초기화 (태스크 리스트, XP 바 등)
+            # UI 초기화 (태스크 리스트 / XP 바는 ProfileChanged 구독자가 갱신)
             self.clear_task_list()
-            self.update_xp_bar() 
             
             # 포켓몬 이미지 초기화 및 로딩 애니메이션 다시 시작
             self.image_label.config(image='', text="로그인이 필요합니다.")
             self.show_loading_animation()
             
-            # 로그인 창 다시 표시
+            # 로그인 창 다시 표시 (방금 로그아웃한 사용자를 다시 미리 준비)
+            self._load_user_data_if_exists()
             self.root.after(100, self._show_login_window)
             
             # 💡 [추가] 로그아웃 버튼 숨김 (로그인 창에서는 필요 없음)
             self.logout_button.place_forget()
 
     def _apply_loaded_data(self, data):
-        """로드된 데이터를 앱의 상태에 적용합니다."""
-        self.current_xp = data.get("xp", 0)
-        self.evolution_stage = data.get("level", 1)
-        self.total_xp_needed = EvolutionXP.get_xp_needed(self.evolution_stage)
-        
-        if "current_pokemon_id" in data:
-            self.current_pokemon_id = data["current_pokemon_id"]
-        else:
-            if self.base_list:
-                self.current_pokemon_id = random.choice(self.base_list) 
-            else:
-                self.current_pokemon_id = 1 
+        """로드된 데이터를 코어에 적용하고 화면을 다시 구성합니다."""
+        # 💡 오래된 완료 태스크는 core.login에서 보관함으로 옮겨 위젯을 만들지 않습니다. (기록 화면에서만 읽음)
+        try:
+            self.core.login(self.current_user, data)
+        except OSError as e:
+            print(f"완료 태스크 보관 중 오류 발생: {e}")
         
         # 💡 [수정] 포켓몬 데이터 로드 시작
-        self._initial_load_pokemon_chain(self.current_pokemon_id)
-        self.update_xp_bar() 
+        self._initial_load_pokemon_chain(self.core.current_pokemon_id)
 
         # 기존 태스크 목록 정리
         for widget in self.task_list_frame.winfo_children():
             widget.destroy()
+        self.task_items = {}
+        self.selected_task_ids = set()
 
         # 태스크 목록 복원
-        for task_data in data.get("tasks", []):
-            task_item = TaskItem(
-                self.task_list_frame, 
-                task_data["name"], 
-                self, 
-                is_recurring=task_data.get("recurring", False),
-                due_date=task_data.get("due_date", "")
-            )
+        for task in self.core.tasks:
+            task_item = TaskItem(self.task_list_frame, task, self)
             task_item.pack(fill="x", padx=10, pady=2)
+            self.task_items[task.id] = task_item
             
-            if task_data.get("completed", False):
-                task_item.is_completed.set(True)
-                task_item.checkbox.config(state=tk.DISABLED)
-                current_font_config = task_item.label.cget("font").split()
-                font_name = current_font_config[0]
-                font_size = int(current_font_config[1]) if len(current_font_config) > 1 else self.default_font[1]
-                strikethrough_font = tkfont.Font(family=font_name, size=font_size, overstrike=1)
-                task_item.label.config(fg="gray", font=strikethrough_font)
-                task_item.info_label.config(fg="gray")
+            if task.is_completed:
+                task_item.show_completed()
                 
-                if task_data.get("recurring", False):
+                if task.is_recurring:
                     self._schedule_daily_reset(task_item)
 
+        if self._filter_active():
+            self._on_agenda_changed()
         self.update_scrollregion()
+        self.deadline_notifier.rebuild(self.core.tasks)
+        self._start_profile_watch()
+
+    # ------------------- 여러 인스턴스 동기화 -------------------
+    # 💡 같은 프로필을 다른 Todomon 인스턴스/동기화 도구가 바꾸면, 파일 서명(stat)을 주기적으로 비교해
+    # 바뀐 레코드만 코어에 병합합니다. 화면은 병합이 발행한 이벤트로 갱신됩니다. (저장 시 병합은 core.save)
+
+    def _start_profile_watch(self):
+        self._stop_profile_watch()
+        self.profile_poll_after_id = self.root.after(PROFILE_POLL_MS, self._poll_profile)
+
+    def _stop_profile_watch(self):
+        if self.profile_poll_after_id is not None:
+            self.root.after_cancel(self.profile_poll_after_id)
+            self.profile_poll_after_id = None
+
+    def _poll_profile(self):
+        self.profile_poll_after_id = None
+        if not self.is_logged_in:
+            return
+        try:
+            if self.core.sync_external():
+                print(f"[{self.current_user}] 다른 곳에서 바뀐 데이터를 반영했습니다.")
+        except (OSError, ValueError) as e:
+            print(f"프로필 변경 확인 중 오류 발생: {e}") # 쓰는 중이거나 잠겨 있으면 다음 확인 때 다시 시도
+        self.profile_poll_after_id = self.root.after(PROFILE_POLL_MS, self._poll_profile)
 
     def _login_or_create_user(self, username, login_window):
         """사용자로 로그인하거나 새 사용자를 생성하고 데이터를 로드합니다."""
@@ -1003,14 +750,19 @@ class ResponsiveApp:
             messagebox.showerror("오류", "사용자 이름을 입력해주세요.")
             return
             
-        data = self.load_user_data(username)
+        # 💡 미리 준비한 사용자면 읽어 둔 프로필을 쓰고, 아니면 준비한 것을 버리고 지금 읽습니다.
+        data = self.speculative_login.take(username)
+        if data is not None:
+            print(f"[{username}] 미리 읽어 둔 데이터를 사용합니다.")
+        else:
+            data = self.load_user_data(username)
         
         if data is None:
             if messagebox.askyesno("새 사용자", f"'{username}' 사용자가 없습니다. 새로 생성하시겠습니까?"):
                 self.current_user = username
                 self.is_logged_in = True
                 self._apply_loaded_data({}) # 새 사용자, 랜덤 포켓몬 할당
-                messagebox.showinfo("성공", f"새 사용자 '{username}'님 환영합니다!")
+                welcome = f"새 사용자 '{username}'님 환영합니다!"
             else:
                 return
         else:
@@ -1018,10 +770,16 @@ class ResponsiveApp:
             self.current_user = username
             self.is_logged_in = True
             self._apply_loaded_data(data) # 저장된 데이터 로드
-            messagebox.showinfo("성공", f"'{username}'님 환영합니다! 데이터가 로드되었습니다.")
+            # 💡 기존 사용자는 환영 팝업 없이 바로 화면을 보여줍니다. (모달이 미리 받은 화면 표시를 막았음)
+            print(f"'{username}'님 환영합니다! 데이터가 로드되었습니다.")
+            welcome = None
             
         # 💡 [수정] 로그인 성공 시 팝업 닫기 및 UI 업데이트
         login_window.destroy()
+        try:
+            self.core.repository.remember_last_user(username)
+        except OSError as e:
+            print(f"마지막 사용자 기록 중 오류 발생: {e}")
         
         # 💡 [수정] _stop_loading_animation은 _apply_loaded_data -> _initial_load.. -> _update_ui_elements에서 호출됨
         # self._stop_loading_animation() 
@@ -1030,6 +788,9 @@ class ResponsiveApp:
         self.logout_button.place(relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
         self._show_xp_bar() 
         self.root.title(f"To Do Monster - {self.current_user}")
+        if welcome:
+            # 화면이 그려진 뒤에 띄웁니다.
+            self.root.after_idle(messagebox.showinfo, "성공", welcome)
 
     def _show_login_window(self):
         """로그인 또는 사용자 생성 팝업을 표시합니다."""
@@ -1043,6 +804,10 @@ class ResponsiveApp:
         
         username_entry = tk.Entry(login_window)
         username_entry.pack(pady=5, padx=20, fill="x")
+        if self.speculative_login.username:
+            # 마지막 사용자를 미리 채워 둡니다. (Enter만 누르면 미리 준비한 상태로 로그인)
+            username_entry.insert(0, self.speculative_login.username)
+            username_entry.select_range(0, tk.END)
         username_entry.focus_set()
         
         # 💡 [삭제] 로컬 login_action 함수 삭제 (attempt_login이 _login_or_create_user를 호출하도록)
@@ -1056,49 +821,22 @@ class ResponsiveApp:
         username_entry.bind('<Return>', attempt_login)
         
     def logout(self):
-        """현재 사용자를 로그아웃합니다."""
-        if self.is_logged_in:
-            self.save_user_data() # 데이터 저장
-            self.is_logged_in = False
-            self.current_user = None
-            self.root.title("ToDoMonster")
-            self._hide_xp_bar()
-            self.logout_button.place_forget()
-            
-            # UI 초기화 (태스크 목록 비우기)
-            for widget in self.task_list_frame.winfo_children():
-                widget.destroy()
-            self.task_entry.delete(0, tk.END)
-            
-            # 💡 [수정] 포켓몬 이미지 로딩 애니메이션 다시 시작
-            self.show_loading_animation() 
-            self.pokemon_info_label.config(text="이름: ?, 도감번호: ?")
-            
-            self._show_login_window()
+        """현재 사용자를 로그아웃합니다. (예전 이름, _logout_user와 같은 절차)"""
+        self._logout_user()
             
     # ------------------- 유틸리티 -------------------
     
     def _is_korean(self, text):
-        """주어진 텍스트에 한글 문자가 포함되어 있는지 확인합니다."""
-        if not text: return False
-        # 한글 유니코드 범위: 가(0xAC00) ~ 힣(0xD7A3)
-        for char in text:
-            if 0xAC00 <= ord(char) <= 0xD7A3:
-                return True
-        return False
+        """주어진 텍스트에 한글 문자가 포함되어 있는지 확인합니다. (결과는 font_registry에서 캐시)"""
+        return is_korean(text)
         
     def _check_korean_input(self, event):
-        """ 키 입력이 해제될 때마다 입력된 텍스트를 확인하고 폰트를 변경합니다. """
-        current_text = self.task_entry.get()
-        current_font_name = self.task_entry.cget("font").split()[0]
-        korean_font_name = self.korean_font[0]
-        default_font_name = self.default_font[0]
-        
-        # 입력 박스 폰트 크기는 고정 24 사용
-        if self._is_korean(current_text) and current_font_name != korean_font_name:
-            self.task_entry.config(font=(korean_font_name, 24))
-        elif not self._is_korean(current_text) and current_font_name != default_font_name:
-            self.task_entry.config(font=(default_font_name, 24))
+        """ 키 입력이 해제될 때마다 입력된 텍스트를 확인하고, 글꼴이 바뀌어야 할 때만 폰트를 변경합니다. """
+        family = family_for_text(self.task_entry.get(), self.korean_font[0], self.default_font[0])
+        if family != self.task_entry_font_family:
+            self.task_entry_font_family = family
+            # 입력 박스 폰트 크기는 고정 24 사용
+            self.task_entry.config(font=get_font(family, 24))
 
     # ------------------- 경험치 바 업데이트 -------------------
     
@@ -1133,22 +871,17 @@ class ResponsiveApp:
         self.xp_info_label.place_forget()
         #self.xp_frame_spacer.pack_forget()
 
-    def update_xp_bar(self):
-        """경험치 바를 현재 경험치에 맞게 업데이트합니다."""
-        canvas_width = self.xp_canvas.winfo_width()
-        if canvas_width < 10: 
-            self.root.after(100, self.update_xp_bar)
-            return
-            
-        progress_ratio = self.current_xp / self.total_xp_needed
-        xp_width = canvas_width * progress_ratio
-        
-        self.xp_canvas.delete("all")
-        self.xp_canvas.create_rectangle(0, 0, canvas_width, 20, fill="#ecf0f1", outline="")
-        self.xp_canvas.create_rectangle(0, 0, xp_width, 20, fill="#2ecc71", outline="") # Green
+    def update_xp_bar(self, wrapped=False, animate=True):
+        """
+        경험치 바를 현재 경험치에 맞게 업데이트합니다.
+        💡 캔버스 항목은 XpBar가 유지하며, 너비가 아직 없으면 <Configure> 때 그려지므로 폴링하지 않습니다.
+        """
+        xp = self.core.xp
+        self.xp_bar.set_ratio(xp.progress_ratio, wrapped=wrapped, animate=animate)
         
-        info_text = f"Level {self.evolution_stage} | XP: {self.current_xp}/{self.total_xp_needed}"
-        self.xp_info_label.config(text=info_text)
+        info_text = f"Level {xp.evolution_stage} | XP: {xp.current_xp}/{xp.total_xp_needed}"
+        if self.xp_info_label.cget("text") != info_text:
+            self.xp_info_label.config(text=info_text)
         
     def clear_task_list(self):
         """
@@ -1157,13 +890,16 @@ class ResponsiveApp:
         # self.task_list_frame은 TaskItem 위젯들의 부모 프레임입니다.
         for widget in self.task_list_frame.winfo_children():
             widget.destroy()
+        self.task_items = {}
+        self.selected_task_ids = set()
+        self.deadline_notifier.clear()
+        self._cancel_daily_reset()
             
         # 캔버스의 스크롤 영역을 초기화 (빈 상태로 업데이트)
         self.update_scrollregion() 
         
-        # 💡 [필수] 내부 데이터 구조(예: self.task_items 리스트 등)도 함께 비워야 합니다.
-        # self.task_items 리스트를 사용하고 있다면:
-        # self.task_items.clear()
+        # 💡 [필수] 코어의 태스크 저장소도 함께 비웁니다.
+        self.core.tasks.clear()
 
     # ------------------- 할 일 추가 로직 -------------------
 
@@ -1181,66 +917,404 @@ class ResponsiveApp:
             due_date = ""
 
         if task_name:
-            if due_date:
-                try:
-                    due_date_obj = datetime.datetime.strptime(due_date, '%Y-%m-%d').date()
-                    if due_date_obj < datetime.date.today():
-                        messagebox.showerror("오류", "마감일이 이미 지난 태스크는 추가할 수 없습니다.")
-                        self.due_date_str.set("마감일 선택") # 입력 초기화
-                        return
-                except ValueError:
-                    pass 
-
-            task_item = TaskItem(
-                self.task_list_frame, 
-                task_name, 
-                self, 
-                is_recurring=is_recurring,
-                due_date=due_date
-            )
-            task_item.pack(fill="x", padx=10, pady=2)
+            if is_past_due(due_date):
+                messagebox.showerror("오류", "마감일이 이미 지난 태스크는 추가할 수 없습니다.")
+                self.due_date_str.set("마감일 선택") # 입력 초기화
+                return
+
+            # 💡 위젯 생성/필터/알림/저장은 TasksAdded 구독자가 다음 프레임에 한 번에 처리합니다.
+            self.core.add_task(task_name, is_recurring=is_recurring, due_date=due_date)
             
             self.task_entry.delete(0, tk.END)
             self.is_recurring.set(False)
             self.due_date_str.set("마감일 선택")
             
             print(f"새 태스크 추가: {task_name}")
-            self.save_user_data()
-            
-            self.task_list_canvas.update_idletasks()
-            self.task_list_canvas.yview_moveto(1)
         else:
             print("경고: 태스크 이름이 비어 있습니다.")
             
-    def _check_pokemon_load_completion(self, future):
-        """백그라운드 포켓몬 로드 작업이 완료되었는지 확인하고 UI를 업데이트합니다."""
+    # ------------------- 일괄 작업 (전체 완료 / 완료 항목 정리 / 선택 삭제) -------------------
+    # 💡 태스크 수와 관계없이 코어에 한 번의 배치로 적용합니다. 화면/저장은 이벤트 구독자가 프레임당 한 번씩 합니다.
+
+    def toggle_task_selection(self, task_item):
+        """태스크 레이블 클릭 시 일괄 작업 선택 상태를 토글합니다."""
+        task_id = task_item.task.id
+        if task_id in self.selected_task_ids:
+            self.selected_task_ids.discard(task_id)
+            task_item.set_selected(False)
+        else:
+            self.selected_task_ids.add(task_id)
+            task_item.set_selected(True)
+
+    def complete_all_tasks(self):
+        """선택된 태스크(선택이 없으면 모든 미완료 태스크)를 한 번에 완료합니다."""
+        if not self.is_logged_in:
+            return
+        task_ids = list(self.selected_task_ids) or [task.id for task in self.core.tasks if not task.is_completed]
+        completed, outcomes = self.core.complete_tasks(task_ids)
+        if not completed:
+            return
+
+        self._clear_selection()
+        print(f"태스크 {len(completed)}개 일괄 완료! (+{XP_PER_TASK * len(completed)} XP 획득)")
+        self._apply_xp_outcomes(outcomes)
+
+    def clear_completed_tasks(self):
+        """완료된 태스크(매일 반복 제외)를 목록에서 정리합니다."""
+        if not self.is_logged_in:
+            return
+        self.core.clear_completed()
+
+    def delete_selected_tasks(self):
+        """선택된 태스크들을 삭제합니다."""
+        if not self.is_logged_in or not self.selected_task_ids:
+            return
+        if not messagebox.askyesno("삭제 확인", f"선택한 태스크 {len(self.selected_task_ids)}개를 삭제할까요?"):
+            return
+        self.core.remove_tasks(list(self.selected_task_ids))
+
+    # ------------------- 코어 이벤트 구독자 -------------------
+    # 💡 한 프레임 동안 쌓인 이벤트 목록을 받아 한 번에 반영합니다. (EventBus.flush에서 호출)
+
+    def _render_task_events(self, events):
+        """추가/완료/초기화/삭제된 태스크를 목록 위젯, 필터, 마감 알림에 한 번에 반영합니다."""
+        added, changed, removed = [], [], []
+        updated_ids = set()
+        for event in events:
+            if isinstance(event, TasksAdded):
+                added.extend(event.tasks)
+            elif isinstance(event, TasksRemoved):
+                removed.extend(event.tasks)
+            else:
+                changed.extend(event.tasks)
+                if isinstance(event, TasksUpdated):
+                    updated_ids.update(task.id for task in event.tasks)
+
+        if removed:
+            for task in removed:
+                self.selected_task_ids.discard(task.id)
+                task_item = self.task_items.pop(task.id, None)
+                if task_item is not None:
+                    task_item.destroy()
+            self.deadline_notifier.remove([task.id for task in removed])
+            print(f"태스크 {len(removed)}개 삭제")
+            self.update_scrollregion()
+
+        # 같은 프레임에 삭제된 태스크는 건너뜁니다.
+        changed = [task for task in changed if self.core.tasks.get(task.id) is not None]
+        if changed:
+            for task in changed:
+                task_item = self.task_items.get(task.id)
+                if task_item is None:
+                    continue
+                if task.id in updated_ids:
+                    task_item.refresh()
+                if task.is_completed:
+                    task_item.show_completed()
+                    if task.is_persistent:
+                        self._schedule_daily_reset(task_item)
+                else:
+                    task_item.show_active()
+            self._refresh_task_visibility(changed)
+            self.deadline_notifier.update(changed)
+
+        added = [task for task in added if self.core.tasks.get(task.id) is not None]
+        if added:
+            self.deadline_notifier.update(added)
+            self._add_task_items(added)
+
+    def _render_xp_events(self, events):
+        """경험치 바를 한 번만 갱신합니다. 단계를 넘었으면 끝까지 채운 뒤 다시 채웁니다."""
+        if any(isinstance(event, ProfileChanged) for event in events):
+            self.update_xp_bar(animate=False)
+        else:
+            self.update_xp_bar(wrapped=any(event.levels for event in events))
+
+    def _persist_events(self, events):
+        """태스크/경험치가 바뀐 프레임마다 프로필을 한 번만 저장합니다."""
+        self.save_user_data()
+
+    def _show_external_pokemon(self, events):
+        """다른 인스턴스에서 진화/재선택된 포켓몬을 불러옵니다. (이전 포켓몬이 캐시에 있으면 전환 애니메이션)"""
+        last = events[-1]
+        if not self.is_logged_in or last.pokemon_id != self.core.current_pokemon_id:
+            return
+        previous = self.sprite_cache.get(events[0].previous_id, self.POKEMON_IMAGE_SIZE)
+        self._initial_load_pokemon_chain(last.pokemon_id, previous.image if previous is not None else None)
+
+    def _prefetch_evolutions(self, events):
+        """다음 진화 포켓몬의 표시용 이미지를 미리 받아 스프라이트 캐시에 넣어 둡니다. (진화 시 바로 표시)"""
+        for event in events:
+            if event.pokemon_id != self.core.current_pokemon_id or not event.next_ids:
+                continue
+            next_id = event.next_ids[0]  # 코어는 첫 번째 진화 대상으로 진화합니다.
+            if (next_id, self.POKEMON_IMAGE_SIZE) in self.sprite_cache or next_id in self.prefetch_futures:
+                continue
+            future = self.executor.submit(
+                image_pipeline.fetch_display_pokemon, self.core.pokemon_service, next_id, self.POKEMON_IMAGE_SIZE
+            )
+            self.prefetch_futures[next_id] = future
+            future.add_done_callback(lambda f, p_id=next_id: self.root.after(0, self._store_prefetched, p_id, f))
+
+    def _store_prefetched(self, pokemon_id, future):
+        """(메인 스레드) 미리 받은 표시용 이미지를 캐시에 넣습니다. 실패하면 표시할 때 다시 받습니다."""
+        if self.prefetch_futures.get(pokemon_id) is future:
+            del self.prefetch_futures[pokemon_id]
+        if future.cancelled():
+            return  # 웜 스타트에서 버림
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"포켓몬 미리 받기 실패 (ID: {pokemon_id}): {e}")
+            return
+        if result:
+            display_image, name, p_id = result
+            self.sprite_cache.put(p_id, self.POKEMON_IMAGE_SIZE, display_image, name)
+
+    # ------------------- 가져오기 / 내보내기 (JSONL, CSV) -------------------
+
+    def import_tasks_from_file(self):
+        """파일을 워커 스레드에서 읽고 검증한 뒤, 메인 스레드에서 한 번에 추가하고 한 번만 저장합니다."""
+        if not self.is_logged_in:
+            messagebox.showwarning("경고", "로그인이 필요합니다.")
+            return
+        path = filedialog.askopenfilename(
+            filetypes=[("JSON Lines", "*.jsonl"), ("CSV", "*.csv"), ("모든 파일", "*.*")]
+        )
+        if not path:
+            return
+        existing_ids = [task.id for task in self.core.tasks]
+        username = self.current_user
+        # 💡 보관된 태스크 id는 워커가 보관함에서 읽습니다. (백업을 다시 가져와도 보관된 태스크가 되살아나지 않도록)
+        future = self.executor.submit(task_io.read_tasks, path, existing_ids, self.core.repository, username)
+        future.add_done_callback(lambda f: self.root.after(0, self._finish_import, username, f))
+
+    def _finish_import(self, username, future):
+        if username != self.current_user:
+            return # 가져오는 사이 로그아웃/사용자 변경
+        try:
+            result = future.result()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("가져오기 오류", f"파일을 읽는 중 오류 발생: {e}")
+            return
+
+        if result.tasks:
+            self.core.add_tasks(result.tasks) # 위젯/알림/저장은 TasksAdded 구독자
+        print(f"태스크 가져오기: {result.summary()}")
+        messagebox.showinfo("가져오기 완료", result.summary())
+
+    def _add_task_items(self, tasks, start=0):
+        """TaskItem을 TASK_WIDGET_CHUNK 개씩 나눠 만들어 UI가 멈추지 않게 합니다. 스크롤 영역은 마지막에 한 번 갱신합니다."""
+        for task in tasks[start:start + TASK_WIDGET_CHUNK]:
+            if self.core.tasks.get(task.id) is None or task.id in self.task_items:
+                continue # 그사이 삭제/로그아웃된 태스크
+            task_item = TaskItem(self.task_list_frame, task, self)
+            task_item.pack(fill="x", padx=10, pady=2)
+            self.task_items[task.id] = task_item
+            if task.is_completed:
+                task_item.show_completed()
+                if task.is_recurring:
+                    self._schedule_daily_reset(task_item)
+        self._refresh_task_visibility(tasks[start:start + TASK_WIDGET_CHUNK], update_scroll=False)
+
+        if start + TASK_WIDGET_CHUNK < len(tasks):
+            self.root.after(1, self._add_task_items, tasks, start + TASK_WIDGET_CHUNK)
+        else:
+            self.update_scrollregion()
+
+    def export_tasks_to_file(self):
+        """현재 태스크와 보관된 완료 태스크를 워커 스레드에서 파일로 내보냅니다."""
+        if not self.is_logged_in:
+            messagebox.showwarning("경고", "로그인이 필요합니다.")
+            return
+        path = filedialog.asksaveasfilename(
+            defaultextension=".jsonl",
+            filetypes=[("JSON Lines", "*.jsonl"), ("CSV", "*.csv")],
+            initialfile=f"{self.current_user}_tasks.jsonl",
+        )
+        if not path:
+            return
+        # 💡 태스크 목록과 사용자 이름은 메인 스레드에서 고정하고, 워커는 그 스냅샷과 보관함 파일만 읽습니다.
+        tasks = task_io.iter_all_tasks(list(self.core.tasks), self.core.repository, self.current_user)
+        future = self.executor.submit(task_io.export_tasks, tasks, path)
+        future.add_done_callback(lambda f: self.root.after(0, self._finish_export, path, f))
+
+    def _finish_export(self, path, future):
+        try:
+            count = future.result()
+        except (OSError, ValueError) as e:
+            messagebox.showerror("내보내기 오류", f"태스크 내보내기 중 오류 발생: {e}")
+            return
+        messagebox.showinfo("내보내기 완료", f"태스크 {count}개를 저장했습니다.\n{path}")
+
+    # ------------------- 검색 / 일정 필터 -------------------
+    # 💡 필터 결과는 코어의 TaskIndex에서 가져오고, 태스크가 추가/완료될 때는 바뀐 태스크만 다시 검사합니다.
+
+    def _filter_state(self):
+        return self.search_var.get().strip(), AGENDA_LABELS[self.agenda_var.get()]
+
+    def _filter_active(self):
+        text, agenda = self._filter_state()
+        return bool(text or agenda)
+
+    def _schedule_task_filter(self, *args):
+        """검색어 입력 중에는 마지막 입력 후 FILTER_DEBOUNCE_MS 뒤에 한 번만 필터를 적용합니다."""
+        if self.filter_after_id:
+            self.root.after_cancel(self.filter_after_id)
+        self.filter_after_id = self.root.after(FILTER_DEBOUNCE_MS, self._apply_task_filter)
+
+    def _apply_task_filter(self, *args):
+        """현재 보이는 항목을 숨기고, 인덱스 조회 결과만 입력 순서대로 다시 배치합니다."""
+        self.filter_after_id = None
+        text, agenda = self._filter_state()
+        matches = self.core.tasks.search(text, agenda)
+        if matches is None:
+            matches = list(self.core.tasks) # 필터 해제: 전체 표시
+
+        for widget in self.task_list_frame.pack_slaves():
+            widget.pack_forget()
+        for task in matches:
+            task_item = self.task_items.get(task.id)
+            if task_item is not None:
+                task_item.pack(fill="x", padx=10, pady=2)
+        self.update_scrollregion()
+
+    def _refresh_task_visibility(self, tasks, update_scroll=True):
+        """상태가 바뀐 태스크들만 현재 필터에 맞는지 다시 검사해 보이거나 숨깁니다."""
+        if not self._filter_active():
+            return
+        text, agenda = self._filter_state()
+        changed = False
+        for task in tasks:
+            task_item = self.task_items.get(task.id)
+            if task_item is None:
+                continue
+            is_visible = task_item.winfo_manager() == "pack"
+            if self.core.tasks.index.matches(task, text, agenda):
+                if not is_visible:
+                    self._pack_in_order(task_item)
+                    changed = True
+            elif is_visible:
+                task_item.pack_forget()
+                changed = True
+        if changed and update_scroll:
+            self.update_scrollregion()
+
+    def _pack_in_order(self, task_item):
+        """다시 보이게 된 항목을 목록 끝이 아니라 인덱스 순서상 제자리에 배치합니다."""
+        sort_key = self.core.tasks.index.sort_key
+        key = sort_key(task_item.task.id)
+        for widget in self.task_list_frame.pack_slaves():
+            if isinstance(widget, TaskItem) and sort_key(widget.task.id) > key:
+                task_item.pack(fill="x", padx=10, pady=2, before=widget)
+                return
+        task_item.pack(fill="x", padx=10, pady=2)
+
+    def _on_agenda_changed(self, *args):
+        """일정 필터를 바꾸면 바로 적용하고, 날짜가 바뀔 때 다시 계산하도록 자정 타이머를 겁니다."""
+        self._apply_task_filter()
+        if AGENDA_LABELS[self.agenda_var.get()]:
+            self._schedule_daily_reset()
+
+    def _show_deadline_alerts(self, alerts):
+        """같은 시점에 몰린 마감 알림을 한 번에 보여줍니다."""
+        lines = [alert.describe() for alert in alerts]
+        print("[deadline] " + " / ".join(lines))
+        messagebox.showinfo("마감 임박!", "마감이 다가오는 태스크가 있습니다.\n\n" + "\n".join(lines))
+
+    def show_history(self):
+        """보관된 완료 태스크 기록 창을 엽니다."""
+        if self.is_logged_in:
+            self.history_view.open()
+
+    def _clear_selection(self):
+        for task_id in self.selected_task_ids:
+            task_item = self.task_items.get(task_id)
+            if task_item is not None:
+                task_item.set_selected(False)
+        self.selected_task_ids = set()
+
+    def _is_current_pokemon(self, pokemon_id):
+        """늦게 끝난 로드(로그아웃/다른 사용자 로그인/연속 진화 뒤)가 현재 포켓몬을 덮어쓰지 않도록 확인합니다."""
+        return self.is_logged_in and pokemon_id == self.core.current_pokemon_id
+
+    def _check_pokemon_load_completion(self, pokemon_id, future):
+        """(메인 스레드, 완료 콜백) 백그라운드 포켓몬 로드 결과로 UI를 업데이트합니다."""
         if future.done():
             try:
-                raw_image = future.result()
-                
-                # 💡 [핵심] 로딩 완료 후 애니메이션 중지
-                self._stop_loading_animation() 
+                # 💡 (표시용 이미지, name, id) 튜플 또는 실패 시 None
+                result = future.result()
                 
-                if raw_image:
-                    # 이미지 표시 (비율 유지 로직이 포함된 함수)
-                    self._update_pokemon_display(raw_image)
-                    self.current_pil_image = raw_image # 원본 이미지 저장
+                if result:
+                    display_image, name, p_id = result
+                    entry = self.sprite_cache.put(p_id, self.POKEMON_IMAGE_SIZE, display_image, name)
+                    if not self._is_current_pokemon(p_id):
+                        return # 캐시에만 넣고, 지금 보이는 포켓몬/로딩 애니메이션은 그대로 둠
                     
-                    # 💡 [추가] 포켓몬 로드 완료 시 로그아웃 버튼 표시
-                    self.logout_button.place(relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
-                    # (혹은 place 대신 pack을 사용했다면: self.logout_button.pack(side="right", padx=(0, 10)))
+                    # 💡 [핵심] 로딩 완료 후 애니메이션 중지
+                    self._stop_loading_animation() 
+                    self._show_pokemon_entry(p_id, entry)
 
-                else:
+                elif self._is_current_pokemon(pokemon_id):
+                    self._stop_loading_animation()
                     self.image_label.config(text="이미지 로드 실패", font=self.korean_font)
 
             except Exception as e:
                 print(f"포켓몬 데이터 로드 중 오류 발생: {e}")
-                self.image_label.config(text="이미지 로드 실패", font=self.korean_font)
-                self._stop_loading_animation() # 실패해도 멈춰야 함
+                if self._is_current_pokemon(pokemon_id):
+                    self.image_label.config(text="이미지 로드 실패", font=self.korean_font)
+                    self._stop_loading_animation() # 실패해도 멈춰야 함
 
-        else:
-            # 아직 로딩 중이면 100ms 후 다시 확인
-            self.root.after(100, self._check_pokemon_load_completion, future)
+    def _show_pokemon_entry(self, pokemon_id, entry):
+        """캐시 항목으로 현재 포켓몬 정보와 이미지를 갱신합니다."""
+        self.core.set_pokemon_info(pokemon_id, entry.name)
+        
+        # 💡 진화 직후면 전환 프레임을 워커에서 계산한 뒤 재생하고, 끝나면 새 이미지를 표시합니다.
+        pending, self.pending_transition = self.pending_transition, None
+        if pending is not None and pending[0] == pokemon_id:
+            self.sprite_player.stop()
+            future = self.executor.submit(evolution_transition.build_transition_frames, pending[1], entry.image)
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._play_evolution_transition, pokemon_id, entry, f)
+            )
+            return
+        self._finish_pokemon_display(pokemon_id, entry)
+        
+    def _play_evolution_transition(self, pokemon_id, entry, future):
+        """(메인 스레드) 계산된 전환 프레임을 재생합니다. 실패하면 바로 새 이미지를 표시합니다."""
+        if not self._is_current_pokemon(pokemon_id):
+            return  # 그사이 다른 포켓몬으로 바뀜 (또는 로그아웃)
+        try:
+            frames = future.result()
+        except Exception as e:
+            print(f"진화 전환 프레임 생성 중 오류 발생: {e}")
+            frames = []
+        remaining = iter(frames)
+        
+        def next_frame():
+            frame = next(remaining, None)
+            if frame is None:
+                self.transition_animator.stop()
+                self._finish_pokemon_display(pokemon_id, entry)
+                return None
+            # PhotoImage는 표시할 프레임마다 하나씩 만듭니다. (한 번에 만들어 루프를 막지 않도록)
+            return ImageTk.PhotoImage(frame), evolution_transition.TRANSITION_FRAME_MS
+        
+        self.transition_animator.stop()
+        self.transition_animator.next_frame = next_frame
+        self.transition_animator.start()
+        
+    def _finish_pokemon_display(self, pokemon_id, entry):
+        # 이미지 표시 (PhotoImage로 감싸기만 함)
+        self._update_pokemon_display(entry)
+        
+        # 💡 애니메이션 스프라이트가 있으면 정지 이미지 위에서 이어서 재생합니다.
+        if ANIMATED_SPRITES_ENABLED:
+            self.sprite_player.play(pokemon_id)
+        
+        # 💡 [추가] 포켓몬 로드 완료 시 로그아웃 버튼 표시
+        self.logout_button.place(relx=1.0, rely=0.0, x=-10, y=10, anchor="ne")
+        # (혹은 place 대신 pack을 사용했다면: self.logout_button.pack(side="right", padx=(0, 10)))
 
     # ------------------- GUI 위젯 및 배치 -------------------
 
@@ -1304,6 +1378,7 @@ class ResponsiveApp:
         #경험치 캔버스
         self.xp_canvas = tk.Canvas(self.xp_frame, bg="Ivory", highlightthickness=0)
         self.xp_canvas.pack(side="bottom", fill="x", expand=True, pady=(0,0)) # XP 프레임 내부에 배치
+        self.xp_bar = XpBar(self.xp_canvas)
 
         # 4. 💡 [수정] 로그아웃 버튼 (XP 바 밑으로, place 배치)
         self.button_frame = tk.Frame(self.main_frame, bg="Ivory")
@@ -1319,11 +1394,38 @@ class ResponsiveApp:
         )
         self.logout_button.pack(side="right", padx=10, pady=2) # button_frame 내에서 pack 사용
 
+        # 💡 완료 기록 버튼 (보관된 태스크 보기)
+        tk.Button(
+            self.button_frame,
+            text="기록",
+            font=("DungGeunMo", 10),
+            command=self.show_history,
+            bg="#3498db",
+            fg="white"
+        ).pack(side="right", pady=2)
+
+        # 💡 일괄 작업 버튼 (태스크 이름을 클릭해 선택)
+        bulk_buttons = (
+            ("전체 완료", self.complete_all_tasks, "#2ECC71"),
+            ("완료 정리", self.clear_completed_tasks, "#95a5a6"),
+            ("선택 삭제", self.delete_selected_tasks, "#e67e22"),
+        )
+        for text, command, color in bulk_buttons:
+            tk.Button(
+                self.button_frame,
+                text=text,
+                font=("DungGeunMo", 10),
+                command=command,
+                bg=color,
+                fg="white"
+            ).pack(side="left", padx=(0, 4), pady=2)
+
         # 5. 💡 [수정] 할 일 입력 프레임 (rely=0.55로 이동)
         self.input_frame = tk.Frame(self.main_frame, bg="Ivory")
         self.input_frame.place(relx=0.5, rely=0.58, anchor="n", relwidth=0.9)
 
-        self.task_entry = tk.Entry(self.input_frame, font=(self.default_font[0], 24))
+        self.task_entry_font_family = self.default_font[0]
+        self.task_entry = tk.Entry(self.input_frame, font=get_font(self.task_entry_font_family, 24))
         self.task_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         self.task_entry.bind('<Return>', lambda e: self.add_task())
 
@@ -1348,11 +1450,25 @@ class ResponsiveApp:
         self.due_date_button = tk.Button(self.task_options_frame, textvariable=self.due_date_str, command=self._show_calendar_popup, bg="#e67e22", fg="white", font=self.korean_font)
         self.due_date_button.pack(side="left", padx=5)
 
+        # 💡 태스크 가져오기 / 내보내기 (JSONL, CSV)
+        tk.Button(self.task_options_frame, text="내보내기", command=self.export_tasks_to_file, bg="#95a5a6", fg="white", font=("DungGeunMo", 10)).pack(side="right")
+        tk.Button(self.task_options_frame, text="가져오기", command=self.import_tasks_from_file, bg="#3498db", fg="white", font=("DungGeunMo", 10)).pack(side="right", padx=5)
+
         # 7. 💡 [수정] 할 일 목록 영역 (rely=0.68로 이동)
         self.task_canvas_frame = tk.Frame(self.main_frame, bg="Ivory")
         self.task_canvas_frame.place(relx=0.5, rely=0.71, anchor="n", relwidth=0.9, relheight=0.25)
     
         # ... (이하 task_list_canvas, scrollbar, task_list_frame 관련 코드는 그대로 유지)
+        # 💡 검색창 + 일정 필터 (지난 마감 / 오늘 / 이번 주)
+        self.search_frame = tk.Frame(self.task_canvas_frame, bg="Ivory")
+        self.search_frame.pack(side="top", fill="x", pady=(0, 2))
+        self.search_entry = tk.Entry(self.search_frame, textvariable=self.search_var, font=("DungGeunMo", 10))
+        self.search_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
+        self.search_var.trace_add("write", self._schedule_task_filter)
+        agenda_menu = tk.OptionMenu(self.search_frame, self.agenda_var, *AGENDA_LABELS, command=self._on_agenda_changed)
+        agenda_menu.config(font=("DungGeunMo", 10), bg="Ivory", highlightthickness=0)
+        agenda_menu.pack(side="right")
+
         self.task_list_canvas = tk.Canvas(self.task_canvas_frame, bg="Ivory", highlightthickness=0)
         self.task_list_canvas.pack(side="left", fill="both", expand=True)
 
@@ -1364,7 +1480,7 @@ class ResponsiveApp:
         self.task_list_frame = tk.Frame(self.task_list_canvas, bg="Ivory")
         self.task_list_canvas.create_window((0, 0), window=self.task_list_frame, anchor="nw", tags="self.task_list_frame")
         
-        self.task_list_frame.bind("<Configure>", lambda e: self.update_scrollregion())
+        self.task_list_frame.bind("<Configure>", lambda e: self.request_layout())
         self.task_list_canvas.bind_all('<MouseWheel>', self._on_mousewheel) 
         self.task_list_canvas.bind_all('<Button-4>', self._on_mousewheel) 
         self.task_list_canvas.bind_all('<Button-5>', self._on_mousewheel) 
@@ -1373,10 +1489,25 @@ class ResponsiveApp:
         self.task_list_canvas.bind("<B1-Motion>", self._on_drag)
         
     def _show_calendar_popup(self):
-        """달력 팝업을 표시하여 마감일을 선택하게 합니다."""
+        """
+        달력 팝업을 표시하여 마감일을 선택하게 합니다.
+        💡 팝업은 처음 열 때 한 번만 만들고, 이후에는 숨겼다가(withdraw) 오늘 날짜로 되돌려 다시 보여줍니다.
+        """
+        if self.calendar_popup is None or not self.calendar_popup.winfo_exists():
+            self._build_calendar_popup()
+        else:
+            today = datetime.date.today()
+            self.calendar.selection_set(today)
+            self.calendar.see(today)
+            self.calendar_popup.deiconify()
+        self.calendar_popup.lift()
+        self.calendar_popup.focus_set()
+        
+    def _build_calendar_popup(self):
         top = tk.Toplevel(self.root)
         top.title("마감일 선택")
         top.attributes('-topmost', 'true')
+        top.protocol("WM_DELETE_WINDOW", top.withdraw) # 닫기 버튼도 파괴 대신 숨김
         
         now = datetime.date.today()
         cal = Calendar(
@@ -1399,7 +1530,7 @@ class ResponsiveApp:
         def set_due_date():
             selected_date = cal.get_date()
             self.due_date_str.set(selected_date)
-            top.destroy()
+            top.withdraw()
             
         confirm_button = tk.Button(
             top, 
@@ -1413,11 +1544,14 @@ class ResponsiveApp:
         close_button = tk.Button(
             top, 
             text="취소", 
-            command=top.destroy,
+            command=top.withdraw,
             bg="#e74c3c",
             fg="white"
         )
         close_button.pack(pady=(0, 10))
+        
+        self.calendar_popup = top
+        self.calendar = cal
 
     # ------------------- 스크롤 이벤트 핸들러 -------------------
 
@@ -1452,6 +1586,7 @@ if __name__ == "__main__":
     if not hasattr(Image.Resampling, 'LANCZOS'):
         Image.Resampling.LANCZOS = Image.ANTIALIAS
     
+    register_bundled_fonts() # Tk 루트 생성 전에 한 번만 등록
     root = tk.Tk()
     app = ResponsiveApp(root, aspect_ratio=(9, 16)) # 모바일 세로 비율 (9:16)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,986 @@
+import bisect
+import datetime
+import json
+import os
+import random
+import time
+import uuid
+from io import BytesIO
+
+import requests
+from PIL import Image
+
+import pokeapi_client
+from event_bus import (
+    EventBus, EvolutionMapLoaded, PokemonChanged, PokemonLoaded, ProfileChanged,
+    TasksAdded, TasksCompleted, TasksRemoved, TasksReset, TasksUpdated, XpChanged,
+)
+from file_lock import FileLock, replace_file
+from net_metrics import METRICS
+from task_index import TaskIndex
+
+# ====================================================
+#  Todomon 코어 (Tk UI와 분리된 상태/로직)
+# ====================================================
+# 태스크 저장소, 경험치/진화 엔진, 포켓몬 데이터 서비스, 사용자 프로필 저장소를
+# 화면 없이 사용할 수 있도록 모아 둔 모듈입니다. todomon1.ResponsiveApp은
+# 이 모듈의 TodomonCore를 보여주는 뷰 역할만 합니다.
+
+USER_DATA_DIR = "user_data"
+DATA_FILE_EXT = ".json"
+CACHE_FILE = "base_ids.json"
+LAST_USER_FILE = "last_user.txt"  # 마지막으로 로그인한 사용자 이름 (웜 스타트용)
+
+XP_PER_TASK = 10
+DATE_FORMAT = "%Y-%m-%d"
+
+# 💡 완료 후 이 일수가 지난 (반복이 아닌) 태스크는 보관함 세그먼트로 옮겨 로그인 시 읽지 않습니다.
+ARCHIVE_AFTER_DAYS = int(os.environ.get("TODOMON_ARCHIVE_AFTER_DAYS", "7"))
+ARCHIVE_DIR_SUFFIX = "_archive"
+ARCHIVE_SEGMENT_SIZE = 200  # 세그먼트 파일 하나에 담는 태스크 수 (기록 화면의 한 페이지)
+
+
+def is_past_due(due_date, today=None):
+    """
+    마감일 문자열(YYYY-MM-DD)이 오늘보다 이전이면 True를 반환합니다.
+    형식이 잘못된 문자열은 (기존 add_task 동작과 같이) 검사하지 않고 False를 반환합니다.
+    """
+    if not due_date:
+        return False
+    try:
+        due_date_obj = datetime.datetime.strptime(due_date, DATE_FORMAT).date()
+    except ValueError:
+        return False
+    return due_date_obj < (today or datetime.date.today())
+
+
+# -----------------------------------------------------------
+# 할 일 모델 / 저장소
+# -----------------------------------------------------------
+class Task:
+    """할 일 하나의 상태입니다. (위젯과 무관)"""
+
+    def __init__(self, name, is_recurring=False, due_date="", is_completed=False, task_id=None, completed_at=""):
+        self.id = task_id or uuid.uuid4().hex
+        self.name = name
+        self.is_recurring = is_recurring
+        self.due_date = due_date
+        self.is_completed = is_completed
+        self.completed_at = completed_at  # 완료한 날짜 (YYYY-MM-DD), 미완료면 ""
+
+    def set_completed(self, completed, today=None):
+        self.is_completed = completed
+        self.completed_at = (today or datetime.date.today()).strftime(DATE_FORMAT) if completed else ""
+
+    def is_archivable(self, today=None, after_days=ARCHIVE_AFTER_DAYS):
+        """완료 후 after_days 일이 지난 일회성 태스크인지 여부. (매일 반복 태스크는 보관하지 않음)"""
+        if not self.is_completed or self.is_recurring or not self.completed_at:
+            return False
+        try:
+            completed_on = datetime.datetime.strptime(self.completed_at, DATE_FORMAT).date()
+        except ValueError:
+            return False
+        return ((today or datetime.date.today()) - completed_on).days >= after_days
+
+    @property
+    def is_persistent(self):
+        """완료 후에도 목록에 남아 초기화 대상이 되는 태스크인지 여부 (반복 또는 마감일 지정)."""
+        return self.is_recurring or self.due_date != ""
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "completed": self.is_completed,
+            "recurring": self.is_recurring,
+            "due_date": self.due_date,
+            "completed_at": self.completed_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        is_completed = data.get("completed", False)
+        completed_at = data.get("completed_at", "")
+        if is_completed and not completed_at:
+            # 완료 날짜가 없는 예전 데이터는 처음 읽은 날을 완료일로 봅니다.
+            completed_at = datetime.date.today().strftime(DATE_FORMAT)
+        return cls(
+            data["name"],
+            is_recurring=data.get("recurring", False),
+            due_date=data.get("due_date", ""),
+            is_completed=is_completed,
+            task_id=data.get("id"),
+            completed_at=completed_at,
+        )
+
+
+class TaskStore:
+    """입력 순서를 유지하는 태스크 저장소입니다. 모든 변경은 검색/마감일 인덱스(index)에도 반영됩니다."""
+
+    def __init__(self):
+        self._tasks = {}  # id -> Task (dict는 삽입 순서를 유지)
+        self.index = TaskIndex()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def __iter__(self):
+        return iter(list(self._tasks.values()))
+
+    def get(self, task_id):
+        return self._tasks.get(task_id)
+
+    def add(self, task):
+        self._tasks[task.id] = task
+        self.index.add(task)
+        return task
+
+    def add_many(self, tasks):
+        tasks = list(tasks)
+        for task in tasks:
+            self._tasks[task.id] = task
+        self.index.add_many(tasks)
+
+    def remove(self, task_id):
+        self.index.remove(task_id)
+        return self._tasks.pop(task_id, None)
+
+    def remove_many(self, task_ids):
+        """여러 태스크를 한 번에 제거하고, 실제로 제거된 Task 목록을 반환합니다."""
+        removed = []
+        for task_id in task_ids:
+            task = self._tasks.pop(task_id, None)
+            if task is not None:
+                self.index.remove(task_id)
+                removed.append(task)
+        return removed
+
+    def set_completed(self, task_id, completed):
+        task = self._tasks[task_id]
+        task.set_completed(completed)
+        self.index.update(task)
+        return task
+
+    def update_from_dict(self, task_id, data):
+        """
+        다른 인스턴스가 바꾼 태스크 내용을 제자리에서 반영합니다. (위젯이 같은 Task 객체를 보고 있으므로)
+        이름이 바뀌면 검색 인덱스에서 빼고 다시 넣습니다. (검색 결과에서는 목록 끝으로 감)
+        """
+        task = self._tasks[task_id]
+        incoming = Task.from_dict(data)
+        renamed = incoming.name != task.name
+        task.name = incoming.name
+        task.is_recurring = incoming.is_recurring
+        task.due_date = incoming.due_date
+        task.is_completed = incoming.is_completed
+        task.completed_at = incoming.completed_at
+        if renamed:
+            self.index.remove(task_id)
+            self.index.add(task)
+        else:
+            self.index.update(task)
+        return task
+
+    def clear(self):
+        self._tasks.clear()
+        self.index.clear()
+
+    def search(self, text="", agenda=None):
+        """검색어/일정 필터에 맞는 Task 목록을 입력 순서대로 반환합니다. 필터가 없으면 None."""
+        task_ids = self.index.query(text, agenda)
+        if task_ids is None:
+            return None
+        return [self._tasks[task_id] for task_id in sorted(task_ids, key=self.index.sort_key)]
+
+    def to_list(self):
+        return [task.to_dict() for task in self._tasks.values()]
+
+    def load_list(self, task_dicts):
+        self.clear()
+        self.add_many(Task.from_dict(data) for data in task_dicts)
+
+
+# -----------------------------------------------------------
+# 경험치 계산 로직 (EvolutionXP / XpEngine)
+# -----------------------------------------------------------
+class EvolutionXP:
+    """포켓몬의 진화 단계에 따라 필요한 총 경험치를 계산합니다."""
+
+    BASE_XP = 100
+    XP_MULTIPLIER = 1.5
+
+    # 💡 단계별 필요 경험치 / 누적 경험치 표. 필요한 단계까지 한 번만 늘려 두고 재사용합니다.
+    #   _XP_TABLE[i]: (i+1)단계에서 다음 단계로 가는 데 필요한 경험치
+    #   _CUMULATIVE_TABLE[i]: 1단계 0XP 에서 (i+1)단계 0XP 까지 누적 경험치
+    _XP_TABLE = []
+    _CUMULATIVE_TABLE = [0]
+
+    @staticmethod
+    def _ensure_stage(evolution_stage):
+        table, cumulative = EvolutionXP._XP_TABLE, EvolutionXP._CUMULATIVE_TABLE
+        while len(table) < evolution_stage:
+            # 닫힌 식: BASE_XP * MULTIPLIER^(stage-1) (기존 반복 곱셈과 같은 값)
+            xp_needed = int(EvolutionXP.BASE_XP * EvolutionXP.XP_MULTIPLIER ** len(table))
+            table.append(xp_needed)
+            cumulative.append(cumulative[-1] + xp_needed)
+
+    @staticmethod
+    def get_xp_needed(evolution_stage):
+        """
+        주어진 진화 단계(1, 2, 3...)에서 다음 단계로 진화하기 위해 필요한 총 경험치입니다.
+        """
+        if evolution_stage < 1:
+            return EvolutionXP.BASE_XP
+        EvolutionXP._ensure_stage(evolution_stage)
+        return EvolutionXP._XP_TABLE[evolution_stage - 1]
+
+    @staticmethod
+    def cumulative_xp(evolution_stage):
+        """1단계 0XP 부터 주어진 단계의 0XP 까지 필요한 누적 경험치입니다."""
+        evolution_stage = max(1, evolution_stage)
+        EvolutionXP._ensure_stage(evolution_stage)
+        return EvolutionXP._CUMULATIVE_TABLE[evolution_stage - 1]
+
+    @staticmethod
+    def stage_for_total(total_xp):
+        """누적 경험치로 (진화 단계, 해당 단계 안의 경험치)를 구합니다. 누적 표를 이분 탐색합니다."""
+        cumulative = EvolutionXP._CUMULATIVE_TABLE
+        while cumulative[-1] <= total_xp:
+            EvolutionXP._ensure_stage(len(cumulative))
+        stage = bisect.bisect_right(cumulative, total_xp)
+        return stage, total_xp - cumulative[stage - 1]
+
+
+class XpEngine:
+    """현재 경험치와 진화 단계를 관리합니다.
+
+    단계를 넘으면 포켓몬이 바뀌고 진화 단계가 1로 돌아가므로(reset_on_level_up),
+    여러 단계를 한 번에 넘는 경험치도 반복 없이 한 번의 계산으로 처리합니다.
+    """
+
+    def __init__(self, reset_on_level_up=True):
+        self.reset_on_level_up = reset_on_level_up
+        self.current_xp = 0
+        self.evolution_stage = 1
+        self.total_xp_needed = EvolutionXP.get_xp_needed(1)
+
+    def load(self, xp, evolution_stage):
+        self.current_xp = xp
+        self.evolution_stage = evolution_stage
+        self.total_xp_needed = EvolutionXP.get_xp_needed(evolution_stage)
+
+    def reset_stage(self):
+        """새 포켓몬으로 바뀔 때 진화 단계를 1로 되돌립니다. (경험치는 유지)"""
+        self.evolution_stage = 1
+        self.total_xp_needed = EvolutionXP.get_xp_needed(1)
+
+    @property
+    def progress_ratio(self):
+        return self.current_xp / self.total_xp_needed
+
+    def gain(self, amount):
+        """경험치를 더하고, 넘어선 단계 수를 반환합니다. (0이면 단계 변화 없음)"""
+        return self.gain_batch((amount,))
+
+    def gain_batch(self, amounts):
+        """여러 경험치 이벤트를 합산해 한 번에 적용하고, 넘어선 단계 수를 반환합니다."""
+        total = self.current_xp + sum(amounts)
+        if total < self.total_xp_needed:
+            self.current_xp = total
+            return 0
+
+        if self.reset_on_level_up:
+            # 첫 단계를 넘긴 뒤에는 매번 1단계 기준 경험치로 다시 시작합니다.
+            remainder = total - self.total_xp_needed
+            first_stage_xp = EvolutionXP.get_xp_needed(1)
+            levels = 1 + remainder // first_stage_xp
+            self.load(remainder % first_stage_xp, 1)
+            return levels
+
+        # 누적 경험치 표에서 최종 단계를 바로 찾습니다.
+        previous_stage = self.evolution_stage
+        stage, xp_in_stage = EvolutionXP.stage_for_total(EvolutionXP.cumulative_xp(previous_stage) + total)
+        self.load(xp_in_stage, stage)
+        return stage - previous_stage
+
+
+# -----------------------------------------------------------
+# 포켓몬 데이터 서비스 (PokeAPI)
+# -----------------------------------------------------------
+
+# 💡 스프라이트 변형: (긴 변 픽셀, PokeAPI sprites 안의 경로) - 작은 것부터
+SPRITE_VARIANTS = (
+    (96, ("front_default",)),
+    (475, ("other", "official-artwork", "front_default")),
+    (512, ("other", "home", "front_default")),
+)
+DEFAULT_SPRITE_PX = 475  # 표시 크기를 모를 때는 기존처럼 official-artwork를 우선합니다.
+
+# 💡 애니메이션 스프라이트(GIF) 경로 - 앞의 것부터 시도
+ANIMATED_SPRITE_PATHS = (
+    ("other", "showdown", "front_default"),
+    ("versions", "generation-v", "black-white", "animated", "front_default"),
+)
+
+
+def _sprite_at(sprites, path):
+    node = sprites
+    for key in path:
+        node = node.get(key) if isinstance(node, dict) else None
+    return node
+
+
+def animated_sprite_url(sprites):
+    """PokeAPI sprites에서 애니메이션 GIF URL을 찾습니다. 없으면 None."""
+    for path in ANIMATED_SPRITE_PATHS:
+        url = _sprite_at(sprites, path)
+        if url:
+            return url
+    return None
+
+
+def sprite_candidates(sprites, target_px=None):
+    """
+    다운로드를 시도할 (픽셀, URL) 목록을 만듭니다.
+    target_px를 덮는 가장 작은 변형부터 큰 순서로 시도하고, 모두 없으면 덮지 못하는 변형 중 큰 것부터 씁니다.
+    미러 모드에서 가장 작은 변형도 target_px의 2배 이상이면, 미러가 원하는 크기로 줄여 주는 변형(?w=)을 먼저 시도합니다.
+    """
+    target_px = target_px or DEFAULT_SPRITE_PX
+    available = []
+    for size, path in SPRITE_VARIANTS:
+        url = _sprite_at(sprites, path)
+        if url:
+            available.append((size, url))
+
+    covering = [item for item in available if item[0] >= target_px]
+    smaller = [item for item in reversed(available) if item[0] < target_px]
+    candidates = covering + smaller
+    if covering and covering[0][0] >= 2 * target_px:
+        scaled_url = pokeapi_client.scaled_sprite_url(covering[0][1], target_px)
+        if scaled_url:
+            candidates.insert(0, (target_px, scaled_url))
+    return candidates
+
+
+class PokemonDataService:
+    """PokeAPI에서 포켓몬 이미지/이름/진화 정보를 가져옵니다. 모든 메서드는 워커 스레드에서 호출할 수 있습니다."""
+
+    def __init__(self, executor=None):
+        self.executor = executor
+        self.animated_urls = {}  # 포켓몬 ID -> 애니메이션 GIF URL (fetch_pokemon 때 기록)
+
+    def fetch_pokemon(self, pokemon_id, target_px=None):
+        """
+        포켓몬 데이터와 이미지를 가져와 (이미지 객체, 이름, ID) 튜플을 반환합니다. 실패 시 None.
+        target_px(표시할 긴 변 픽셀)를 주면 그 크기를 덮는 가장 작은 스프라이트를 받습니다.
+        """
+        # 💡 전체 소요 시간(데이터 + 종 + 이미지)을 하나의 항목으로 계측합니다.
+        start = time.perf_counter()
+        result = self._download_pokemon(pokemon_id, target_px)
+        METRICS.record("fetch_pokemon_data", "ok" if result else "error", (time.perf_counter() - start) * 1000)
+        return result
+
+    def _download_pokemon(self, pokemon_id, target_px=None):
+        """포켓몬/종 데이터와 이미지를 순서대로 다운로드합니다."""
+        pokemon_url = pokeapi_client.api_url(f"pokemon/{pokemon_id}/")
+
+        try:
+            # 1. 기본 포켓몬 데이터 가져오기 (이미지 URL 포함)
+            response = pokeapi_client.get(pokemon_url, timeout=10)
+            response.raise_for_status()
+            data = response.json()
+
+            # 2. 종(species) 데이터 가져오기 (한글 이름 포함)
+            species_url = data['species']['url']
+            species_response = pokeapi_client.get(species_url, timeout=10)
+            species_response.raise_for_status()
+            species_data = species_response.json()
+
+            # 3. 한글 이름 추출
+            korean_name = next(
+                (name_info['name'] for name_info in species_data['names'] if name_info['language']['name'] == 'ko'),
+                data['name'].capitalize()
+            )
+
+            # 4. 표시 크기를 덮는 가장 작은 스프라이트 변형 선택 (애니메이션 URL은 나중을 위해 기록)
+            self.animated_urls[pokemon_id] = animated_sprite_url(data['sprites'])
+            candidates = sprite_candidates(data['sprites'], target_px)
+            if not candidates:
+                print(f"포켓몬 이미지 URL을 찾을 수 없습니다. (ID: {pokemon_id})")
+                return None
+
+            # 5. 이미지 다운로드 (변형이 없으면(4xx) 다음 후보로)
+            image_response = self._download_sprite(candidates)
+            if image_response is None:
+                print(f"포켓몬 이미지를 받을 수 없습니다. (ID: {pokemon_id})")
+                return None
+
+            # 6. PIL Image 객체 생성 및 RGBA로 변환 (투명도 유지)
+            pil_image = Image.open(BytesIO(image_response.content)).convert("RGBA")
+
+            return (pil_image, korean_name, pokemon_id)
+
+        except requests.exceptions.RequestException as e:
+            print(f"포켓몬 데이터 로드 오류 (ID: {pokemon_id}): {e}")
+            return None
+        except Exception as e:
+            print(f"포켓몬 데이터 처리 중 예상치 못한 오류 발생 (ID: {pokemon_id}): {e}")
+            return None
+
+    def _download_sprite(self, candidates):
+        """후보를 차례로 요청해 처음 성공한 응답을 반환합니다. 4xx가 아닌 오류는 그대로 전달합니다."""
+        for size, url in candidates:
+            # 💡 대체 호스트가 설정되어 있으면 느린 응답에 대비해 헤지 요청을 보냅니다.
+            response = pokeapi_client.get_hedged(url, timeout=10, endpoint="sprite")
+            if 400 <= response.status_code < 500:
+                print(f"스프라이트 변형 없음 ({size}px, HTTP {response.status_code}), 다음 후보 시도")
+                continue
+            response.raise_for_status()
+            return response
+        return None
+
+    def fetch_animated_sprite(self, pokemon_id):
+        """포켓몬의 애니메이션 GIF 바이트를 반환합니다. 애니메이션 변형이 없거나 실패하면 None."""
+        try:
+            if pokemon_id not in self.animated_urls:
+                response = pokeapi_client.get(pokeapi_client.api_url(f"pokemon/{pokemon_id}/"), timeout=10)
+                response.raise_for_status()
+                self.animated_urls[pokemon_id] = animated_sprite_url(response.json()['sprites'])
+            url = self.animated_urls[pokemon_id]
+            if not url:
+                return None
+            response = pokeapi_client.get_hedged(url, timeout=10, endpoint="sprite")
+            response.raise_for_status()
+            return response.content
+        except requests.exceptions.RequestException as e:
+            print(f"애니메이션 스프라이트 로드 오류 (ID: {pokemon_id}): {e}")
+            return None
+
+    def fetch_many(self, pokemon_ids):
+        """여러 포켓몬을 한 번에 가져옵니다. {ID: fetch_pokemon 결과} 딕셔너리를 반환합니다."""
+        pokemon_ids = list(pokemon_ids)
+        if self.executor is None:
+            results = map(self.fetch_pokemon, pokemon_ids)
+        else:
+            results = self.executor.map(self.fetch_pokemon, pokemon_ids)
+        return dict(zip(pokemon_ids, results))
+
+    def fetch_evolution_chain_url(self, pokemon_id):
+        """포켓몬 종(species) 정보에서 진화 체인 URL을 가져옵니다. 실패 시 None."""
+        try:
+            species_url = pokeapi_client.api_url(f"pokemon-species/{pokemon_id}")
+            response = pokeapi_client.get(species_url, timeout=5)
+            response.raise_for_status()
+            data = response.json()
+
+            # 진화 체인 URL 추출
+            return data.get('evolution_chain', {}).get('url')
+
+        except requests.exceptions.RequestException as e:
+            print(f"진화 종 URL 로드 오류: {e}")
+            return None # 실패 시 None 반환
+
+    def parse_evolution_chain(self, url):
+        """진화 체인 URL에서 {포켓몬 ID: [다음 진화 ID 목록]} 맵을 파싱합니다."""
+        try:
+            response = pokeapi_client.get(url, timeout=10)
+            response.raise_for_status()
+            chain_data = response.json()['chain']
+
+            evolution_map = {}
+
+            def extract_chain(chain):
+                current_id = int(chain['species']['url'].split('/')[-2])
+                next_evolutions = []
+
+                for evo in chain['evolves_to']:
+                    next_id = int(evo['species']['url'].split('/')[-2])
+                    next_evolutions.append(next_id)
+                    extract_chain(evo) # 재귀적으로 다음 단계 처리
+
+                if next_evolutions:
+                    evolution_map[current_id] = next_evolutions
+
+            extract_chain(chain_data)
+            return evolution_map
+        except requests.exceptions.RequestException as e:
+            print(f"진화 체인 로드 오류 (URL: {url}): {e}")
+            return {}
+
+    def fetch_evolution_map(self, pokemon_id):
+        """포켓몬이 속한 진화 체인의 진화 맵을 반환합니다. 진화 체인이 없으면 빈 딕셔너리."""
+        chain_url = self.fetch_evolution_chain_url(pokemon_id)
+        if not chain_url:
+            return {}
+        return self.parse_evolution_chain(chain_url)
+
+    @staticmethod
+    def load_base_list(cache_file=CACHE_FILE):
+        """미진화체 ID 캐시 파일을 읽어 목록을 반환합니다."""
+        if not os.path.exists(cache_file):
+            print("캐시 파일이 존재하지 않아 미진화체 목록 로드 실패. (generate_cache.py 확인 필요)")
+            return []
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"캐시 파일 로드 중 오류 발생: {e}")
+            return []
+
+        if isinstance(data, dict):
+            base_list = data.get("base_ids", [])
+        elif isinstance(data, list):
+            base_list = data
+        else:
+            print("경고: 캐시 파일 내용이 딕셔너리 또는 리스트가 아닙니다.")
+            base_list = []
+        print(f"[{cache_file}] 동기 로드 완료. 미진화체 {len(base_list)}종.")
+        return base_list
+
+
+# -----------------------------------------------------------
+# 사용자 프로필 저장소
+# -----------------------------------------------------------
+def file_signature(path):
+    """파일 서명 (아이노드, 수정 시각 ns, 크기). 파일이 없으면 None."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class ProfileRepository:
+    """
+    user_data/<이름>.json 파일을 읽고 씁니다. 오류는 호출한 쪽에서 처리합니다.
+    signatures에는 마지막으로 읽거나 쓴 시점의 파일 서명을 남겨, 다른 인스턴스의 변경을 stat 한 번으로 알아챕니다.
+    """
+
+    def __init__(self, data_dir=USER_DATA_DIR):
+        self.data_dir = data_dir
+        self.signatures = {}  # 사용자 이름 -> 마지막으로 읽거나 쓴 파일 서명
+
+    def path_for(self, username):
+        """사용자 데이터 파일 경로를 반환합니다."""
+        if not os.path.exists(self.data_dir):
+            os.makedirs(self.data_dir)
+        return os.path.join(self.data_dir, f"{username}{DATA_FILE_EXT}")
+
+    def load(self, username):
+        """저장된 프로필 딕셔너리를 반환합니다. 파일이 없으면 None."""
+        filepath = self.path_for(username)
+        if not os.path.exists(filepath):
+            return None
+        # 서명은 읽기 전에 남깁니다. (읽는 도중 바뀌면 다음 확인 때 다시 읽음)
+        self.signatures[username] = self.signature(username)
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, username, data):
+        """프로필을 임시 파일에 쓴 뒤 바꿔 넣습니다. (잠금은 호출한 쪽에서 lock()으로)"""
+        replace_file(self.path_for(username), json.dumps(data, indent=4))
+        self.signatures[username] = self.signature(username)
+
+    def signature(self, username):
+        """파일 서명 (아이노드, 수정 시각 ns, 크기). 파일이 없으면 None."""
+        return file_signature(self.path_for(username))
+
+    def remember_last_user(self, username):
+        os.makedirs(self.data_dir, exist_ok=True)
+        replace_file(os.path.join(self.data_dir, LAST_USER_FILE), username)
+
+    def last_user(self):
+        """마지막으로 로그인한 사용자 이름. 기록이 없으면 None."""
+        try:
+            with open(os.path.join(self.data_dir, LAST_USER_FILE), 'r', encoding='utf-8') as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def lock(self, username, shared=False):
+        """프로필 파일 잠금 (with 문). 읽고-병합하고-쓰는 동안 다른 인스턴스가 끼어들지 않게 합니다."""
+        return FileLock(self.path_for(username), shared=shared)
+
+    # ------------------- 완료 태스크 보관함 -------------------
+    # user_data/<이름>_archive/00001.jsonl, 00002.jsonl ... 한 줄에 태스크 하나.
+    # 로그인 시에는 읽지 않고, 기록 화면에서 최신 세그먼트부터 한 개씩 읽습니다.
+
+    def archive_dir(self, username):
+        return os.path.join(self.data_dir, f"{username}{ARCHIVE_DIR_SUFFIX}")
+
+    def archive_segments(self, username):
+        """보관함 세그먼트 경로를 최신 순으로 반환합니다."""
+        archive_dir = self.archive_dir(username)
+        if not os.path.isdir(archive_dir):
+            return []
+        names = sorted(name for name in os.listdir(archive_dir) if name.endswith(".jsonl"))
+        return [os.path.join(archive_dir, name) for name in reversed(names)]
+
+    def recent_archived_ids(self, username, count):
+        """최신 세그먼트부터 count개 이상의 기록을 읽어 보관된 태스크 id 집합을 반환합니다."""
+        ids, seen = set(), 0
+        for path in self.archive_segments(username):
+            records = self.read_archive_segment(path)
+            ids.update(data.get("id") for data in records)
+            seen += len(records)
+            if seen >= count:
+                break
+        return ids
+
+    def append_archive(self, username, task_dicts):
+        """
+        태스크들을 마지막 세그먼트에 이어 쓰고, 가득 차면 새 세그먼트를 만듭니다. 실제로 쓴 개수를 반환합니다.
+        💡 최근에 보관된 id는 건너뜁니다. 다른 인스턴스가 같은 태스크를 먼저 보관했거나,
+        이전 실행이 보관함에 쓴 뒤 프로필을 저장하지 못했어도 같은 기록이 두 번 들어가지 않습니다.
+        """
+        pending = list(task_dicts)
+        archived = self.recent_archived_ids(username, len(pending))
+        pending = [data for data in pending if data.get("id") not in archived]
+        if not pending:
+            return 0
+        written = len(pending)
+
+        archive_dir = self.archive_dir(username)
+        os.makedirs(archive_dir, exist_ok=True)
+        segments = self.archive_segments(username)
+        index = len(segments) or 1
+        count = len(self.read_archive_segment(segments[0])) if segments else 0
+
+        while pending:
+            if count >= ARCHIVE_SEGMENT_SIZE:
+                index, count = index + 1, 0
+            chunk, pending = pending[:ARCHIVE_SEGMENT_SIZE - count], pending[ARCHIVE_SEGMENT_SIZE - count:]
+            with open(os.path.join(archive_dir, f"{index:05d}.jsonl"), 'a', encoding='utf-8') as f:
+                for data in chunk:
+                    f.write(json.dumps(data, ensure_ascii=False) + "\n")
+            count += len(chunk)
+        return written
+
+    @staticmethod
+    def read_archive_segment(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+
+# -----------------------------------------------------------
+# 코어 (태스크 + 경험치 + 현재 포켓몬)
+# -----------------------------------------------------------
+class EvolutionOutcome:
+    """경험치 획득으로 포켓몬이 바뀐 결과입니다. kind: "evolve" | "reroll" | "fallback"."""
+
+    def __init__(self, kind, previous_id, previous_name, new_id):
+        self.kind = kind
+        self.previous_id = previous_id
+        self.previous_name = previous_name
+        self.new_id = new_id
+
+
+def _xp_state(profile):
+    return profile.get("xp", 0), profile.get("level", 1), profile.get("current_pokemon_id")
+
+
+class TodomonCore:
+    """
+    한 사용자의 태스크, 경험치, 현재 포켓몬 상태를 UI 없이 관리합니다.
+    상태가 바뀌면 events(EventBus)에 도메인 이벤트를 발행하고, 화면/저장은 구독자가 처리합니다.
+    """
+
+    def __init__(self, pokemon_service=None, repository=None, rng=None, events=None):
+        self.pokemon_service = pokemon_service or PokemonDataService()
+        self.repository = repository or ProfileRepository()
+        self.rng = rng or random.Random()
+        self.events = events or EventBus()
+
+        self.tasks = TaskStore()
+        self.xp = XpEngine()
+        self.username = None
+
+        self.base_list = []
+        self.current_pokemon_id = 1
+        self.current_pokemon_name = "미정"
+        self.evolution_map = {}  # {포켓몬 ID: [다음 진화 ID 목록]} (현재 포켓몬의 진화 체인)
+
+        # 💡 여러 인스턴스 병합용: 마지막으로 파일과 맞춘 프로필(3-way 병합의 기준)과
+        # 그 뒤 이 인스턴스에서 얻은(아직 파일에 없는) 경험치
+        self._synced = None
+        self._synced_signature = None
+        self.pending_xp = 0
+
+    def reset(self):
+        """로그아웃 시 사용자 상태를 초기화합니다. (미진화체 목록은 유지)"""
+        self.tasks.clear()
+        self.xp = XpEngine()
+        self.username = None
+        self.current_pokemon_id = 1
+        self.current_pokemon_name = "미정"
+        self.evolution_map = {}
+        self._synced = self._synced_signature = None
+        self.pending_xp = 0
+        self.events.discard_pending()  # 이전 사용자의 미전달 이벤트는 버림
+        self.events.publish(ProfileChanged(None))
+
+    # ------------------- 프로필 저장/로드 -------------------
+
+    def apply_profile(self, data):
+        """로드된 프로필 딕셔너리를 상태에 적용합니다. 빈 딕셔너리는 새 사용자입니다."""
+        self.xp.load(data.get("xp", 0), data.get("level", 1))
+
+        if "current_pokemon_id" in data:
+            self.current_pokemon_id = data["current_pokemon_id"]
+        else:
+            self.current_pokemon_id = self.rng.choice(self.base_list) if self.base_list else 1
+        self.current_pokemon_name = "미정"
+        self.evolution_map = {}
+
+        self.tasks.load_list(data.get("tasks", []))
+        self._synced = data or None
+        self._synced_signature = self.repository.signatures.get(self.username) if data else None
+        self.pending_xp = 0
+        self.events.publish(ProfileChanged(self.username))
+
+    def to_profile(self):
+        return {
+            "xp": self.xp.current_xp,
+            "level": self.xp.evolution_stage,
+            "current_pokemon_id": self.current_pokemon_id,
+            "tasks": self.tasks.to_list(),
+        }
+
+    def load(self, username):
+        """사용자 프로필을 읽어 적용합니다. 파일이 없으면 False를 반환하고 상태를 바꾸지 않습니다."""
+        data = self.repository.load(username)
+        if data is None:
+            return False
+        self.login(username, data)
+        return True
+
+    def login(self, username, data):
+        """
+        읽어 둔 프로필을 적용하고 오래된 완료 태스크를 보관합니다. (로그인 경로는 모두 여기를 거침)
+        보관 중 OSError는 호출한 쪽에서 처리하며, 그래도 프로필은 이미 적용된 상태입니다.
+        """
+        self.username = username
+        self.apply_profile(data)
+        self.archive_completed()
+
+    def archive_completed(self, today=None):
+        """
+        오래된 완료 태스크를 보관함 세그먼트로 옮기고 프로필을 저장합니다. 옮긴 개수를 반환합니다.
+        보관함 쓰기와 프로필 저장을 한 번의 잠금 안에서 합니다. 보관함에 먼저 쓰므로 중간에 실패해도
+        태스크가 사라지지 않고, 다시 보관할 때는 이미 보관된 id를 건너뜁니다.
+        """
+        archivable = [task for task in self.tasks if task.is_archivable(today)]
+        if not archivable:
+            return 0
+        with self.repository.lock(self.username):
+            self.repository.append_archive(self.username, [task.to_dict() for task in archivable])
+            self.tasks.remove_many([task.id for task in archivable])
+            self._save_locked()
+        return len(archivable)
+
+    def iter_archive_pages(self):
+        """기록 화면용: 보관함을 최신 세그먼트부터 한 페이지(세그먼트)씩, 최신 태스크가 앞에 오도록 돌려줍니다."""
+        for path in self.repository.archive_segments(self.username):
+            yield [Task.from_dict(data) for data in reversed(self.repository.read_archive_segment(path))]
+
+    def save(self):
+        """
+        프로필 잠금을 잡고 저장합니다. 마지막 동기화 뒤 다른 인스턴스가 파일을 바꿨으면 먼저 병합하고,
+        내용이 파일과 같으면 쓰지 않습니다.
+        """
+        with self.repository.lock(self.username):
+            self._save_locked()
+
+    def _save_locked(self):
+        """(프로필 잠금 안에서) 병합 후 저장합니다."""
+        if self.repository.signature(self.username) != self._synced_signature:
+            disk = self.repository.load(self.username)
+            if disk is not None:
+                self._merge_external(disk)
+        profile = self.to_profile()
+        if profile != self._synced:
+            self.repository.save(self.username, profile)
+        self._synced = profile
+        self._synced_signature = self.repository.signature(self.username)
+        self.pending_xp = 0
+
+    # ------------------- 여러 인스턴스 동기화 -------------------
+
+    def sync_external(self):
+        """
+        다른 인스턴스(또는 동기화 도구)가 프로필 파일을 바꿨으면 바뀐 레코드만 반영합니다.
+        파일 서명(stat)만 비교하므로 자주 불러도 됩니다. 반영했으면 True를 반환합니다.
+        """
+        if self.username is None or self.repository.signature(self.username) == self._synced_signature:
+            return False
+        with self.repository.lock(self.username, shared=True):
+            disk = self.repository.load(self.username)
+            signature = self.repository.signatures.get(self.username)
+        self._synced_signature = signature
+        if disk is None or disk == self._synced:
+            return False
+        self._merge_external(disk)
+        return True
+
+    def _merge_external(self, disk):
+        """
+        파일의 프로필(disk)을 마지막 동기화 상태(_synced)와 비교해 바뀐 레코드만 현재 상태에 반영합니다.
+        - 태스크 (id 기준): 양쪽에서 추가한 태스크는 모두 남기고(합집합), 한쪽에서 삭제한 태스크는 삭제합니다.
+          양쪽에서 바뀐 태스크는 이 인스턴스에서 완료했으면 그대로 두고, 그 외에는 파일 쪽을 따릅니다.
+        - 경험치: 파일의 경험치/진화 단계/포켓몬을 기준으로 삼고, 이 인스턴스가 아직 저장하지 않은
+          경험치(pending_xp)를 다시 더합니다. (같은 태스크를 양쪽에서 완료했으면 한 번만 셈)
+        """
+        base = self._synced or {}
+        base_tasks = {data.get("id"): data for data in base.get("tasks", [])}
+        added, completed, reset, updated = [], [], [], []
+        for data in disk.get("tasks", []):
+            task_id = data.get("id")
+            before = base_tasks.pop(task_id, None)
+            if before == data:
+                continue
+            local = self.tasks.get(task_id) if task_id else None
+            if before is None:
+                if local is None:
+                    added.append(Task.from_dict(data))
+                continue
+            if local is None:
+                continue  # 이 인스턴스에서 삭제함 (삭제 우선)
+            if local.to_dict() != before and local.is_completed:
+                if data.get("completed") and not before.get("completed"):
+                    self.pending_xp = max(0, self.pending_xp - XP_PER_TASK)
+                continue
+            was_completed = local.is_completed
+            self.tasks.update_from_dict(task_id, data)
+            if local.is_completed == was_completed:
+                updated.append(local)
+            else:
+                (completed if local.is_completed else reset).append(local)
+        removed = self.tasks.remove_many([task_id for task_id in base_tasks if task_id])
+
+        if added:
+            self.tasks.add_many(added)
+            self.events.publish(TasksAdded(added))
+        for event_type, tasks in ((TasksCompleted, completed), (TasksReset, reset),
+                                  (TasksUpdated, updated), (TasksRemoved, removed)):
+            if tasks:
+                self.events.publish(event_type(tasks))
+
+        if _xp_state(disk) != _xp_state(base):
+            previous_id = self.current_pokemon_id
+            self.xp.load(disk.get("xp", 0), disk.get("level", 1))
+            self.current_pokemon_id = disk.get("current_pokemon_id", previous_id)
+            if self.current_pokemon_id != previous_id:
+                self.current_pokemon_name = "미정"
+                self.evolution_map = {}
+            pending, self.pending_xp = self.pending_xp, 0
+            if pending:
+                self.gain_xp_batch((pending,))  # 단계를 넘으면 파일의 포켓몬에서 진화 (XpChanged 발행)
+            else:
+                self.events.publish(XpChanged(0, []))
+            if self.current_pokemon_id != previous_id:
+                self.events.publish(PokemonChanged(previous_id, self.current_pokemon_id))
+
+        self._synced = disk
+
+    # ------------------- 태스크 -------------------
+
+    def add_task(self, name, is_recurring=False, due_date=""):
+        task = self.tasks.add(Task(name, is_recurring=is_recurring, due_date=due_date))
+        self.events.publish(TasksAdded([task]))
+        return task
+
+    def add_tasks(self, tasks):
+        """검증된 Task 목록(가져오기 등)을 한 번에 추가합니다."""
+        tasks = list(tasks)
+        self.tasks.add_many(tasks)
+        self.events.publish(TasksAdded(tasks))
+
+    def complete_task(self, task_id):
+        """태스크를 완료 처리하고 XP_PER_TASK 만큼 경험치를 줍니다. 포켓몬이 바뀐 내역(EvolutionOutcome 목록)을 반환합니다."""
+        task = self.tasks.set_completed(task_id, True)
+        self.events.publish(TasksCompleted([task]))
+        return self.gain_xp(XP_PER_TASK)
+
+    def complete_tasks(self, task_ids):
+        """
+        여러 태스크를 한 번에 완료 처리합니다. 이미 완료된 태스크는 건너뜁니다.
+        경험치는 한 번의 배치로 적용되며 (새로 완료된 Task 목록, EvolutionOutcome 목록)을 반환합니다.
+        """
+        completed = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task is not None and not task.is_completed:
+                self.tasks.set_completed(task_id, True)
+                completed.append(task)
+        if completed:
+            self.events.publish(TasksCompleted(completed))
+        outcomes = self.gain_xp_batch([XP_PER_TASK] * len(completed)) if completed else []
+        return completed, outcomes
+
+    def remove_tasks(self, task_ids):
+        """선택한 태스크들을 한 번에 삭제하고, 삭제된 Task 목록을 반환합니다."""
+        removed = self.tasks.remove_many(task_ids)
+        if removed:
+            self.events.publish(TasksRemoved(removed))
+        return removed
+
+    def clear_completed(self):
+        """완료된 태스크를 정리합니다. 매일 반복 태스크는 다음 날 다시 사용하므로 남겨 둡니다."""
+        return self.remove_tasks(
+            [task.id for task in self.tasks if task.is_completed and not task.is_recurring]
+        )
+
+    def reset_tasks(self, task_ids):
+        """반복 태스크들의 완료 상태를 해제하고, 해제된 Task 목록을 반환합니다."""
+        reset = [task for task in map(self.tasks.get, task_ids) if task is not None and task.is_completed]
+        for task in reset:
+            self.tasks.set_completed(task.id, False)
+        if reset:
+            self.events.publish(TasksReset(reset))
+        return reset
+
+    def reset_task(self, task_id):
+        """반복 태스크의 완료 상태를 해제합니다."""
+        reset = self.reset_tasks([task_id])
+        return reset[0] if reset else None
+
+    # ------------------- 경험치 / 진화 -------------------
+
+    def gain_xp(self, amount):
+        """경험치를 더하고, 포켓몬이 바뀐 내역(EvolutionOutcome 목록)을 반환합니다."""
+        return self.gain_xp_batch((amount,))
+
+    def gain_xp_batch(self, amounts):
+        """
+        여러 경험치 이벤트(일괄 완료, 가져오기 등)를 한 번에 적용합니다.
+        넘어선 단계 수만큼 진화/재선택을 차례로 결정해 EvolutionOutcome 목록으로 반환합니다.
+        (저장과 화면 갱신은 호출하는 쪽에서 한 번만 하면 됩니다.)
+        """
+        levels = self.xp.gain_batch(amounts)
+        self.pending_xp += sum(amounts)
+        outcomes = []
+        for _ in range(levels):
+            previous_id, previous_name = self.current_pokemon_id, self.current_pokemon_name
+            # 💡 진화 맵은 현재 체인만 담고 있으므로, 재선택된 포켓몬은 다음 단계에서도 재선택됩니다.
+            next_evolutions = self.evolution_map.get(previous_id, [])
+            if next_evolutions:
+                outcome = EvolutionOutcome("evolve", previous_id, previous_name, next_evolutions[0])
+            elif self.base_list:
+                outcome = EvolutionOutcome("reroll", previous_id, previous_name, self.rng.choice(self.base_list))
+            else:
+                outcome = EvolutionOutcome("fallback", previous_id, previous_name, 1) # 오류 시 기본값 1번
+            self.current_pokemon_id = outcome.new_id
+            self.current_pokemon_name = "미정"
+            outcomes.append(outcome)
+        self.events.publish(XpChanged(sum(amounts), outcomes))
+        return outcomes
+
+    def set_pokemon_info(self, pokemon_id, name):
+        if pokemon_id == self.current_pokemon_id:
+            self.current_pokemon_name = name
+            self.events.publish(PokemonLoaded(pokemon_id, name))
+
+    def set_evolution_map(self, pokemon_id, evolution_map):
+        if pokemon_id == self.current_pokemon_id:
+            self.evolution_map = evolution_map
+            self.events.publish(EvolutionMapLoaded(pokemon_id, evolution_map))
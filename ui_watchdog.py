@@ -0,0 +1,147 @@
+import collections
+import os
+import sys
+import threading
+import time
+import traceback
+
+from net_metrics import LatencyHistogram
+
+# ----------------------------------------------------
+# 💡 Tk 이벤트 루프 지연 감지기 / 샘플링 프로파일러
+# ----------------------------------------------------
+# StallWatchdog: 메인 루프에 일정 간격으로 하트비트(after)를 예약하고,
+#   예정 시각보다 늦게 실행된 만큼을 지연(lag)으로 기록합니다. 별도 감시 스레드는
+#   하트비트가 예산(budget_ms)보다 오래 멈추면 메인 스레드의 스택을 캡처합니다.
+# SamplingProfiler: 메인 스레드의 스택을 주기적으로 샘플링해
+#   flamegraph.pl / speedscope 에서 읽을 수 있는 collapsed stack 형식으로 저장합니다.
+
+MAX_STALL_REPORTS = 50
+
+
+def _frame_label(frame):
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+class StallWatchdog:
+    """메인 루프 지연을 측정하고, 예산을 넘긴 프레임의 메인 스레드 스택을 기록합니다."""
+
+    def __init__(self, root, interval_ms=50, budget_ms=200):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.budget_ms = budget_ms
+        self.main_thread_id = threading.get_ident()
+
+        self.lag_histogram = LatencyHistogram()
+        self.stalls = collections.deque(maxlen=MAX_STALL_REPORTS)
+
+        self._lock = threading.Lock()
+        self._last_beat = time.perf_counter()
+        self._current_stall = None  # 진행 중인 지연에 대한 보고서 (스택은 한 번만 캡처)
+        self._after_id = None
+        self._running = False
+
+    def start(self):
+        if self._running:
+            return
+        self._running = True
+        self._last_beat = time.perf_counter()
+        self._after_id = self.root.after(self.interval_ms, self._beat)
+        threading.Thread(target=self._monitor, name="todomon-stall-watchdog", daemon=True).start()
+
+    def stop(self):
+        self._running = False
+        if self._after_id:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _beat(self):
+        """(메인 스레드) 하트비트. 예정보다 늦은 만큼을 지연으로 기록합니다."""
+        now = time.perf_counter()
+        with self._lock:
+            lag_ms = max(0.0, (now - self._last_beat) * 1000 - self.interval_ms)
+            self.lag_histogram.add(lag_ms)
+            if self._current_stall is not None:
+                self._current_stall["duration_ms"] = round(lag_ms + self.interval_ms, 1)
+                self._current_stall = None
+            self._last_beat = now
+        if self._running:
+            self._after_id = self.root.after(self.interval_ms, self._beat)
+
+    def _monitor(self):
+        """(감시 스레드) 하트비트가 budget_ms 이상 멈추면 메인 스레드 스택을 캡처합니다."""
+        poll_seconds = self.interval_ms / 2000
+        while self._running:
+            time.sleep(poll_seconds)
+            with self._lock:
+                blocked_ms = (time.perf_counter() - self._last_beat) * 1000 - self.interval_ms
+                if blocked_ms < self.budget_ms or self._current_stall is not None:
+                    continue
+                frame = sys._current_frames().get(self.main_thread_id)
+                stack = traceback.format_stack(frame) if frame else []
+                self._current_stall = {
+                    "ts": time.time(),
+                    "duration_ms": round(blocked_ms, 1),  # 하트비트 재개 시 최종 값으로 갱신
+                    "stack": stack,
+                }
+                self.stalls.append(self._current_stall)
+            print(f"[watchdog] 메인 루프가 {blocked_ms:.0f}ms 이상 멈췄습니다.\n{''.join(stack[-4:])}")
+
+    def format_summary(self):
+        """디버그 패널에 표시할 텍스트 요약을 만듭니다."""
+        with self._lock:
+            lines = [
+                f"lag p50={self.lag_histogram.percentile(50):.1f}ms "
+                f"p99={self.lag_histogram.percentile(99):.1f}ms "
+                f"max={self.lag_histogram.max_ms:.1f}ms  (예산 {self.budget_ms}ms 초과 {len(self.stalls)}회)"
+            ]
+            for stall in list(self.stalls)[-3:]:
+                stamp = time.strftime("%H:%M:%S", time.localtime(stall["ts"]))
+                lines.append(f"- {stamp} {stall['duration_ms']}ms")
+                lines.extend("    " + line.strip().splitlines()[0] for line in stall["stack"][-3:])
+        return "\n".join(lines)
+
+
+class SamplingProfiler:
+    """대상 스레드의 스택을 interval_ms 간격으로 샘플링해 collapsed stack 횟수를 모읍니다."""
+
+    def __init__(self, thread_id=None, interval_ms=5):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval_ms = interval_ms
+        self.samples = collections.Counter()
+        self.is_running = False
+        self._thread = None
+
+    def start(self):
+        if self.is_running:
+            return
+        self.samples.clear()
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name="todomon-sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.is_running = False
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        interval = self.interval_ms / 1000
+        while self.is_running:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                labels = []
+                while frame is not None:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                self.samples[";".join(reversed(labels))] += 1
+            time.sleep(interval)
+
+    def dump(self, path):
+        """flamegraph.pl 호환 collapsed stack 형식("a;b;c 횟수")으로 저장합니다."""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.samples.most_common():
+                f.write(f"{stack} {count}\n")
+        return sum(self.samples.values())
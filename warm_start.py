@@ -0,0 +1,130 @@
+import json
+
+import image_pipeline
+from todomon_core import file_signature
+
+# ----------------------------------------------------
+# 💡 웜 스타트: 로그인 창이 떠 있는 동안 마지막 사용자를 미리 준비
+# ----------------------------------------------------
+# 1. (워커) 마지막 사용자의 프로필 파일을 읽습니다.
+# 2. (메인) 프로필의 현재 포켓몬 ID로 표시용 이미지와 진화 맵 다운로드를 워커에 맡깁니다.
+#    이 요청들이 스레드별 Keep-Alive 연결을 열어 두므로 로그인 뒤의 API 요청은 연결 설정 없이 나갑니다.
+#    받은 이미지는 앱의 미리 받기 Future(prefetch_futures)로 등록되어 스프라이트 캐시에 들어갑니다.
+# 3. 같은 사용자가 로그인하면 읽어 둔 프로필을 그대로 쓰고, 포켓몬은 캐시(또는 진행 중인 Future)에서 이어받습니다.
+#    다른 사용자가 로그인하면 아직 시작하지 않은 작업만 취소하고 프로필 데이터는 버립니다.
+#    (이미 받는 중인 이미지는 캐시 예산 안에서 끝나도록 둠)
+
+
+def _read_profile(path):
+    """
+    (워커) 프로필과 읽기 직전의 파일 서명을 함께 반환합니다. 파일이 없으면 (None, None).
+    💡 repository.load()는 공유 상태(repository.signatures)를 쓰므로 워커에서는 파일만 읽습니다.
+    서명은 take()가 메인 스레드에서 기록합니다.
+    """
+    signature = file_signature(path)
+    if signature is None:
+        return None, None
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw), signature
+
+
+class SpeculativeLogin:
+    """마지막으로 로그인한 사용자의 프로필/포켓몬을 로그인 전에 미리 준비합니다."""
+
+    def __init__(self, app):
+        self.app = app
+        self.username = None
+        self.profile_future = None
+        self.pokemon_futures = []  # [(앱의 Future 사전, 포켓몬 ID, Future)]
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, username):
+        """username의 준비를 시작합니다. 같은 사용자를 이미 준비 중이면 그대로 둡니다."""
+        if not username or username == self.username:
+            return
+        self.discard()
+        self.username = username
+        path = self.app.core.repository.path_for(username)
+        future = self.app.executor.submit(_read_profile, path)
+        self.profile_future = future
+        future.add_done_callback(lambda f: self.app.root.after(0, self._on_profile, username, f))
+
+    def _on_profile(self, username, future):
+        """(메인 스레드) 프로필을 읽었으면 현재 포켓몬의 이미지와 진화 맵을 미리 받습니다."""
+        if future is not self.profile_future or future.cancelled() or self.app.is_logged_in:
+            return  # 그사이 로그인했거나 다른 사용자로 바뀜
+        try:
+            data, _ = future.result()
+        except Exception as e:
+            print(f"[warm_start] 프로필 미리 읽기 실패 ({username}): {e}")
+            return
+        pokemon_id = (data or {}).get("current_pokemon_id")
+        if pokemon_id is None:
+            return  # 새 사용자/포켓몬 미정: 로그인 때 무작위로 고름
+
+        app = self.app
+        if (pokemon_id, app.POKEMON_IMAGE_SIZE) not in app.sprite_cache and pokemon_id not in app.prefetch_futures:
+            display_future = app.executor.submit(
+                image_pipeline.fetch_display_pokemon, app.core.pokemon_service, pokemon_id, app.POKEMON_IMAGE_SIZE
+            )
+            app.prefetch_futures[pokemon_id] = display_future
+            display_future.add_done_callback(
+                lambda f: app.root.after(0, app._store_prefetched, pokemon_id, f)
+            )
+            self.pokemon_futures.append((app.prefetch_futures, pokemon_id, display_future))
+        if pokemon_id not in app.evolution_futures:
+            evolution_future = app.executor.submit(app.core.pokemon_service.fetch_evolution_map, pokemon_id)
+            app.evolution_futures[pokemon_id] = evolution_future
+            self.pokemon_futures.append((app.evolution_futures, pokemon_id, evolution_future))
+        print(f"[warm_start] '{username}' 프로필과 포켓몬(ID: {pokemon_id})을 미리 준비합니다.")
+
+    def take(self, username):
+        """
+        로그인한 사용자가 미리 준비한 사용자와 같으면 읽어 둔 프로필 딕셔너리를 반환합니다.
+        다른 사용자이거나, 아직 읽는 중이거나, 그사이 파일이 바뀌었으면 None (호출한 쪽에서 다시 읽음).
+        미리 받는 중인 포켓몬 작업은 같은 사용자면 로그인 흐름이 이어받습니다.
+        """
+        if username != self.username:
+            if self.username is not None:
+                self.misses += 1
+            self.discard()
+            return None
+        future = self.profile_future
+        self.username = self.profile_future = None
+        self.pokemon_futures = []
+        if not future.done():
+            future.cancel()
+            self.misses += 1
+            return None
+        try:
+            data, signature = future.result()
+        except Exception:
+            data, signature = None, None
+        repository = self.app.core.repository
+        if data is None or signature != repository.signature(username):
+            self.misses += 1
+            return None
+        repository.signatures[username] = signature  # repository.load()가 남기는 것과 같은 기록
+        self.hits += 1
+        return data
+
+    def discard(self):
+        """
+        준비한 것을 버립니다. 아직 시작하지 않은 작업은 취소하고, 진행 중인 다운로드는 이어받지 않지만
+        그대로 끝나게 둡니다. (표시용 이미지는 끝나면 캐시에 들어감)
+        """
+        profile_future, pokemon_futures = self.profile_future, self.pokemon_futures
+        self.username = self.profile_future = None
+        self.pokemon_futures = []
+        if profile_future is not None:
+            profile_future.cancel()
+        for futures, pokemon_id, future in pokemon_futures:
+            future.cancel()
+            if futures.get(pokemon_id) is future:
+                del futures[pokemon_id]
+
+    def format_summary(self):
+        state = f"준비 중: {self.username}" if self.username else "대기"
+        return f"{state}  적중 {self.hits}회 / 빗나감 {self.misses}회"
@@ -0,0 +1,93 @@
+import time
+
+# ----------------------------------------------------
+# 💡 유지형(retained-mode) 경험치 바
+# ----------------------------------------------------
+# 배경/게이지 사각형을 한 번만 만들고 이후에는 coords로 크기만 바꿉니다.
+# 캔버스 너비나 표시 값(픽셀 단위)이 바뀔 때만 다시 그리며, 새 경험치까지는
+# MAX_FPS로 제한된 애니메이션으로 부드럽게 채웁니다. 캔버스 너비가 아직 없으면
+# 폴링하지 않고 <Configure> 이벤트를 기다립니다.
+
+BAR_HEIGHT = 20
+BACKGROUND_COLOR = "#ecf0f1"
+FILL_COLOR = "#2ecc71"  # Green
+MAX_FPS = 60
+ANIMATION_MS = 300  # 게이지 한 구간을 채우는 데 걸리는 시간
+
+
+class XpBar:
+    """Canvas 위의 경험치 게이지입니다. set_ratio로 목표 비율(0~1)을 지정합니다."""
+
+    def __init__(self, canvas):
+        self.canvas = canvas
+        self.background = canvas.create_rectangle(0, 0, 0, BAR_HEIGHT, fill=BACKGROUND_COLOR, outline="")
+        self.fill = canvas.create_rectangle(0, 0, 0, BAR_HEIGHT, fill=FILL_COLOR, outline="")
+
+        self.width = 0
+        self.displayed_ratio = 0.0
+        self.target_ratio = 0.0
+        self._segments = []        # 남은 애니메이션 구간 [(시작 비율, 끝 비율)]
+        self._segment_start = None
+        self._after_id = None
+        self._drawn = None         # 마지막으로 그린 (너비, 게이지 픽셀)
+
+        canvas.bind("<Configure>", self._on_configure, add="+")
+
+    def _on_configure(self, event):
+        if event.width != self.width:
+            self.width = event.width
+            self._draw()
+
+    def set_ratio(self, ratio, wrapped=False, animate=True):
+        """
+        게이지를 ratio까지 채웁니다. wrapped=True면 (단계가 넘어간 경우) 끝까지 채운 뒤 0에서 다시 채웁니다.
+        애니메이션 중에 다시 호출되면 현재 위치에서 새 목표로 이어갑니다.
+        """
+        ratio = min(1.0, max(0.0, ratio))
+        if not animate or not self.width:
+            self._stop()
+            self.displayed_ratio = self.target_ratio = ratio
+            self._draw()
+            return
+        if ratio == self.target_ratio and not wrapped:
+            return
+
+        self.target_ratio = ratio
+        if wrapped:
+            self._segments = [(self.displayed_ratio, 1.0), (0.0, ratio)]
+        else:
+            self._segments = [(self.displayed_ratio, ratio)]
+        self._segment_start = time.perf_counter()
+        if self._after_id is None:
+            self._tick()
+
+    def _stop(self):
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        self._segments = []
+
+    def _tick(self):
+        self._after_id = None
+        if not self._segments:
+            return
+        start_ratio, end_ratio = self._segments[0]
+        progress = min(1.0, (time.perf_counter() - self._segment_start) * 1000 / ANIMATION_MS)
+        eased = 1 - (1 - progress) ** 3  # ease-out cubic
+        self.displayed_ratio = start_ratio + (end_ratio - start_ratio) * eased
+        self._draw()
+
+        if progress >= 1.0:
+            self._segments.pop(0)
+            self._segment_start = time.perf_counter()
+        if self._segments:
+            self._after_id = self.canvas.after(1000 // MAX_FPS, self._tick)
+
+    def _draw(self):
+        """너비나 게이지 픽셀이 바뀐 경우에만 coords를 갱신합니다."""
+        fill_px = int(self.width * self.displayed_ratio)
+        if self._drawn == (self.width, fill_px):
+            return
+        self._drawn = (self.width, fill_px)
+        self.canvas.coords(self.background, 0, 0, self.width, BAR_HEIGHT)
+        self.canvas.coords(self.fill, 0, 0, fill_px, BAR_HEIGHT)